@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Atlas 配置预解析脚本
+
+解析配置目录下的 config*.yaml 与 sources.yaml，将解析结果缓存到数据目录的
+cache 子目录，Config 加载时直接使用缓存，跳过 YAML 解析。
+YAML 文件修改后对应的缓存自动失效（回退到 YAML），重新运行本脚本即可。
+
+使用方法:
+    # 预解析默认配置目录
+    python scripts/compile_config.py
+
+    # 指定配置目录和数据目录
+    python scripts/compile_config.py --config-dir /path/to/config --data-dir /path/to/data
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+from loguru import logger
+
+# 添加 src 目录到路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from atlas.core.config import build_config_cache
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="Atlas 配置预解析工具")
+    parser.add_argument(
+        "--config-dir",
+        type=Path,
+        default=project_root / "config",
+        help="配置目录（默认: config）"
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path(os.getenv("ATLAS_DATA_DIR", "./data")),
+        help="数据目录，需与运行时的 ATLAS_DATA_DIR 一致（默认: ./data）"
+    )
+    args = parser.parse_args()
+
+    if not args.config_dir.is_dir():
+        logger.error(f"配置目录不存在: {args.config_dir}")
+        return 1
+
+    cache_file = build_config_cache(args.config_dir, args.data_dir)
+    logger.info(f"配置预解析完成: {cache_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
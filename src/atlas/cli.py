@@ -510,7 +510,7 @@ def collect(ctx: click.Context, source: Optional[str], dry_run: bool) -> None:
             return
 
         # 创建采集配置
-        collection_config = CollectionConfig()
+        collection_config = CollectionConfig.from_env()
 
         # 创建采集器工厂
         factory = CollectorFactory()
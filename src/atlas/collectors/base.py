@@ -4,23 +4,54 @@ Atlas 数据采集器基础类
 提供数据采集的基础功能和通用接口。
 """
 
+import re
 import time
 import random
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 from pathlib import Path
 from urllib.parse import urlparse
 import requests
 import feedparser
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    LexborHTMLParser = None
+    LexborNode = None
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 from ..core.config import CollectionConfig
 from ..core.logging import get_logger
+from .feed_parser import parse_feed
 from .http_client import HTTPClient, RequestConfig, Response
 from .rate_limiter import RateLimiter, RateLimitConfig, RateLimitStrategy, AdaptiveRateLimiter
 
 
+def link_key(link: str) -> int:
+    """生成链接的去重键
+
+    去重集合只保存 64 位整数而非完整链接字符串；安装 xxhash 时使用 xxh3，
+    否则使用内置 hash（仅在进程内有效，不可持久化）。
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(link.encode('utf-8'))
+    return hash(link)
+
+
+# HTML 标签匹配（模块级预编译，clean_content 每个条目都会调用）
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
 class BaseCollector(ABC):
     """数据采集器基础类"""
 
@@ -65,6 +96,12 @@ class BaseCollector(ABC):
             'start_time': time.time()
         }
 
+        # 快速 HTML 解析（selectolax），未安装时回退到 BeautifulSoup
+        self.use_fast_parser = bool(getattr(config, 'use_fast_html_parser', False))
+        if self.use_fast_parser and not SELECTOLAX_AVAILABLE:
+            self.logger.warning("selectolax 未安装，回退到 BeautifulSoup 解析")
+            self.use_fast_parser = False
+
         # 兼容性：保留旧版 session 接口
         self.session = self.http_client.session if self.http_client.session else requests.Session()
         self._setup_session()
@@ -95,7 +132,7 @@ class BaseCollector(ABC):
             user_agent: User-Agent 字符串
         """
         self.session.headers['User-Agent'] = user_agent
-        self.logger.debug("User-Agent 已更新", user_agent=user_agent)
+        self.http_client.set_user_agent(user_agent)
 
     def get_random_user_agent(self) -> str:
         """获取随机 User-Agent
@@ -320,22 +357,43 @@ class BaseCollector(ABC):
         """
         return BeautifulSoup(html_content, parser)
 
+    def parse_html_fast(self, html_content: str) -> 'LexborHTMLParser':
+        """使用 selectolax (lexbor) 快速解析 HTML 内容
+
+        仅支持 CSS 选择器查询和文本提取，需要完整 BeautifulSoup API 时请使用 parse_html。
+
+        Args:
+            html_content: HTML 内容
+
+        Returns:
+            LexborHTMLParser 对象
+        """
+        if not SELECTOLAX_AVAILABLE:
+            raise ImportError("selectolax is required for fast HTML parsing. Install with: pip install selectolax")
+
+        return LexborHTMLParser(html_content)
+
     def parse_rss(self, rss_content: str) -> feedparser.FeedParserDict:
         """解析 RSS 内容
 
+        RSS 2.0 和 Atom 使用 lxml 快速解析，其他格式回退到 feedparser。
+
         Args:
             rss_content: RSS 内容
 
         Returns:
-            feedparser 解析结果
+            feedparser 结构的解析结果
         """
-        return feedparser.parse(rss_content)
+        feed = parse_feed(rss_content)
+        if feed is None:
+            feed = feedparser.parse(rss_content)
+        return feed
 
     def extract_text(self, element, max_length: Optional[int] = None) -> str:
         """提取元素的文本内容
 
         Args:
-            element: BeautifulSoup 元素
+            element: BeautifulSoup 或 selectolax 元素
             max_length: 最大长度限制
 
         Returns:
@@ -344,7 +402,10 @@ class BaseCollector(ABC):
         if element is None:
             return ""
 
-        text = element.get_text(strip=True)
+        if SELECTOLAX_AVAILABLE and isinstance(element, LexborNode):
+            text = element.text(strip=True)
+        else:
+            text = element.get_text(strip=True)
 
         # 清理多余的空白字符
         text = ' '.join(text.split())
@@ -369,9 +430,9 @@ class BaseCollector(ABC):
         # 移除多余的空白字符
         content = ' '.join(content.split())
 
-        # 移除 HTML 标签（如果有）
-        import re
-        content = re.sub(r'<[^>]+>', '', content)
+        # 移除 HTML 标签（如果有），不含标签时跳过正则替换
+        if '<' in content:
+            content = _TAG_RE.sub('', content)
 
         return content.strip()
 
@@ -392,6 +453,26 @@ class BaseCollector(ABC):
         length = len(content)
         return min_length <= length <= max_length
 
+    def is_duplicate_link(self, link: Optional[str], seen: Set[int]) -> bool:
+        """检查链接在本次采集中是否已出现，未出现时记录到 seen
+
+        Args:
+            link: 条目链接
+            seen: 本次采集已见过的链接去重键
+
+        Returns:
+            是否重复
+        """
+        if not link:
+            return False
+
+        key = link_key(link)
+        if key in seen:
+            return True
+
+        seen.add(key)
+        return False
+
     def standardize_item(self, item: Dict[str, Any], source_config: Dict[str, Any]) -> Dict[str, Any]:
         """标准化采集到的数据项
 
@@ -520,6 +601,7 @@ class BaseCollector(ABC):
         from datetime import datetime
         from ..core.storage import RawDocument, DocumentType
         from ..core.unified_storage import get_unified_storage
+        from ..core.operations import raw_document_params
         from ..models.documents import SourceType, ProcessingStatus
 
         # 创建输出目录（兼容文件系统存储）
@@ -546,7 +628,7 @@ class BaseCollector(ABC):
             if items_list:
                 self.logger.info(f"开始保存采集结果", items_count=len(items_list), output_dir=str(output_path))
 
-                saved_count = 0
+                pending_rows = []
 
                 # 遍历所有采集到的项目
                 for idx, item in enumerate(items_list):
@@ -584,7 +666,6 @@ class BaseCollector(ABC):
                         try:
                             import json
                             import uuid
-                            import sqlite3
                             from pathlib import Path
 
                             # 准备文档数据
@@ -633,46 +714,10 @@ class BaseCollector(ABC):
                                     json.dump(doc_data, f, ensure_ascii=False, indent=2)
                                 self.logger.debug(f"文档已保存到文件系统", file_path=str(file_path))
 
-                            # 保存到数据库
-                            db_path = Path.cwd() / "data" / "atlas.db"
-                            conn = sqlite3.connect(str(db_path))
-                            cursor = conn.cursor()
-
-                            cursor.execute('''
-                                INSERT INTO raw_documents (
-                                    id, source_id, source_url, source_type, document_type,
-                                    raw_content, raw_metadata, collected_at, collector_version,
-                                    processing_status, processing_error, processing_attempts,
-                                    content_hash, title, author, published_at, language,
-                                    created_at, updated_at
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            ''', (
-                                doc_id,
-                                document.source_id,
-                                str(document.source_url) if document.source_url else None,
-                                document.source_type.value,
-                                document.document_type.value,
-                                document.raw_content,
-                                json.dumps(document.raw_metadata, ensure_ascii=False),
-                                document.collected_at,
-                                document.collector_version,
-                                document.processing_status.value,
-                                document.processing_error,
-                                document.processing_attempts,
-                                document.content_hash,
-                                document.title,
-                                document.author,
-                                document.published_at,
-                                document.language,
-                                document.created_at,
-                                document.updated_at
-                            ))
-
-                            conn.commit()
-                            conn.close()
+                            # 数据库记录在全部项目处理完后批量写入
+                            pending_rows.append(raw_document_params(document, doc_id, ensure_ascii=False))
 
                             self.logger.debug(f"文档保存成功", doc_id=doc_id)
-                            saved_count += 1
 
                         except Exception as save_error:
                             import traceback
@@ -703,6 +748,9 @@ class BaseCollector(ABC):
                         print(f"ERROR: 详细traceback: {traceback.format_exc()}", file=sys.stderr)
                         continue
 
+                # 批量写入数据库
+                saved_count = self._save_raw_document_rows(pending_rows)
+
                 # 同时保存一个简化的JSON汇总文件
                 summary_file = output_path / f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
                 summary_data = {
@@ -754,6 +802,29 @@ class BaseCollector(ABC):
             self.logger.error(f"保存采集结果失败", output_dir=str(output_path), error=str(e))
             raise
 
+    def _save_raw_document_rows(self, rows: List[tuple]) -> int:
+        """批量写入原始文档数据库记录
+
+        通过全局数据库实例批量写入；某批失败时逐条重试，避免单条坏数据影响整批。
+
+        Args:
+            rows: raw_documents 插入参数列表
+
+        Returns:
+            写入成功的条数
+        """
+        from ..core.database import get_database
+        from ..core.operations import RAW_DOCUMENT_INSERT_SQL
+
+        if not rows:
+            return 0
+
+        try:
+            return get_database().execute_many(RAW_DOCUMENT_INSERT_SQL, rows, skip_failed_rows=True)
+        except Exception as e:
+            self.logger.error(f"写入数据库失败，文档未写入数据库", count=len(rows), error=str(e))
+            return 0
+
     def close(self) -> None:
         """关闭采集器，释放资源"""
         try:
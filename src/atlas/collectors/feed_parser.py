@@ -0,0 +1,261 @@
+"""
+Atlas RSS/Atom 快速解析器
+
+基于 lxml (libxml2) iterparse 的 RSS 2.0 / Atom 流式提取器，比 feedparser 快一个数量级。
+解析结果使用 feedparser.FeedParserDict 封装，保持与 feedparser 相同的属性访问方式；
+可能包含 HTML 的字段使用 feedparser 的清理器移除脚本、事件属性等危险标记；
+无法识别的格式（如 RSS 1.0/RDF）或清理器不可用时返回 None，由调用方回退到 feedparser。
+"""
+
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import List, Optional, Union
+
+from feedparser import FeedParserDict
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    etree = None
+
+try:
+    # feedparser 的内部清理函数，版本变化导致不可用时禁用快速解析
+    from feedparser.sanitizer import _sanitize_html
+    SANITIZER_AVAILABLE = True
+except ImportError:
+    SANITIZER_AVAILABLE = False
+    _sanitize_html = None
+
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+
+
+def _text(element) -> str:
+    """获取元素的文本内容（包含内嵌的 XHTML 子元素）"""
+    if element is None:
+        return ""
+    if len(element):
+        inner = (element.text or "") + "".join(
+            etree.tostring(child, encoding="unicode") for child in element
+        )
+        return inner.strip()
+    return (element.text or "").strip()
+
+
+def _html(element) -> str:
+    """获取可能包含 HTML 的元素内容，与 feedparser 一样清理危险标记"""
+    value = _text(element)
+    if "<" in value:
+        value = _sanitize_html(value, "utf-8", "text/html")
+    return value
+
+
+def _parse_date(value: str) -> Optional[time.struct_time]:
+    """解析 RFC 822 或 ISO 8601 时间为 UTC struct_time"""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).utctimetuple()
+
+
+def _set_date(entry: FeedParserDict, key: str, value: str) -> None:
+    """设置时间字段及其解析结果"""
+    if value:
+        entry[key] = value
+        entry[f"{key}_parsed"] = _parse_date(value)
+
+
+def _media(element) -> FeedParserDict:
+    """媒体元素属性"""
+    return FeedParserDict(element.attrib)
+
+
+def _parse_rss_item(item) -> FeedParserDict:
+    """解析 RSS 2.0 条目"""
+    entry = FeedParserDict()
+    entry["title"] = _html(item.find("title"))
+    entry["link"] = _text(item.find("link"))
+
+    description = _html(item.find("description"))
+    if description:
+        entry["summary"] = description
+
+    encoded = _html(item.find(f"{CONTENT_NS}encoded"))
+    if encoded:
+        entry["content"] = [FeedParserDict(value=encoded, type="text/html")]
+
+    _set_date(entry, "published", _text(item.find("pubDate")) or _text(item.find(f"{DC_NS}date")))
+
+    author = _text(item.find("author")) or _text(item.find(f"{DC_NS}creator"))
+    if author:
+        entry["author"] = author
+        entry["author_detail"] = FeedParserDict(name=author)
+
+    guid = _text(item.find("guid"))
+    if guid:
+        entry["id"] = guid
+
+    comments = _text(item.find("comments"))
+    if comments:
+        entry["comments"] = comments
+
+    tags = [FeedParserDict(term=_text(category)) for category in item.iterfind("category")]
+    if tags:
+        entry["tags"] = tags
+
+    media_content = [_media(media) for media in item.iterfind(f"{MEDIA_NS}content")]
+    if media_content:
+        entry["media_content"] = media_content
+    media_thumbnail = [_media(media) for media in item.iterfind(f"{MEDIA_NS}thumbnail")]
+    if media_thumbnail:
+        entry["media_thumbnail"] = media_thumbnail
+
+    return entry
+
+
+def _atom_link(element) -> str:
+    """Atom 元素的 alternate 链接"""
+    for link in element.iterfind(f"{ATOM_NS}link"):
+        if link.get("rel", "alternate") == "alternate":
+            return link.get("href", "")
+    return ""
+
+
+def _parse_atom_entry(item) -> FeedParserDict:
+    """解析 Atom 条目"""
+    entry = FeedParserDict()
+    entry["title"] = _html(item.find(f"{ATOM_NS}title"))
+    entry["link"] = _atom_link(item)
+
+    summary = _html(item.find(f"{ATOM_NS}summary"))
+    if summary:
+        entry["summary"] = summary
+
+    content = item.find(f"{ATOM_NS}content")
+    if content is not None:
+        is_html = content.get("type", "text") in ("html", "xhtml")
+        entry["content"] = [FeedParserDict(
+            value=_html(content) if is_html else _text(content),
+            type="text/html" if is_html else "text/plain"
+        )]
+
+    _set_date(entry, "published", _text(item.find(f"{ATOM_NS}published")))
+    _set_date(entry, "updated", _text(item.find(f"{ATOM_NS}updated")))
+
+    author = item.find(f"{ATOM_NS}author")
+    if author is not None:
+        entry["author_detail"] = FeedParserDict(name=_text(author.find(f"{ATOM_NS}name")))
+        email = _text(author.find(f"{ATOM_NS}email"))
+        if email:
+            entry["author_detail"]["email"] = email
+        entry["author"] = entry["author_detail"]["name"]
+
+    entry_id = _text(item.find(f"{ATOM_NS}id"))
+    if entry_id:
+        entry["id"] = entry_id
+
+    rights = _html(item.find(f"{ATOM_NS}rights"))
+    if rights:
+        entry["rights"] = rights
+
+    tags = [FeedParserDict(term=category.get("term", ""))
+            for category in item.iterfind(f"{ATOM_NS}category")]
+    if tags:
+        entry["tags"] = tags
+
+    return entry
+
+
+def parse_feed(content: Union[str, bytes]) -> Optional[FeedParserDict]:
+    """使用 lxml 流式解析 RSS 2.0 / Atom 订阅源
+
+    通过 iterparse 逐条解析条目，条目转换后立即从树中移除，
+    内存占用不随条目数量增长；根元素无法识别时立即停止读取。
+
+    Args:
+        content: 订阅源内容
+
+    Returns:
+        与 feedparser.parse 结构一致的 FeedParserDict；
+        lxml 或 HTML 清理器不可用、解析失败或格式无法识别时返回 None
+    """
+    if not LXML_AVAILABLE or not SANITIZER_AVAILABLE or not content:
+        return None
+
+    override_encoding = isinstance(content, str)
+    context = etree.iterparse(
+        BytesIO(content.encode("utf-8") if override_encoding else content),
+        events=("start", "end"),
+        recover=True,
+        huge_tree=False,
+        resolve_entities=False,
+        no_network=True,
+        encoding="utf-8" if override_encoding else None
+    )
+
+    root = None
+    entries: List[FeedParserDict] = []
+    try:
+        for event, element in context:
+            if root is None:
+                root = element
+                if root.tag == "rss":
+                    item_tag, item_parent_tag, parse_item = "item", "channel", _parse_rss_item
+                elif root.tag == f"{ATOM_NS}feed":
+                    item_tag, item_parent_tag, parse_item = f"{ATOM_NS}entry", root.tag, _parse_atom_entry
+                else:
+                    return None
+                continue
+
+            if event != "end" or element.tag != item_tag:
+                continue
+            parent = element.getparent()
+            if parent is None or parent.tag != item_parent_tag:
+                continue
+
+            entries.append(parse_item(element))
+            # 条目已转换，释放其子树
+            parent.remove(element)
+    except etree.XMLSyntaxError:
+        return None
+    if root is None:
+        return None
+
+    feed = FeedParserDict()
+    if root.tag == "rss":
+        channel = root.find("channel")
+        if channel is None:
+            return None
+        feed["title"] = _html(channel.find("title"))
+        feed["link"] = _text(channel.find("link"))
+        feed["subtitle"] = _html(channel.find("description"))
+        feed["language"] = _text(channel.find("language"))
+        version = "rss20"
+    else:
+        feed["title"] = _html(root.find(f"{ATOM_NS}title"))
+        feed["link"] = _atom_link(root)
+        feed["subtitle"] = _html(root.find(f"{ATOM_NS}subtitle"))
+        version = "atom10"
+
+    result = FeedParserDict(feed=feed, entries=entries, version=version, bozo=False)
+    if context.error_log:
+        result["bozo"] = True
+        result["bozo_exception"] = etree.XMLSyntaxError(
+            str(context.error_log[0]), None, 0, 0
+        )
+    return result
@@ -15,8 +15,15 @@ from dataclasses import dataclass, field
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+import aiohttp
 import httpx
 
+try:
+    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖 h2
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 from ..core.config import CollectionConfig
 from ..core.logging import get_logger
 
@@ -35,6 +42,9 @@ class RequestConfig:
     cache_ttl: int = 3600  # 缓存时间（秒）
     proxy: Optional[str] = None
     custom_headers: Dict[str, str] = field(default_factory=dict)
+    http2: bool = True  # 异步客户端启用 HTTP/2（需要安装 h2）
+    max_connections: int = 100  # 异步客户端连接池上限
+    max_keepalive_connections: int = 20  # 异步客户端保持活跃的连接数
 
 
 @dataclass
@@ -214,8 +224,11 @@ class HTTPClient:
         self.config = config
         self.request_config = request_config or RequestConfig()
         self.logger = get_logger()
+        self.user_agent = config.default_user_agent
         self.session = None
         self.async_client = None
+        # 设置后异步请求改经该 aiohttp 会话发送，会话由设置方负责关闭
+        self.aio_session: Optional[aiohttp.ClientSession] = None
         self.cache_manager = CacheManager()
         self.rate_limiter = RateLimiter(1.0 / self.config.rate_limit_delay)
 
@@ -250,7 +263,7 @@ class HTTPClient:
 
         # 设置默认请求头
         self.session.headers.update({
-            'User-Agent': self.config.default_user_agent,
+            'User-Agent': self.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
@@ -266,17 +279,31 @@ class HTTPClient:
             return
 
         headers = {
-            'User-Agent': self.config.default_user_agent,
+            'User-Agent': self.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
         }
         headers.update(self.request_config.custom_headers)
 
+        # 共享连接池：同一主机的请求复用连接，HTTP/2 下在单个连接上多路复用
+        limits = httpx.Limits(
+            max_connections=self.request_config.max_connections,
+            max_keepalive_connections=self.request_config.max_keepalive_connections
+        )
+        http2 = self.request_config.http2 and H2_AVAILABLE
+        if self.request_config.http2 and not H2_AVAILABLE:
+            self.logger.debug("h2 未安装，异步客户端使用 HTTP/1.1")
+
         self.async_client = httpx.AsyncClient(
+            http2=http2,
+            limits=limits,
             timeout=self.request_config.timeout,
             verify=self.request_config.verify_ssl,
             follow_redirects=self.request_config.allow_redirects,
+            max_redirects=self.request_config.max_redirects,
+            proxy=self.request_config.proxy,
+            trust_env=False,
             headers=headers
         )
 
@@ -397,8 +424,12 @@ class HTTPClient:
         return self.request('DELETE', url, **kwargs)
 
     async def arequest(self, method: str, url: str, **kwargs) -> Optional[Response]:
-        """发送异步 HTTP 请求"""
-        self._setup_async_client()
+        """发送异步 HTTP 请求
+
+        设置了 aio_session 时经该 aiohttp 会话发送，否则使用共享的 httpx 客户端。
+        """
+        if self.aio_session is None:
+            self._setup_async_client()
 
         domain = self._get_domain(url)
         start_time = time.time()
@@ -410,39 +441,41 @@ class HTTPClient:
             self.stats['total_requests'] += 1
             self.logger.debug(f"发送异步请求", url=url, method=method)
 
-            response = await self.async_client.request(method, url, **kwargs)
-            elapsed_time = time.time() - start_time
-
-            wrapped_response = Response(
-                url=str(response.url),
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                content=response.content,
-                text=response.text,
-                encoding=response.encoding or 'utf-8',
-                elapsed_time=elapsed_time,
-                from_cache=False,
-                request_info={
-                    'method': method,
-                    'url': url,
-                    'kwargs': kwargs
-                }
-            )
+            if self.aio_session is not None:
+                wrapped_response = await self._aiohttp_request(method, url, start_time, **kwargs)
+            else:
+                response = await self.async_client.request(method, url, **kwargs)
+                wrapped_response = Response(
+                    url=str(response.url),
+                    status_code=response.status_code,
+                    headers=dict(response.headers),
+                    content=response.content,
+                    text=response.text,
+                    encoding=response.encoding or 'utf-8',
+                    elapsed_time=time.time() - start_time,
+                    from_cache=False,
+                    request_info={
+                        'method': method,
+                        'url': url,
+                        'kwargs': kwargs
+                    }
+                )
+            elapsed_time = wrapped_response.elapsed_time
 
             self.stats['successful_requests'] += 1
-            self.stats['total_bytes'] += len(response.content)
+            self.stats['total_bytes'] += len(wrapped_response.content)
             self.stats['total_time'] += elapsed_time
 
-            self.logger.debug(f"异步请求成功", url=url, status_code=response.status_code,
+            self.logger.debug(f"异步请求成功", url=url, status_code=wrapped_response.status_code,
                             elapsed_time=f"{elapsed_time:.3f}s")
             return wrapped_response
 
-        except httpx.TimeoutException as e:
+        except (httpx.TimeoutException, asyncio.TimeoutError) as e:
             self.stats['failed_requests'] += 1
             self.logger.warning(f"异步请求超时", url=url, method=method, error=str(e))
             return None
 
-        except httpx.ConnectError as e:
+        except (httpx.ConnectError, aiohttp.ClientError) as e:
             self.stats['failed_requests'] += 1
             self.logger.warning(f"异步连接错误", url=url, method=method, error=str(e))
             return None
@@ -452,8 +485,43 @@ class HTTPClient:
             self.logger.exception(f"异步请求异常", url=url, method=method, error=str(e))
             return None
 
+    async def _aiohttp_request(self, method: str, url: str, start_time: float, **kwargs) -> Response:
+        """经 aiohttp 会话发送请求，应用与 httpx 客户端相同的请求配置"""
+        headers = {'User-Agent': self.user_agent}
+        headers.update(self.request_config.custom_headers)
+        headers.update(kwargs.pop('headers', None) or {})
+
+        async with self.aio_session.request(
+            method, url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.request_config.timeout),
+            ssl=self.request_config.verify_ssl,
+            allow_redirects=self.request_config.allow_redirects,
+            max_redirects=self.request_config.max_redirects,
+            proxy=self.request_config.proxy,
+            **kwargs
+        ) as response:
+            content = await response.read()
+            encoding = response.get_encoding()
+            return Response(
+                url=str(response.url),
+                status_code=response.status,
+                headers=dict(response.headers),
+                content=content,
+                text=content.decode(encoding, errors='replace'),
+                encoding=encoding,
+                elapsed_time=time.time() - start_time,
+                from_cache=False,
+                request_info={
+                    'method': method,
+                    'url': url,
+                    'kwargs': kwargs
+                }
+            )
+
     def set_user_agent(self, user_agent: str) -> None:
         """设置 User-Agent"""
+        self.user_agent = user_agent
         if self.session:
             self.session.headers['User-Agent'] = user_agent
         if self.async_client:
@@ -4,19 +4,137 @@ Atlas RSS 采集器
 专门用于采集 RSS/Atom 订阅源的内容。
 """
 
+import re
 import time
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+import aiohttp
 import feedparser
 from urllib.parse import urljoin
 
 from .base import BaseCollector
 from .http_client import Response
+from ..core.config import CollectionConfig
+
+
+# _extract_entry 读取的条目字段
+_ENTRY_FIELDS = (
+    'title', 'link', 'content', 'description', 'summary',
+    'published_parsed', 'updated_parsed', 'published', 'updated', 'date',
+    'author', 'author_detail', 'id', 'tags', 'media_content', 'media_thumbnail',
+    'language', 'rights', 'comments',
+)
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 同步 close() 调度的会话关闭任务；事件循环只弱引用任务，需在完成前保持引用
+_PENDING_CLOSE_TASKS: Set[asyncio.Task] = set()
+
+
+def _resolve_entry_fields(entry) -> Dict[str, Any]:
+    """一次性读取条目的全部字段，缺失的字段为 None
+
+    feedparser 条目是 dict 子类，直接按键读取可绕过 FeedParserDict.__getattr__
+    逐字段的 Python 层别名解析；别名规则与 feedparser 保持一致。
+    其他对象按属性读取。
+    """
+    if not isinstance(entry, dict):
+        return {name: getattr(entry, name, None) for name in _ENTRY_FIELDS}
+
+    fields = {name: dict.get(entry, name) for name in _ENTRY_FIELDS}
+    fields['description'] = dict.get(entry, 'summary', dict.get(entry, 'subtitle'))
+    if 'updated' not in entry:
+        fields['updated'] = dict.get(entry, 'published')
+    if 'updated_parsed' not in entry:
+        fields['updated_parsed'] = dict.get(entry, 'published_parsed')
+    fields['date'] = fields['updated']
+    return fields
 
 
 class RSSCollector(BaseCollector):
     """RSS 采集器"""
 
+    # 空闲连接保持时间（秒），同一订阅源的重复抓取复用 TCP/TLS 连接
+    KEEPALIVE_TIMEOUT = 75
+
+    def __init__(self, config: CollectionConfig, use_rate_limiter: bool = True,
+                 session: Optional[aiohttp.ClientSession] = None):
+        """初始化 RSS 采集器
+
+        Args:
+            config: 采集配置
+            use_rate_limiter: 是否使用频率限制
+            session: 外部注入的 aiohttp 会话，未提供时按需创建并由采集器负责关闭
+        """
+        super().__init__(config, use_rate_limiter)
+        self._aio_session = session
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owns_aio_session = session is None
+        self.http_client.aio_session = session
+
+    def _get_aio_session(self) -> aiohttp.ClientSession:
+        """获取异步采集共享的 aiohttp 会话（每个采集器一个，跨多次采集复用）"""
+        if self._aio_session is None or self._aio_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_concurrent_requests,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
+            self._aio_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.request_timeout),
+                headers=dict(self.session.headers)
+            )
+            self._aio_loop = asyncio.get_running_loop()
+            self._owns_aio_session = True
+            self.http_client.aio_session = self._aio_session
+        return self._aio_session
+
+    async def make_request_async(self, url: str, method: str = 'GET', **kwargs) -> Optional[Response]:
+        """发送异步请求
+
+        请求经 HTTP 客户端发往共享 aiohttp 会话，频率限制、统计和请求配置与其他采集器一致。
+        """
+        self._get_aio_session()
+        return await super().make_request_async(url, method, **kwargs)
+
+    def _release_aio_session(self) -> Optional[aiohttp.ClientSession]:
+        """解除对 aiohttp 会话的引用，返回需要由采集器关闭的会话"""
+        session = self._aio_session
+        self._aio_session = None
+        self.http_client.aio_session = None
+        if self._owns_aio_session and session is not None and not session.closed:
+            return session
+        return None
+
+    def close(self) -> None:
+        """关闭采集器，释放自行创建的 aiohttp 会话
+
+        在事件循环内调用时调度异步关闭（协程中应优先使用 await aclose()）；
+        创建会话的事件循环已关闭时仅断开连接器。
+        """
+        session = self._release_aio_session()
+        if session is not None:
+            try:
+                task = asyncio.get_running_loop().create_task(session.close())
+            except RuntimeError:
+                if self._aio_loop is not None and not self._aio_loop.is_closed():
+                    self._aio_loop.run_until_complete(session.close())
+                else:
+                    session.detach()
+            else:
+                _PENDING_CLOSE_TASKS.add(task)
+                task.add_done_callback(_PENDING_CLOSE_TASKS.discard)
+                self.logger.warning("在事件循环内同步关闭采集器，会话将异步关闭，请改用 await aclose()")
+        super().close()
+
+    async def aclose(self) -> None:
+        """异步关闭采集器，释放自行创建的 aiohttp 会话"""
+        session = self._release_aio_session()
+        if session is not None:
+            await session.close()
+        await super().aclose()
+
     def collect(self, source_config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """采集 RSS 数据
 
@@ -53,6 +171,7 @@ class RSSCollector(BaseCollector):
                 # 即使有警告也尝试处理
 
             items = []
+            seen_links: Set[int] = set()
             entries = feed.entries if hasattr(feed, 'entries') else []
 
             for entry in entries:
@@ -60,6 +179,11 @@ class RSSCollector(BaseCollector):
                     # 提取条目信息
                     item = self._extract_entry(entry, url)
                     if item and self.validate_rss_entry(item):
+                        # 跳过同一订阅源中链接重复的条目
+                        if self.is_duplicate_link(item.get('link'), seen_links):
+                            self.logger.debug(f"跳过重复 RSS 条目", source=source_name, link=item.get('link'))
+                            continue
+
                         # 标准化数据
                         standardized_item = self.standardize_item(item, source_config)
                         if standardized_item:
@@ -115,6 +239,7 @@ class RSSCollector(BaseCollector):
                                 url=url, warning=str(feed.bozo_exception))
 
             items = []
+            seen_links: Set[int] = set()
             entries = feed.entries if hasattr(feed, 'entries') else []
 
             for entry in entries:
@@ -122,6 +247,11 @@ class RSSCollector(BaseCollector):
                     # 提取条目信息
                     item = self._extract_entry(entry, url)
                     if item and self.validate_rss_entry(item):
+                        # 跳过同一订阅源中链接重复的条目
+                        if self.is_duplicate_link(item.get('link'), seen_links):
+                            self.logger.debug(f"跳过重复 RSS 条目", source=source_name, link=item.get('link'))
+                            continue
+
                         # 标准化数据
                         standardized_item = self.standardize_item(item, source_config)
                         if standardized_item:
@@ -153,10 +283,11 @@ class RSSCollector(BaseCollector):
             提取的数据字典
         """
         item = {}
+        fields = _resolve_entry_fields(entry)
 
         # 基本信息
-        item['title'] = getattr(entry, 'title', '')
-        raw_link = getattr(entry, 'link', '')
+        item['title'] = fields['title'] or ''
+        raw_link = fields['link'] or ''
         # 处理相对链接
         if raw_link and base_url:
             item['link'] = urljoin(base_url, raw_link)
@@ -168,8 +299,8 @@ class RSSCollector(BaseCollector):
         content_type = 'text'
 
         # 优先级: content:encoded > content > description > summary > title
-        if hasattr(entry, 'content') and entry.content:
-            for content_item in entry.content:
+        if fields['content']:
+            for content_item in fields['content']:
                 if hasattr(content_item, 'value'):
                     content = content_item.value
                     content_type = 'html' if '<' in content else 'text'
@@ -177,25 +308,24 @@ class RSSCollector(BaseCollector):
                     break
 
         # 如果content为空，尝试description字段
-        if not content and hasattr(entry, 'description'):
-            content = entry.description
+        if not content and fields['description'] is not None:
+            content = fields['description']
             content_type = 'html' if '<' in content else 'text'
             self.logger.debug(f"从description字段提取内容", length=len(content), type=content_type)
 
         # 如果仍然为空，尝试summary字段
-        if not content and hasattr(entry, 'summary'):
-            content = entry.summary
+        if not content and fields['summary'] is not None:
+            content = fields['summary']
             content_type = 'html' if '<' in content else 'text'
             self.logger.debug(f"从summary字段提取内容", length=len(content), type=content_type)
 
         # 清理HTML标签，保留文本内容用于raw_content
-        import re
         text_content = content
         if content_type == 'html':
             # 移除HTML标签但保留文本
-            text_content = re.sub(r'<[^>]+>', '', content)
+            text_content = _TAG_RE.sub('', content)
             # 清理多余的空白字符
-            text_content = re.sub(r'\s+', ' ', text_content).strip()
+            text_content = _WHITESPACE_RE.sub(' ', text_content).strip()
 
         item['content'] = content  # 原始内容（可能包含HTML）
         item['text_content'] = text_content  # 纯文本内容
@@ -208,37 +338,35 @@ class RSSCollector(BaseCollector):
         # 尝试解析的时间字段
         time_fields = ['published_parsed', 'updated_parsed']
         for field in time_fields:
-            if hasattr(entry, field):
-                parsed_time = getattr(entry, field)
-                if parsed_time and len(parsed_time) >= 6:
-                    try:
-                        pub_date = time.strftime('%Y-%m-%d %H:%M:%S', parsed_time)
-                        break
-                    except (ValueError, TypeError):
-                        continue
+            parsed_time = fields[field]
+            if parsed_time and len(parsed_time) >= 6:
+                try:
+                    pub_date = time.strftime('%Y-%m-%d %H:%M:%S', parsed_time)
+                    break
+                except (ValueError, TypeError):
+                    continue
 
         # 如果解析失败，尝试字符串格式
         if not pub_date:
             time_str_fields = ['published', 'updated', 'date']
             for field in time_str_fields:
-                if hasattr(entry, field):
-                    time_str = getattr(entry, field)
-                    if time_str:
-                        # 简单的时间字符串处理
-                        pub_date = str(time_str)
-                        break
+                time_str = fields[field]
+                if time_str:
+                    # 简单的时间字符串处理
+                    pub_date = str(time_str)
+                    break
 
         item['pub_date'] = pub_date or ''
         item['published'] = pub_date  # 别名
 
         # 作者信息
-        author = getattr(entry, 'author', '')
-        if not author and hasattr(entry, 'author_detail'):
-            author = entry.author_detail.get('name', '')
+        author = fields['author'] or ''
+        if not author and fields['author_detail'] is not None:
+            author = fields['author_detail'].get('name', '')
         item['author'] = author
 
         # 唯一标识
-        entry_id = getattr(entry, 'id', '')
+        entry_id = fields['id'] or ''
         if not entry_id:
             # 使用链接作为ID
             entry_id = item.get('link', '')
@@ -249,8 +377,8 @@ class RSSCollector(BaseCollector):
 
         # 标签处理
         tags = []
-        if hasattr(entry, 'tags') and entry.tags:
-            for tag in entry.tags:
+        if fields['tags']:
+            for tag in fields['tags']:
                 if isinstance(tag, dict):
                     tag_term = tag.get('term', '')
                 else:
@@ -261,8 +389,8 @@ class RSSCollector(BaseCollector):
 
         # 分类信息
         categories = []
-        if hasattr(entry, 'tags') and entry.tags:
-            for tag in entry.tags:
+        if fields['tags']:
+            for tag in fields['tags']:
                 if isinstance(tag, dict) and 'term' in tag:
                     categories.append(tag['term'])
                 elif hasattr(tag, 'term'):
@@ -271,8 +399,8 @@ class RSSCollector(BaseCollector):
 
         # 媒体信息增强
         media = []
-        if hasattr(entry, 'media_content') and entry.media_content:
-            for media_item in entry.media_content:
+        if fields['media_content']:
+            for media_item in fields['media_content']:
                 media_info = {
                     'url': media_item.get('url', ''),
                     'type': media_item.get('type', ''),
@@ -284,8 +412,8 @@ class RSSCollector(BaseCollector):
                     media.append(media_info)
 
         # 缩略图
-        if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-            for thumbnail in entry.media_thumbnail:
+        if fields['media_thumbnail']:
+            for thumbnail in fields['media_thumbnail']:
                 thumbnail_info = {
                     'url': thumbnail.get('url', ''),
                     'width': thumbnail.get('width', 0),
@@ -297,24 +425,24 @@ class RSSCollector(BaseCollector):
         item['media'] = media
 
         # 语言
-        item['language'] = getattr(entry, 'language', '')
+        item['language'] = fields['language'] or ''
 
         # 版权信息
-        item['rights'] = getattr(entry, 'rights', '')
+        item['rights'] = fields['rights'] or ''
 
         # 评论链接
-        item['comments'] = getattr(entry, 'comments', '')
+        item['comments'] = fields['comments'] or ''
 
         # 更新时间
         updated = None
-        if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+        if fields['updated_parsed']:
             try:
-                updated = time.strftime('%Y-%m-%d %H:%M:%S', entry.updated_parsed)
+                updated = time.strftime('%Y-%m-%d %H:%M:%S', fields['updated_parsed'])
             except (ValueError, TypeError):
                 pass
 
-        if not updated and hasattr(entry, 'updated'):
-            updated = str(entry.updated)
+        if not updated and fields['updated'] is not None:
+            updated = str(fields['updated'])
 
         item['updated'] = updated or ''
 
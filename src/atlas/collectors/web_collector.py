@@ -4,8 +4,41 @@ Atlas Web 采集器
 专门用于采集静态网页内容。
 """
 
+import functools
 from typing import Any, Dict, List
-from .base import BaseCollector
+
+import soupsieve
+
+from .base import BaseCollector, SELECTOLAX_AVAILABLE, LexborHTMLParser, LexborNode
+
+
+# 编译后的 CSS 选择器缓存，避免每次提取页面信息时重复解析选择器
+_SEL_CACHE = functools.lru_cache(maxsize=512)(soupsieve.compile)
+
+
+def _select_one(tree, selector: str):
+    """在 BeautifulSoup 或 selectolax 文档树上查询第一个匹配元素"""
+    if SELECTOLAX_AVAILABLE and isinstance(tree, LexborHTMLParser):
+        return tree.css_first(selector)
+    return _SEL_CACHE(selector).select_one(tree)
+
+
+def _is_meta(element) -> bool:
+    """判断元素是否为 meta 标签"""
+    if SELECTOLAX_AVAILABLE and isinstance(element, LexborNode):
+        return element.tag == 'meta'
+    return element.name == 'meta'
+
+
+def _get_attr(element, name: str, default=None):
+    """获取元素属性，属性不存在时返回 default，空属性返回空字符串"""
+    if SELECTOLAX_AVAILABLE and isinstance(element, LexborNode):
+        attributes = element.attributes
+        if name not in attributes:
+            return default
+        # selectolax 中无值属性（如 <meta content>）为 None，与 BeautifulSoup 保持一致
+        return attributes[name] or ''
+    return element.get(name, default)
 
 
 class WebCollector(BaseCollector):
@@ -38,7 +71,10 @@ class WebCollector(BaseCollector):
                 return []
 
             # 解析 HTML
-            soup = self.parse_html(response.text)
+            if self.use_fast_parser:
+                soup = self.parse_html_fast(response.text)
+            else:
+                soup = self.parse_html(response.text)
 
             # 提取页面信息
             item = self._extract_page_info(soup, source_config)
@@ -65,7 +101,7 @@ class WebCollector(BaseCollector):
         """提取页面信息
 
         Args:
-            soup: BeautifulSoup 对象
+            soup: BeautifulSoup 或 selectolax 文档树
             source_config: 数据源配置
 
         Returns:
@@ -78,19 +114,19 @@ class WebCollector(BaseCollector):
 
         # 提取标题
         title_selector = selectors.get('title', 'title')
-        title_element = soup.select_one(title_selector) if title_selector else soup.find('title')
+        title_element = _select_one(soup, title_selector or 'title')
         item['title'] = self.extract_text(title_element)
 
         # 提取内容
         content_selector = selectors.get('content', 'body')
         if content_selector:
-            content_element = soup.select_one(content_selector)
+            content_element = _select_one(soup, content_selector)
             if content_element:
                 item['content'] = self.extract_text(content_element)
             else:
-                item['content'] = self.extract_text(soup.find('body'))
+                item['content'] = self.extract_text(_select_one(soup, 'body'))
         else:
-            item['content'] = self.extract_text(soup.find('body'))
+            item['content'] = self.extract_text(_select_one(soup, 'body'))
 
         # 提取日期
         date_selectors = [
@@ -110,14 +146,14 @@ class WebCollector(BaseCollector):
             if not selector:
                 continue
 
-            date_element = soup.select_one(selector)
+            date_element = _select_one(soup, selector)
             if date_element:
                 # 尝试不同的日期属性
                 date_value = None
-                if date_element.name == 'meta':
-                    date_value = date_element.get('content') or date_element.get('datetime')
+                if _is_meta(date_element):
+                    date_value = _get_attr(date_element, 'content') or _get_attr(date_element, 'datetime')
                 else:
-                    date_value = date_element.get('datetime') or date_element.get('content') or self.extract_text(date_element)
+                    date_value = _get_attr(date_element, 'datetime') or _get_attr(date_element, 'content') or self.extract_text(date_element)
 
                 if date_value:
                     item['pub_date'] = date_value
@@ -137,10 +173,10 @@ class WebCollector(BaseCollector):
             if not selector:
                 continue
 
-            author_element = soup.select_one(selector)
+            author_element = _select_one(soup, selector)
             if author_element:
-                if author_element.name == 'meta':
-                    item['author'] = author_element.get('content')
+                if _is_meta(author_element):
+                    item['author'] = _get_attr(author_element, 'content')
                 else:
                     item['author'] = self.extract_text(author_element)
                 break
@@ -158,10 +194,10 @@ class WebCollector(BaseCollector):
             if not selector:
                 continue
 
-            desc_element = soup.select_one(selector)
+            desc_element = _select_one(soup, selector)
             if desc_element:
-                if desc_element.name == 'meta':
-                    item['description'] = desc_element.get('content', '')
+                if _is_meta(desc_element):
+                    item['description'] = _get_attr(desc_element, 'content', '')
                 else:
                     item['description'] = self.extract_text(desc_element)
                 break
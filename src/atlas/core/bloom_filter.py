@@ -0,0 +1,107 @@
+"""
+Atlas 布隆过滤器模块
+
+用于文档存在性的快速否定判断：过滤器判定不存在的文档一定不存在，
+检索时可以直接返回而无需访问磁盘。基于标准库实现，不引入额外依赖。
+"""
+
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+# 文件头: 魔数(4字节) + 位数组长度(8字节) + 哈希函数个数(4字节) + 元素数量(8字节) + 同步标记(3×8字节)
+FILE_HEADER = struct.Struct(">4sQIQ3q")
+FILE_MAGIC = b"ATBF"
+
+
+class BloomFilter:
+    """布隆过滤器
+
+    使用 blake2b 摘要的两个64位分量做双重哈希生成 k 个比特位置。
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """初始化布隆过滤器
+
+        Args:
+            capacity: 预期元素数量
+            error_rate: 达到预期容量时的误判率
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity 必须为正数，error_rate 必须在 (0, 1) 之间")
+
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    @property
+    def capacity(self) -> int:
+        """由位数组长度和哈希函数个数反推的预期容量（近似值）"""
+        return max(1, round(self.num_bits / self.num_hashes * math.log(2)))
+
+    def _positions(self, key: bytes):
+        """计算元素对应的比特位置"""
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1, h2 = struct.unpack(">QQ", digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: bytes) -> None:
+        """添加元素"""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(key))
+
+    def save(self, path: Union[str, Path], marker: Tuple[int, int, int]) -> None:
+        """持久化到文件（原子替换）
+
+        Args:
+            path: 文件路径
+            marker: 同步标记，加载时用于判断过滤器是否与数据源一致
+        """
+        path = Path(path)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(FILE_HEADER.pack(FILE_MAGIC, self.num_bits, self.num_hashes, self.count, *marker))
+            f.write(self._bits)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional[Tuple["BloomFilter", Tuple[int, int, int]]]:
+        """从文件加载
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            (布隆过滤器, 保存时的同步标记)；文件不存在或损坏时返回None，
+            由调用方根据同步标记判断过滤器是否与数据源一致
+        """
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(FILE_HEADER.size)
+                bits = f.read()
+        except FileNotFoundError:
+            return None
+
+        if len(header) != FILE_HEADER.size:
+            return None
+        magic, num_bits, num_hashes, count, *saved_marker = FILE_HEADER.unpack(header)
+        if magic != FILE_MAGIC or len(bits) != (num_bits + 7) // 8:
+            return None
+
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom._bits = bytearray(bits)
+        return bloom, tuple(saved_marker)
@@ -8,42 +8,253 @@ Atlas 配置管理模块
 4. 配置文件 (YAML)
 """
 
+import copy
+import functools
+import hashlib
 import os
+import pickle
 import yaml
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List
-from dotenv import load_dotenv
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional, Tuple, Union, List
+from dotenv import dotenv_values, load_dotenv
+from loguru import logger
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
 
+# 优先使用 libyaml 的 C 实现
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
-class DatabaseConfig(BaseSettings):
+
+# YAML 解析缓存: 路径 -> ((修改时间, 文件大小), 解析结果)，每个路径只保留最新版本
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """加载 YAML 文件，文件未变化时复用上次的解析结果
+
+    Args:
+        path: YAML 文件路径
+
+    Returns:
+        解析结果的副本（调用方会合并、修改配置数据）
+    """
+    st = os.stat(path)
+    key = str(path)
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is None or cached[0] != version:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = (version, yaml.load(f, Loader=SafeLoader))
+        _YAML_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _flatten_config(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """将嵌套配置展开为点分隔路径索引
+
+    中间层字典同样建立索引（与原字典共享引用），以支持获取整个子配置。
+    """
+    flat: Dict[str, Any] = {}
+    stack = [(prefix, data)]
+    while stack:
+        parent, node = stack.pop()
+        for key, value in node.items():
+            path = f"{parent}.{key}" if parent else str(key)
+            flat[path] = value
+            if isinstance(value, dict):
+                stack.append((path, value))
+    return flat
+
+
+# 预解析配置缓存格式版本，格式变化时旧缓存自动失效
+CONFIG_CACHE_VERSION = 1
+
+
+def _config_yaml_files(config_dir: Path) -> List[Path]:
+    """配置目录下参与缓存的 YAML 文件"""
+    files = sorted(config_dir.glob("config*.yaml"))
+    sources_file = config_dir / "sources.yaml"
+    if sources_file.exists():
+        files.append(sources_file)
+    return files
+
+
+def config_cache_path(config_dir: Union[str, Path], data_dir: Union[str, Path]) -> Path:
+    """配置目录对应的预解析缓存文件（位于数据目录的 cache 子目录，按配置目录区分）"""
+    digest = hashlib.sha1(str(Path(config_dir).resolve()).encode('utf-8')).hexdigest()[:16]
+    return Path(data_dir) / "cache" / f"config_{digest}.pickle"
+
+
+def build_config_cache(config_dir: Union[str, Path], data_dir: Union[str, Path]) -> Path:
+    """解析配置目录下的 YAML 文件并缓存解析结果
+
+    每个文件记录解析时的修改时间和大小，加载时只使用未被修改的文件的缓存。
+
+    Args:
+        config_dir: 配置目录
+        data_dir: 数据目录
+
+    Returns:
+        缓存文件路径
+    """
+    config_dir = Path(config_dir)
+    files = {}
+    for path in _config_yaml_files(config_dir):
+        # 先取文件状态再解析：解析期间文件被修改时，缓存的状态已过期而不会被误用
+        st = os.stat(path)
+        files[path.name] = (st.st_mtime_ns, st.st_size, _load_yaml_cached(path))
+
+    cache_file = config_cache_path(config_dir, data_dir)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_suffix(".tmp")
+    with open(temp_file, 'wb') as f:
+        pickle.dump({"version": CONFIG_CACHE_VERSION, "files": files}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_file, cache_file)
+    return cache_file
+
+
+class _ConfigUnpickler(pickle.Unpickler):
+    """只还原 YAML 安全加载可能产生的类型，缓存文件被篡改时也不会执行任意代码"""
+
+    _ALLOWED_CLASSES = frozenset({
+        ("datetime", "date"),
+        ("datetime", "datetime"),
+        ("datetime", "time"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+    })
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) in self._ALLOWED_CLASSES:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"配置缓存包含不允许的类型: {module}.{name}")
+
+
+def _load_config_cache(config_dir: Path, data_dir: Union[str, Path]) -> Dict[str, Any]:
+    """加载预解析配置缓存
+
+    Args:
+        config_dir: 配置目录
+        data_dir: 数据目录
+
+    Returns:
+        文件名 -> 解析结果；只包含缓存之后未被修改的 YAML 文件，
+        缓存不存在或无效时返回空字典
+    """
+    cache_file = config_cache_path(config_dir, data_dir)
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = _ConfigUnpickler(f).load()
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"加载配置缓存失败，回退到YAML解析: {cache_file}, {e}")
+        return {}
+
+    if not isinstance(cache, dict) or cache.get("version") != CONFIG_CACHE_VERSION:
+        return {}
+
+    fresh = {}
+    for name, (mtime_ns, size, data) in cache["files"].items():
+        try:
+            st = (config_dir / name).stat()
+        except OSError:
+            continue
+        if (st.st_mtime_ns, st.st_size) == (mtime_ns, size):
+            fresh[name] = data
+    return fresh
+
+
+# 与 pydantic 一致的布尔值字面量
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _env_bool(value: str) -> bool:
+    """解析布尔类型的环境变量"""
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"无效的布尔值: {value}")
+
+
+class EnvConfigMixin:
+    """从环境变量构建配置的静态加载器
+
+    子类通过 _ENV_FIELDS 声明 (字段名, 环境变量名, 类型转换函数)，
+    from_env 只遍历一次该表，不做字段反射和模式构建。
+    """
+
+    _ENV_FIELDS: ClassVar[Tuple[Tuple[str, str, Callable[[str], Any]], ...]] = ()
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None, **overrides: Any):
+        """从环境变量创建配置
+
+        Args:
+            env: 环境变量映射，默认使用 os.environ
+            **overrides: 显式指定的字段值，优先于环境变量
+
+        Returns:
+            配置实例
+        """
+        if env is None:
+            env = os.environ
+        values = {}
+        for name, env_key, caster in cls._ENV_FIELDS:
+            value = env.get(env_key)
+            if value is not None:
+                values[name] = caster(value)
+        values.update(overrides)
+        return cls(**values)
+
+
+@dataclass
+class DatabaseConfig(EnvConfigMixin):
     """数据库配置"""
 
-    url: str = Field(default="sqlite:///data/atlas.db", description="数据库连接URL")
-    pool_size: int = Field(default=5, description="连接池大小")
-    max_overflow: int = Field(default=10, description="最大溢出连接数")
-    echo: bool = Field(default=False, description="是否打印SQL语句")
+    url: str = "sqlite:///data/atlas.db"  # 数据库连接URL
+    pool_size: int = 5  # 连接池大小
+    max_overflow: int = 10  # 最大溢出连接数
+    echo: bool = False  # 是否打印SQL语句
 
-    class Config:
-        env_prefix = "ATLAS_DATABASE_"
+    _ENV_FIELDS: ClassVar[Tuple[Tuple[str, str, Callable[[str], Any]], ...]] = (
+        ("url", "ATLAS_DATABASE_URL", str),
+        ("pool_size", "ATLAS_DATABASE_POOL_SIZE", int),
+        ("max_overflow", "ATLAS_DATABASE_MAX_OVERFLOW", int),
+        ("echo", "ATLAS_DATABASE_ECHO", _env_bool),
+    )
 
 
-class CollectionConfig(BaseSettings):
+@dataclass
+class CollectionConfig(EnvConfigMixin):
     """数据采集配置"""
 
-    default_user_agent: str = Field(
-        default="Atlas/0.1.0 (Information Aggregation System; +https://github.com/your-username/atlas)",
-        description="默认HTTP请求User-Agent"
+    # 默认HTTP请求User-Agent
+    default_user_agent: str = "Atlas/0.1.0 (Information Aggregation System; +https://github.com/your-username/atlas)"
+    request_timeout: int = 30  # 请求超时时间(秒)
+    max_concurrent_requests: int = 3  # 最大并发请求数
+    rate_limit_delay: int = 300  # 访问频率限制(秒)
+    use_random_user_agent: bool = False  # 是否使用随机User-Agent
+    rotate_user_agent: bool = False  # 是否轮换User-Agent
+    use_fast_html_parser: bool = False  # 是否使用selectolax快速解析HTML
+
+    _ENV_FIELDS: ClassVar[Tuple[Tuple[str, str, Callable[[str], Any]], ...]] = (
+        ("default_user_agent", "ATLAS_DEFAULT_USER_AGENT", str),
+        ("request_timeout", "ATLAS_REQUEST_TIMEOUT", int),
+        ("max_concurrent_requests", "ATLAS_MAX_CONCURRENT_REQUESTS", int),
+        ("rate_limit_delay", "ATLAS_RATE_LIMIT_DELAY", int),
+        ("use_random_user_agent", "ATLAS_USE_RANDOM_USER_AGENT", _env_bool),
+        ("rotate_user_agent", "ATLAS_ROTATE_USER_AGENT", _env_bool),
+        ("use_fast_html_parser", "ATLAS_USE_FAST_HTML_PARSER", _env_bool),
     )
-    request_timeout: int = Field(default=30, description="请求超时时间(秒)")
-    max_concurrent_requests: int = Field(default=3, description="最大并发请求数")
-    rate_limit_delay: int = Field(default=300, description="访问频率限制(秒)")
-    use_random_user_agent: bool = Field(default=False, description="是否使用随机User-Agent")
-    rotate_user_agent: bool = Field(default=False, description="是否轮换User-Agent")
-
-    class Config:
-        env_prefix = "ATLAS_"
 
 
 class LLMConfig(BaseSettings):
@@ -132,26 +343,34 @@ class LLMConfig(BaseSettings):
         env_prefix = "ATLAS_LLM_"
 
 
-class SchedulerConfig(BaseSettings):
+@dataclass
+class SchedulerConfig(EnvConfigMixin):
     """调度器配置"""
 
-    enabled: bool = Field(default=True, description="是否启用调度器")
-    timezone: str = Field(default="UTC", description="时区")
-    max_workers: int = Field(default=3, description="最大工作线程数")
+    enabled: bool = True  # 是否启用调度器
+    timezone: str = "UTC"  # 时区
+    max_workers: int = 3  # 最大工作线程数
 
-    class Config:
-        env_prefix = "ATLAS_SCHEDULER_"
+    _ENV_FIELDS: ClassVar[Tuple[Tuple[str, str, Callable[[str], Any]], ...]] = (
+        ("enabled", "ATLAS_SCHEDULER_ENABLED", _env_bool),
+        ("timezone", "ATLAS_SCHEDULER_TIMEZONE", str),
+        ("max_workers", "ATLAS_SCHEDULER_MAX_WORKERS", int),
+    )
 
 
-class MonitoringConfig(BaseSettings):
+@dataclass
+class MonitoringConfig(EnvConfigMixin):
     """监控配置"""
 
-    enabled: bool = Field(default=True, description="是否启用监控")
-    metrics_port: int = Field(default=8080, description="监控端口")
-    health_check_interval: int = Field(default=60, description="健康检查间隔(秒)")
+    enabled: bool = True  # 是否启用监控
+    metrics_port: int = 8080  # 监控端口
+    health_check_interval: int = 60  # 健康检查间隔(秒)
 
-    class Config:
-        env_prefix = "ATLAS_MONITORING_"
+    _ENV_FIELDS: ClassVar[Tuple[Tuple[str, str, Callable[[str], Any]], ...]] = (
+        ("enabled", "ATLAS_MONITORING_ENABLED", _env_bool),
+        ("metrics_port", "ATLAS_MONITORING_METRICS_PORT", int),
+        ("health_check_interval", "ATLAS_MONITORING_HEALTH_CHECK_INTERVAL", int),
+    )
 
 
 class StorageConfig(BaseSettings):
@@ -163,6 +382,9 @@ class StorageConfig(BaseSettings):
     # 文件系统存储配置
     filesystem_base_dir: str = Field(default="data/raw", description="文件系统存储基础目录")
     filesystem_compression: bool = Field(default=True, description="是否启用文件压缩")
+    filesystem_format: str = Field(default="json", description="文档存储格式: json, msgpack")
+    filesystem_compression_codec: str = Field(default="gzip", description="压缩算法: gzip, zstd")
+    filesystem_layout: str = Field(default="file", description="存储布局: file, volume")
 
     # MinIO存储配置
     minio_endpoint: str = Field(default="localhost:9000", description="MinIO服务端点")
@@ -179,13 +401,53 @@ class StorageConfig(BaseSettings):
             raise ValueError(f"不支持的存储类型: {v}")
         return v
 
+    @validator('filesystem_format')
+    def validate_filesystem_format(cls, v):
+        """验证文档存储格式"""
+        if v not in ['json', 'msgpack']:
+            raise ValueError(f"不支持的存储格式: {v}")
+        return v
+
+    @validator('filesystem_compression_codec')
+    def validate_filesystem_compression_codec(cls, v):
+        """验证压缩算法"""
+        if v not in ['gzip', 'zstd']:
+            raise ValueError(f"不支持的压缩算法: {v}")
+        return v
+
+    @validator('filesystem_layout')
+    def validate_filesystem_layout(cls, v):
+        """验证存储布局"""
+        if v not in ['file', 'volume']:
+            raise ValueError(f"不支持的存储布局: {v}")
+        return v
+
     class Config:
         env_prefix = "ATLAS_STORAGE_"
 
 
+@functools.lru_cache(maxsize=8)
+def _env_file_candidates(config_dir: Path, env_name: str) -> Tuple[Path, ...]:
+    """环境变量文件候选路径（按优先级排序）"""
+    # 1. 系统环境变量 (已在os.environ中，不需要加载)
+    return (
+        # 2. 项目根目录的 .env 文件 (全局默认配置)
+        Path(".env"),
+        # 3. 配置目录的环境特定 .env 文件
+        config_dir / f".env.{env_name}",
+        # 4. 配置目录的 .env.local 文件 (本地覆盖配置)
+        config_dir / ".env.local",
+        # 5. 配置目录的 .env 文件 (默认配置)
+        config_dir / ".env",
+    )
+
+
 class LocalEnvLoader:
     """本地环境变量加载器"""
 
+    # .env 文件解析缓存: 路径 -> (修改时间, 键值对)
+    _env_file_cache: Dict[str, Tuple[int, Dict[str, str]]] = {}
+
     def __init__(self, config_dir: Path, env_name: Optional[str] = None):
         """初始化环境变量加载器
 
@@ -208,53 +470,69 @@ class LocalEnvLoader:
         root_env_file = Path(".env")
         if root_env_file.exists():
             try:
-                with open(root_env_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith("ATLAS_ENV="):
-                            return line.split("=", 1)[1].strip().strip('"\'')
+                env = self._parse_env_file(root_env_file).get("ATLAS_ENV")
+                if env:
+                    return env
             except Exception:
                 pass
 
         # 默认为开发环境
         return "development"
 
+    @classmethod
+    def _parse_env_file(cls, path: Path) -> Dict[str, str]:
+        """解析 .env 文件中的键值对（按修改时间缓存）
+
+        使用 python-dotenv 的解析规则（支持引号、行内注释、export 前缀），
+        不展开变量引用；每个文件在修改前只读取和解析一次。
+
+        Args:
+            path: .env 文件路径
+
+        Returns:
+            变量名 -> 值，同名变量以最后一次出现为准
+        """
+        cache_key = os.path.abspath(path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = cls._env_file_cache.get(cache_key)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            values = {
+                key: value
+                for key, value in dotenv_values(stream=f, interpolate=False).items()
+                if value is not None
+            }
+
+        if mtime is not None:
+            cls._env_file_cache[cache_key] = (mtime, values)
+        return values
+
     def load_env_files(self) -> None:
         """按优先级加载环境变量文件"""
         env_files = self._get_env_file_paths()
 
         for env_file in env_files:
-            if env_file.exists() and str(env_file) not in self._loaded_envs:
-                load_dotenv(env_file, override=True)
+            if str(env_file) not in self._loaded_envs:
+                values = self._parse_env_file(env_file)
+                if any("$" in value for value in values.values()):
+                    # 含变量引用时交给 python-dotenv 按当前环境展开
+                    load_dotenv(env_file, override=True)
+                else:
+                    os.environ.update(values)
                 self._loaded_envs.add(str(env_file))
 
-    def _get_env_file_paths(self) -> List[Path]:
-        """获取环境变量文件路径列表（按优先级排序）"""
-        env_files = []
-
-        # 1. 系统环境变量 (已在os.environ中，不需要加载)
-
-        # 2. 项目根目录的 .env 文件 (全局默认配置)
-        root_env = Path(".env")
-        if root_env.exists():
-            env_files.append(root_env)
-
-        # 3. 配置目录的环境特定 .env 文件
-        config_specific_env = self.config_dir / f".env.{self.env_name}"
-        if config_specific_env.exists():
-            env_files.append(config_specific_env)
-
-        # 4. 配置目录的 .env.local 文件 (本地覆盖配置)
-        local_env = self.config_dir / ".env.local"
-        if local_env.exists():
-            env_files.append(local_env)
-
-        # 5. 配置目录的 .env 文件 (默认配置)
-        config_env = self.config_dir / ".env"
-        if config_env.exists():
-            env_files.append(config_env)
-
-        return env_files
+    def _get_env_file_paths(self) -> Tuple[Path, ...]:
+        """获取存在的环境变量文件路径（按优先级排序）"""
+        return tuple(
+            env_file for env_file in _env_file_candidates(self.config_dir, self.env_name)
+            if env_file.exists()
+        )
 
     def get_env_info(self) -> Dict[str, Any]:
         """获取当前环境信息"""
@@ -268,6 +546,9 @@ class LocalEnvLoader:
 class Config:
     """Atlas 系统配置管理器"""
 
+    # 数据目录下需要预先创建的子目录
+    _DATA_SUBDIRS = ("raw", "processed", "indexes")
+
     def __init__(self, config_dir: Optional[Union[str, Path]] = None, env_name: Optional[str] = None):
         """初始化配置管理器
 
@@ -278,6 +559,8 @@ class Config:
         self.config_dir = Path(config_dir) if config_dir else Path("config")
         self.env_name = env_name
         self._config_data: Dict[str, Any] = {}
+        # 点分隔路径 -> 配置值（含中间层字典），get 只需一次哈希查找
+        self._flat_config: Dict[str, Any] = {}
         self._database: Optional[DatabaseConfig] = None
         self._collection: Optional[CollectionConfig] = None
         self._llm: Optional[LLMConfig] = None
@@ -298,56 +581,79 @@ class Config:
         """加载环境变量"""
         # 加载本地 .env 文件
         self._env_loader.load_env_files()
+        # 环境变量快照，属性访问时不再逐次读取 os.environ
+        self._env: Dict[str, str] = dict(os.environ)
 
     def _load_config_files(self) -> None:
-        """加载配置文件"""
+        """加载配置文件（预解析缓存未过期时优先使用）"""
+        # 数据目录需要在解析配置文件之前确定，只取自环境变量
+        cached = _load_config_cache(self.config_dir, self._env.get("ATLAS_DATA_DIR", "./data"))
+
+        def load(path: Path) -> Any:
+            if path.name in cached:
+                # 每次加载都重新反序列化，无需复制
+                return cached[path.name]
+            return _load_yaml_cached(path)
+
         # 加载主配置文件
         main_config_file = self.config_dir / "config.yaml"
         if main_config_file.exists():
-            with open(main_config_file, 'r', encoding='utf-8') as f:
-                self._config_data.update(yaml.safe_load(f) or {})
+            self._config_data.update(load(main_config_file) or {})
 
         # 加载数据源配置文件
         sources_config_file = self.config_dir / "sources.yaml"
         if sources_config_file.exists():
-            with open(sources_config_file, 'r', encoding='utf-8') as f:
-                self._config_data['sources'] = yaml.safe_load(f)
+            self._config_data['sources'] = load(sources_config_file)
 
         # 加载环境特定配置文件（如果存在）
         env_config_file = self.config_dir / f"config.{self.env_name}.yaml"
         if env_config_file.exists():
-            with open(env_config_file, 'r', encoding='utf-8') as f:
-                env_config = yaml.safe_load(f) or {}
-                # 深度合并环境特定配置
-                self._deep_merge(self._config_data, env_config)
-
-    def _deep_merge(self, base_dict: Dict, update_dict: Dict) -> None:
-        """深度合并字典"""
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._deep_merge(base_dict[key], value)
-            else:
-                base_dict[key] = value
+            env_config = load(env_config_file) or {}
+            # 深度合并环境特定配置
+            self._deep_merge(self._config_data, env_config)
+
+        self._flat_config = _flatten_config(self._config_data)
+
+    @staticmethod
+    def _deep_merge(base_dict: Dict, update_dict: Dict) -> None:
+        """深度合并字典
+
+        逐层迭代合并：每层只对双方都是字典的键继续下探，
+        其余键通过一次 dict.update 整体覆盖。
+        """
+        stack = [(base_dict, update_dict)]
+        while stack:
+            base, update = stack.pop()
+            nested = [
+                key for key, value in update.items()
+                if isinstance(value, dict) and isinstance(base.get(key), dict)
+            ]
+            if not nested:
+                base.update(update)
+                continue
+            nested_keys = set(nested)
+            base.update({key: value for key, value in update.items() if key not in nested_keys})
+            stack.extend((base[key], update[key]) for key in nested)
 
     @property
     def env(self) -> str:
         """环境类型"""
-        return os.getenv("ATLAS_ENV", self._config_data.get("env", self.env_name or "development"))
+        return self._env.get("ATLAS_ENV", self._config_data.get("env", self.env_name or "development"))
 
     @property
     def debug(self) -> bool:
         """调试模式"""
-        return os.getenv("ATLAS_DEBUG", "false").lower() == "true"
+        return self._env.get("ATLAS_DEBUG", "false").lower() == "true"
 
     @property
     def log_level(self) -> str:
         """日志级别"""
-        return os.getenv("ATLAS_LOG_LEVEL", self._config_data.get("log_level", "INFO"))
+        return self._env.get("ATLAS_LOG_LEVEL", self._config_data.get("log_level", "INFO"))
 
     @property
     def data_dir(self) -> Path:
         """数据目录"""
-        path_str = os.getenv("ATLAS_DATA_DIR", self._config_data.get("data_dir", "./data"))
+        path_str = self._env.get("ATLAS_DATA_DIR", self._config_data.get("data_dir", "./data"))
         return Path(path_str).expanduser().absolute()
 
     @property
@@ -358,21 +664,21 @@ class Config:
     @property
     def log_dir(self) -> Path:
         """日志目录"""
-        path_str = os.getenv("ATLAS_LOG_DIR", self._config_data.get("log_dir", "./logs"))
+        path_str = self._env.get("ATLAS_LOG_DIR", self._config_data.get("log_dir", "./logs"))
         return Path(path_str).expanduser().absolute()
 
     @property
     def database(self) -> DatabaseConfig:
         """数据库配置"""
         if self._database is None:
-            self._database = DatabaseConfig()
+            self._database = DatabaseConfig.from_env(self._env)
         return self._database
 
     @property
     def collection(self) -> CollectionConfig:
         """数据采集配置"""
         if self._collection is None:
-            self._collection = CollectionConfig()
+            self._collection = CollectionConfig.from_env(self._env)
         return self._collection
 
     @property
@@ -386,14 +692,14 @@ class Config:
     def scheduler(self) -> SchedulerConfig:
         """调度器配置"""
         if self._scheduler is None:
-            self._scheduler = SchedulerConfig()
+            self._scheduler = SchedulerConfig.from_env(self._env)
         return self._scheduler
 
     @property
     def monitoring(self) -> MonitoringConfig:
         """监控配置"""
         if self._monitoring is None:
-            self._monitoring = MonitoringConfig()
+            self._monitoring = MonitoringConfig.from_env(self._env)
         return self._monitoring
 
     @property
@@ -427,16 +733,7 @@ class Config:
         Returns:
             配置值
         """
-        keys = key.split('.')
-        value = self._config_data
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat_config.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """设置配置值
@@ -448,16 +745,26 @@ class Config:
         keys = key.split('.')
         config = self._config_data
 
-        for k in keys[:-1]:
+        for i, k in enumerate(keys[:-1]):
             if k not in config:
                 config[k] = {}
+                self._flat_config['.'.join(keys[:i + 1])] = config[k]
             config = config[k]
 
         config[keys[-1]] = value
 
+        # 移除被覆盖子树的旧索引
+        prefix = key + '.'
+        for stale_key in [k for k in self._flat_config if k.startswith(prefix)]:
+            del self._flat_config[stale_key]
+        self._flat_config[key] = value
+        if isinstance(value, dict):
+            self._flat_config.update(_flatten_config(value, key))
+
     def reload(self) -> None:
         """重新加载配置"""
         self._config_data.clear()
+        self._flat_config.clear()
         self._database = None
         self._collection = None
         self._llm = None
@@ -476,18 +783,14 @@ class Config:
         config_file.parent.mkdir(parents=True, exist_ok=True)
 
         with open(config_file, 'w', encoding='utf-8') as f:
-            yaml.dump(self._config_data, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(self._config_data, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
 
     def ensure_directories(self) -> None:
         """确保必要的目录存在"""
-        directories = [
-            self.data_dir,
-            self.log_dir,
-            self.config_dir_path,
-            self.data_dir / "raw",
-            self.data_dir / "processed",
-            self.data_dir / "indexes"
-        ]
+        # 只创建末级目录，数据目录本身由 parents=True 一并创建
+        data_dir = self.data_dir
+        directories = [data_dir / name for name in self._DATA_SUBDIRS]
+        directories += [self.log_dir, self.config_dir_path]
 
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
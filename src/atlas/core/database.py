@@ -5,12 +5,13 @@ Atlas 数据库管理模块
 遵循MVP架构设计，使用SQLite作为主要数据库，支持后续迁移到PostgreSQL。
 """
 
+import itertools
 import sqlite3
 import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import sqlite_utils
 from loguru import logger
@@ -22,6 +23,10 @@ from ..models.documents import (
 )
 
 
+# 批量写入时每个事务包含的最大行数
+EXECUTE_MANY_BATCH_SIZE = 5000
+
+
 class DatabaseError(Exception):
     """数据库相关错误"""
     pass
@@ -339,6 +344,55 @@ class AtlasDatabase:
             cursor = conn.execute(query, params or ())
             return cursor.lastrowid
 
+    def execute_many(self, query: str, rows: Iterable[Tuple],
+                     batch_size: int = EXECUTE_MANY_BATCH_SIZE,
+                     skip_failed_rows: bool = False) -> int:
+        """批量执行同一条语句
+
+        所有行共用一个连接和预编译语句，每 batch_size 行提交一次事务。
+        中途失败时，之前已提交的批次不会回滚。
+
+        Args:
+            query: SQL语句
+            rows: 参数行
+            batch_size: 每批行数
+            skip_failed_rows: 某批失败时回滚该批并逐条重试，跳过仍然失败的行；
+                为False时直接抛出异常
+
+        Returns:
+            影响的行数
+        """
+        rows = iter(rows)
+        total = 0
+        with self.get_connection() as conn:
+            while True:
+                chunk = list(itertools.islice(rows, batch_size))
+                if not chunk:
+                    break
+                try:
+                    total += conn.executemany(query, chunk).rowcount
+                    conn.commit()
+                except sqlite3.Error as e:
+                    if not skip_failed_rows:
+                        raise
+                    conn.rollback()
+                    logger.warning(f"批量执行失败，改为逐条执行 {len(chunk)} 行: {e}")
+                    total += self._execute_rows(conn, query, chunk)
+        return total
+
+    @staticmethod
+    def _execute_rows(conn: sqlite3.Connection, query: str, rows: List[Tuple]) -> int:
+        """逐条执行并提交，跳过失败的行"""
+        total = 0
+        for row in rows:
+            try:
+                total += conn.execute(query, row).rowcount
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                logger.error(f"执行失败，已跳过该行: {e}")
+        return total
+
     def begin_transaction(self) -> None:
         """开始事务"""
         if not hasattr(self._local, 'in_transaction') or not self._local.in_transaction:
@@ -11,6 +11,50 @@ from typing import Any, Dict, Optional, Union
 from datetime import datetime
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """序列化结构化日志记录，优先使用 orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+# 控制台日志格式
+_CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+
+# 文件日志格式
+_FILE_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | "
+    "{level: <8} | "
+    "{name}:{function}:{line} | "
+    "{message}"
+)
+
+
+def _json_format(record: Dict[str, Any]) -> str:
+    """结构化日志格式：每条记录序列化为一行 JSON"""
+    record["extra"]["_json"] = _dumps({
+        "timestamp": record["time"].strftime("%Y-%m-%d %H:%M:%S"),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    })
+    return "{extra[_json]}\n"
+
 
 class AtlasLogger:
     """Atlas 日志管理器"""
@@ -33,42 +77,17 @@ class AtlasLogger:
             retention: 日志保留时间
         """
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.enable_file = enable_file
+        self.enable_console = enable_console
 
         # 移除默认的处理器
         logger.remove()
 
-        # 控制台日志格式
-        console_format = (
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-            "<level>{message}</level>"
-        )
-
-        # 文件日志格式
-        file_format = (
-            "{time:YYYY-MM-DD HH:mm:ss} | "
-            "{level: <8} | "
-            "{name}:{function}:{line} | "
-            "{message}"
-        )
-
-        # 结构化日志格式
-        json_format = (
-            "{{\"timestamp\": \"{time:YYYY-MM-DD HH:mm:ss}\", "
-            "\"level\": \"{level}\", "
-            "\"logger\": \"{name}\", "
-            "\"function\": \"{function}\", "
-            "\"line\": {line}, "
-            "\"message\": \"{message}\"}}"
-        )
-
         # 添加控制台处理器
         if enable_console:
             logger.add(
                 sys.stdout,
-                format=console_format,
+                format=_CONSOLE_FORMAT,
                 level=log_level,
                 colorize=True,
                 enqueue=True
@@ -76,10 +95,13 @@ class AtlasLogger:
 
         # 添加文件处理器
         if enable_file:
+            # 仅在启用文件日志时创建日志目录
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+
             # 应用日志
             logger.add(
                 self.log_dir / "atlas.log",
-                format=file_format,
+                format=_FILE_FORMAT,
                 level=log_level,
                 rotation=rotation,
                 retention=retention,
@@ -90,7 +112,7 @@ class AtlasLogger:
             # 错误日志
             logger.add(
                 self.log_dir / "errors.log",
-                format=file_format,
+                format=_FILE_FORMAT,
                 level="ERROR",
                 rotation=rotation,
                 retention=retention,
@@ -101,7 +123,7 @@ class AtlasLogger:
             # 结构化日志（JSON格式）
             logger.add(
                 self.log_dir / "structured.log",
-                format=json_format,
+                format=_json_format,
                 level=log_level,
                 rotation=rotation,
                 retention=retention,
@@ -110,6 +132,7 @@ class AtlasLogger:
             )
 
         self.logger = logger
+        self._lazy_logger = logger.opt(lazy=True)
 
     def debug(self, message: str, **kwargs) -> None:
         """调试日志"""
@@ -144,23 +167,19 @@ class AtlasLogger:
             message: 日志消息
             **kwargs: 额外的上下文信息
         """
-        # 构建带有上下文的消息
-        if kwargs:
-            context_parts = []
-            for key, value in kwargs.items():
-                if key == "exception":
-                    continue  # 异常信息由loguru处理
-                context_parts.append(f"{key}={value}")
-
-            if context_parts:
-                enhanced_message = f"{message} | {' | '.join(context_parts)}"
-            else:
-                enhanced_message = message
-        else:
-            enhanced_message = message
-
-        # 记录日志
-        getattr(self.logger, level.lower())(enhanced_message)
+        # 消息在确有处理器接收该级别时才构建（无处理器或级别被过滤时跳过）
+        getattr(self._lazy_logger, level.lower())(
+            "{}", lambda: self._format_context(message, kwargs)
+        )
+
+    @staticmethod
+    def _format_context(message: str, context: Dict[str, Any]) -> str:
+        """将上下文信息拼接到日志消息"""
+        context_parts = [f"{key}={value}" for key, value in context.items()
+                         if key != "exception"]  # 异常信息由loguru处理
+        if context_parts:
+            return f"{message} | {' | '.join(context_parts)}"
+        return message
 
     def log_request(self, method: str, url: str, status_code: int = None,
                    duration: float = None, **kwargs) -> None:
@@ -260,6 +279,9 @@ class AtlasLogger:
 # 全局日志实例
 _atlas_logger: Optional[AtlasLogger] = None
 
+# 未初始化时按名称绑定的 loguru 日志记录器
+_LOGGER_CACHE: Dict[str, Any] = {}
+
 
 def init_logger(log_dir: Union[str, Path],
                log_level: str = "INFO",
@@ -295,9 +317,13 @@ def get_logger(name: Optional[str] = None) -> Union[logger, AtlasLogger]:
     if _atlas_logger is not None:
         return _atlas_logger
     else:
-        # 如果没有初始化，返回loguru默认logger
+        # 如果没有初始化，返回loguru默认logger（按名称缓存绑定结果）
         if name:
-            return logger.bind(name=name)
+            name = sys.intern(name)
+            bound = _LOGGER_CACHE.get(name)
+            if bound is None:
+                bound = _LOGGER_CACHE.setdefault(name, logger.bind(name=name))
+            return bound
         return logger
 
 
@@ -25,6 +25,52 @@ from ..models.documents import (
 )
 
 
+RAW_DOCUMENT_INSERT_SQL = """
+INSERT INTO raw_documents (
+    id, source_id, source_url, source_type, document_type,
+    raw_content, raw_metadata, collected_at, collector_version,
+    processing_status, processing_error, processing_attempts,
+    content_hash, title, author, published_at, language,
+    created_at, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def raw_document_params(document: RawDocument, document_id: Optional[str] = None,
+                        ensure_ascii: bool = True) -> Tuple:
+    """生成 raw_documents 插入语句的参数
+
+    Args:
+        document: 原始文档对象
+        document_id: 覆盖使用的文档ID，默认使用 document.id
+        ensure_ascii: 序列化元数据时是否转义非ASCII字符
+
+    Returns:
+        与 RAW_DOCUMENT_INSERT_SQL 对应的参数元组
+    """
+    return (
+        document_id or str(document.id),
+        document.source_id,
+        str(document.source_url) if document.source_url else None,
+        document.source_type.value,
+        document.document_type.value,
+        document.raw_content,
+        json.dumps(document.raw_metadata, ensure_ascii=ensure_ascii),
+        document.collected_at,
+        document.collector_version,
+        document.processing_status.value,
+        document.processing_error,
+        document.processing_attempts,
+        document.content_hash,
+        document.title,
+        document.author,
+        document.published_at,
+        document.language,
+        document.created_at,
+        document.updated_at,
+    )
+
+
 class DataRepository:
     """数据仓库类，提供统一的数据访问接口"""
 
@@ -59,39 +105,8 @@ class DataRepository:
 
             # 存储到数据库
             with self.database.transaction():
-                query = """
-                INSERT INTO raw_documents (
-                    id, source_id, source_url, source_type, document_type,
-                    raw_content, raw_metadata, collected_at, collector_version,
-                    processing_status, processing_error, processing_attempts,
-                    content_hash, title, author, published_at, language,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-
-                params = (
-                    str(document.id),
-                    document.source_id,
-                    str(document.source_url) if document.source_url else None,
-                    document.source_type.value,
-                    document.document_type.value,
-                    document.raw_content,
-                    json.dumps(document.raw_metadata),
-                    document.collected_at,
-                    document.collector_version,
-                    document.processing_status.value,
-                    document.processing_error,
-                    document.processing_attempts,
-                    document.content_hash,
-                    document.title,
-                    document.author,
-                    document.published_at,
-                    document.language,
-                    document.created_at,
-                    document.updated_at,
-                )
-
-                self.database.execute_insert(query, params)
+                self.database.execute_insert(RAW_DOCUMENT_INSERT_SQL,
+                                             raw_document_params(document))
 
             logger.info(f"原始文档创建成功: {document.id}")
             return document.id
@@ -100,6 +115,33 @@ class DataRepository:
             logger.error(f"创建原始文档失败: {e}")
             raise
 
+    async def create_raw_documents(self, documents: List[RawDocument]) -> List[UUID]:
+        """批量创建原始文档
+
+        文件逐个写入存储，数据库记录通过一次批量插入写入。
+
+        Args:
+            documents: 原始文档列表
+
+        Returns:
+            文档ID列表
+        """
+        try:
+            for document in documents:
+                await self.storage.store_raw_document(document)
+
+            self.database.execute_many(
+                RAW_DOCUMENT_INSERT_SQL,
+                (raw_document_params(document) for document in documents)
+            )
+
+            logger.info(f"批量创建原始文档成功: {len(documents)} 条")
+            return [document.id for document in documents]
+
+        except Exception as e:
+            logger.error(f"批量创建原始文档失败: {e}")
+            raise
+
     async def get_raw_document(self, document_id: Union[str, UUID]) -> Optional[RawDocument]:
         """获取原始文档
 
@@ -0,0 +1,156 @@
+"""
+Atlas 文档搜索索引模块
+
+基于 SQLite FTS5 的进程内全文索引，用于替代逐条扫描索引文件的搜索方式。
+使用 trigram 分词器，保持与原实现一致的子串匹配语义（对中文同样有效）。
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Tuple, Union
+
+from loguru import logger
+
+
+class SearchIndex:
+    """文档搜索索引
+
+    每个文档对应一行，保存其小写化的可搜索文本（标题、数据源、关键词）。
+    文档标识保存在普通表 search_documents 中，其主键即 FTS5 表 search_text 的 rowid，
+    写入和删除都按主键/唯一索引定位，不随索引规模扫描全表。
+    SQLite 未编译 FTS5 时 available 为 False，由调用方回退到扫描搜索。
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """初始化搜索索引
+
+        Args:
+            db_path: 索引数据库文件路径
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        # 为 True 时调用方应从文档索引重建搜索索引
+        self.needs_rebuild = False
+
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            # 旧版本把文档标识存为 FTS5 的 UNINDEXED 列，按标识删除需要扫描全表；
+            # 删除旧表后由调用方在首次搜索时重建
+            if self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'search_index'"
+            ).fetchone():
+                self._conn.execute("DROP TABLE search_index")
+                self.needs_rebuild = True
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_documents (
+                    id INTEGER PRIMARY KEY,
+                    document_type TEXT NOT NULL,
+                    document_id TEXT NOT NULL,
+                    UNIQUE (document_type, document_id)
+                )
+            """)
+            self._conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS search_text USING fts5(
+                    searchable,
+                    tokenize = 'trigram'
+                )
+            """)
+            self._conn.commit()
+            self.available = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite不支持FTS5 trigram，搜索将回退到索引扫描: {e}")
+            self.available = False
+
+    def _lookup(self, document_id: str, document_type: str):
+        """按唯一索引查找文档行号"""
+        row = self._conn.execute(
+            "SELECT id FROM search_documents WHERE document_type = ? AND document_id = ?",
+            (document_type, document_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _upsert(self, document_id: str, document_type: str, searchable: str) -> None:
+        """写入或更新一行（调用方持有锁并负责提交）"""
+        rowid = self._lookup(document_id, document_type)
+        if rowid is None:
+            rowid = self._conn.execute(
+                "INSERT INTO search_documents (document_type, document_id) VALUES (?, ?)",
+                (document_type, document_id)
+            ).lastrowid
+        else:
+            self._conn.execute("DELETE FROM search_text WHERE rowid = ?", (rowid,))
+        self._conn.execute(
+            "INSERT INTO search_text (rowid, searchable) VALUES (?, ?)",
+            (rowid, searchable)
+        )
+
+    def upsert(self, document_id: str, document_type: str, searchable: str) -> None:
+        """写入或更新文档的可搜索文本"""
+        with self._lock:
+            self._upsert(document_id, document_type, searchable)
+            self._conn.commit()
+
+    def upsert_many(self, documents: Iterable[Tuple[str, str, str]]) -> None:
+        """在一个事务中批量写入 (文档ID, 文档类型, 可搜索文本)"""
+        with self._lock:
+            for document_id, document_type, searchable in documents:
+                self._upsert(document_id, document_type, searchable)
+            self._conn.commit()
+
+    def remove(self, document_id: str, document_type: str) -> None:
+        """移除文档"""
+        with self._lock:
+            rowid = self._lookup(document_id, document_type)
+            if rowid is None:
+                return
+            self._conn.execute("DELETE FROM search_text WHERE rowid = ?", (rowid,))
+            self._conn.execute("DELETE FROM search_documents WHERE id = ?", (rowid,))
+            self._conn.commit()
+
+    def search(self, query: str, document_type: str, limit: int) -> List[str]:
+        """子串搜索（不区分大小写）
+
+        查询不少于3个字符时使用 trigram 索引匹配；更短的查询无法构成
+        trigram，退化为对索引表的逐行子串匹配。
+
+        Args:
+            query: 搜索查询
+            document_type: 文档类型
+            limit: 结果数量限制
+
+        Returns:
+            匹配的文档ID列表
+        """
+        query = query.lower()
+        with self._lock:
+            if len(query) >= 3:
+                rows = self._conn.execute(
+                    "SELECT d.document_id FROM search_text t "
+                    "JOIN search_documents d ON d.id = t.rowid "
+                    "WHERE d.document_type = ? AND t.searchable MATCH ? LIMIT ?",
+                    (document_type, '"' + query.replace('"', '""') + '"', limit)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT d.document_id FROM search_text t "
+                    "JOIN search_documents d ON d.id = t.rowid "
+                    "WHERE d.document_type = ? AND instr(t.searchable, ?) > 0 LIMIT ?",
+                    (document_type, query, limit)
+                ).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self, document_type: str) -> int:
+        """统计某类型已索引的文档数量"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM search_documents WHERE document_type = ?", (document_type,)
+            ).fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        """关闭索引数据库"""
+        with self._lock:
+            self._conn.close()
@@ -3,21 +3,49 @@ Atlas 文件存储系统模块
 
 提供JSON文件的存储、检索和管理功能，用于存储原始数据和处理结果。
 支持文件压缩、索引管理和自动清理功能。
+可选使用 msgpack 二进制格式（需要安装 msgspec）存储文档内容，
+以及 zstd 压缩（需要安装 zstandard，支持预训练字典）。
+支持“一文档一文件”和卷文件打包（volume）两种存储布局。
 """
 
+import asyncio
 import gzip
 import json
+import os
 import shutil
-from datetime import datetime, timedelta
+import time
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-import aiofiles
-import aiofiles.os
 from loguru import logger
 
+try:
+    import fcntl
+except ImportError:
+    # Windows 无 fcntl，索引文件锁退化为仅进程内互斥
+    fcntl = None
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
 from ..models.documents import DocumentType, RawDocument, ProcessedDocument
+from .bloom_filter import BloomFilter
+from .search_index import SearchIndex
+from .volume_store import VolumeStore
 
 
 class StorageError(Exception):
@@ -35,37 +63,124 @@ class InvalidFileFormatError(StorageError):
     pass
 
 
+# 支持的文档存储格式及其文件扩展名
+STORAGE_FORMATS = {
+    "json": ".json",
+    "msgpack": ".msgpack",
+}
+
+# 支持的存储布局: 一文档一文件 / 卷文件打包
+STORAGE_LAYOUTS = ("file", "volume")
+
+# 支持的压缩算法及其文件扩展名
+COMPRESSION_CODECS = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+# gzip 压缩级别：级别1比默认的9快数倍，压缩率损失较小
+GZIP_LEVEL = 1
+
+# zstd 压缩级别和字典大小
+ZSTD_LEVEL = 3
+ZSTD_DICT_SIZE = 64 * 1024
+
+# 索引预写日志累计多少条记录后合并到快照
+INDEX_COMPACTION_THRESHOLD = 10000
+
+# 文档存在性布隆过滤器的最小容量和误判率；重建时按现有文档数的两倍预留容量
+BLOOM_MIN_CAPACITY = 1 << 16
+BLOOM_ERROR_RATE = 0.01
+
+# 备份时单次 copy_file_range 调用拷贝的最大字节数
+BACKUP_CHUNK_SIZE = 64 * 1024 * 1024
+
+# msgpack 编解码器可复用，避免每次调用重新构建
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder() if MSGSPEC_AVAILABLE else None
+_MSGPACK_DECODER = msgspec.msgpack.Decoder() if MSGSPEC_AVAILABLE else None
+
+
 class FileStorageManager:
     """文件存储管理器
 
     提供基于文件的文档存储功能，包括：
-    - JSON文件存储和检索
+    - JSON/msgpack文件存储和检索
     - 文件压缩和解压
     - 目录结构管理
     - 索引文件管理
     - 自动清理功能
     """
 
-    def __init__(self, base_dir: Union[str, Path], enable_compression: bool = True):
+    def __init__(self, base_dir: Union[str, Path], enable_compression: bool = True,
+                 storage_format: str = "json", compression_codec: str = "gzip",
+                 layout: str = "file"):
         """初始化文件存储管理器
 
         Args:
             base_dir: 基础存储目录
             enable_compression: 是否启用文件压缩
+            storage_format: 文档存储格式 (json, msgpack)
+            compression_codec: 压缩算法 (gzip, zstd)
+            layout: 存储布局 (file: 一文档一文件, volume: 卷文件打包)
         """
+        if storage_format not in STORAGE_FORMATS:
+            raise ValueError(f"不支持的存储格式: {storage_format}")
+        if storage_format == "msgpack" and not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec is required for msgpack storage format. Install with: pip install msgspec")
+        if compression_codec not in COMPRESSION_CODECS:
+            raise ValueError(f"不支持的压缩算法: {compression_codec}")
+        if compression_codec == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is required for zstd compression. Install with: pip install zstandard")
+        if layout not in STORAGE_LAYOUTS:
+            raise ValueError(f"不支持的存储布局: {layout}")
+
         self.base_dir = Path(base_dir)
         self.enable_compression = enable_compression
+        self.storage_format = storage_format
+        self.compression_codec = compression_codec
+        self.layout = layout
 
         # 目录结构
         self.raw_dir = self.base_dir / "raw"
         self.processed_dir = self.base_dir / "processed"
         self.index_dir = self.base_dir / "indexes"
         self.temp_dir = self.base_dir / "temp"
+        self.volume_dir = self.base_dir / "volumes"
 
         # 创建目录结构
         self._ensure_directories()
 
-        logger.info(f"初始化文件存储管理器: {self.base_dir}, 压缩: {enable_compression}")
+        # 索引预写日志记录计数
+        self._index_wal_counts: Dict[Path, int] = {}
+        self._index_lock = asyncio.Lock()
+
+        # 文档存在性布隆过滤器（按文档类型懒加载）
+        self._bloom_filters: Dict[str, BloomFilter] = {}
+        # 过滤器已同步到的索引状态标记，以及自加载后有更新、需要持久化的过滤器
+        self._bloom_markers: Dict[str, Tuple[int, int, int]] = {}
+        self._bloom_dirty: set = set()
+
+        # 全文搜索索引
+        self._search_index = SearchIndex(self.index_dir / "search_index.db")
+        self._search_index_checked = False
+
+        # 卷文件存储（仅 volume 布局）
+        self._volume_stores: Dict[str, VolumeStore] = {}
+        if layout == "volume":
+            self._volume_stores = {
+                "raw": VolumeStore(self.volume_dir / "raw"),
+                "processed": VolumeStore(self.volume_dir / "processed"),
+            }
+
+        # zstd 压缩上下文（存在已训练字典时自动加载）
+        self.zstd_dict_path = self.index_dir / "zdict.bin"
+        self._zstd_compressor = None
+        self._zstd_decompressor = None
+        if ZSTD_AVAILABLE:
+            self._load_zstd_dictionary()
+
+        logger.info(f"初始化文件存储管理器: {self.base_dir}, 压缩: {enable_compression}, "
+                    f"算法: {compression_codec}, 格式: {storage_format}, 布局: {layout}")
 
     def _ensure_directories(self) -> None:
         """确保必要的目录存在"""
@@ -80,6 +195,15 @@ class FileStorageManager:
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
 
+    def _load_zstd_dictionary(self) -> None:
+        """加载zstd字典并创建压缩上下文"""
+        zstd_dict = None
+        if self.zstd_dict_path.exists():
+            zstd_dict = zstandard.ZstdCompressionDict(self.zstd_dict_path.read_bytes())
+
+        self._zstd_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zstd_dict)
+        self._zstd_decompressor = zstandard.ZstdDecompressor(dict_data=zstd_dict)
+
     def _get_file_path(self, document_id: Union[str, UUID], document_type: str,
                       subdirectory: Optional[str] = None) -> Path:
         """生成文件存储路径
@@ -93,8 +217,8 @@ class FileStorageManager:
             文件路径
         """
         doc_id_str = str(document_id)
-        # 使用ID前两位作为子目录，避免单个目录文件过多
-        sub_dir = doc_id_str[:2]
+        # 使用ID前三位十六进制字符分两级子目录（ab/c，共4096个分片），避免单个目录文件过多
+        sub_dir = Path(doc_id_str[:2]) / doc_id_str[2:3]
 
         if subdirectory:
             base_path = self.base_dir / subdirectory / sub_dir
@@ -109,10 +233,41 @@ class FileStorageManager:
 
         base_path.mkdir(parents=True, exist_ok=True)
 
+        return base_path / f"{doc_id_str}{self._get_document_suffix()}"
+
+    def _get_document_suffix(self) -> str:
+        """获取当前格式和压缩算法对应的扩展名，如 .json.gz"""
+        suffix = STORAGE_FORMATS[self.storage_format]
         if self.enable_compression:
-            return base_path / f"{doc_id_str}.json.gz"
-        else:
-            return base_path / f"{doc_id_str}.json"
+            suffix += COMPRESSION_CODECS[self.compression_codec]
+        return suffix
+
+    def _find_existing_file(self, document_id: Union[str, UUID], document_type: str) -> Path:
+        """查找文档的已存在文件
+
+        优先返回当前格式的路径；若不存在，则依次尝试其他格式和压缩算法组合，
+        以及旧版仅按ID前两位分片的目录，以便切换存储格式后仍能读取旧数据。
+
+        Args:
+            document_id: 文档ID
+            document_type: 文档类型
+
+        Returns:
+            已存在的文件路径，都不存在时返回当前格式的路径
+        """
+        file_path = self._get_file_path(document_id, document_type)
+        if file_path.exists():
+            return file_path
+
+        doc_id_str = str(document_id)
+        for directory in (file_path.parent, file_path.parent.parent):
+            for suffix in STORAGE_FORMATS.values():
+                for compression_suffix in ("", *COMPRESSION_CODECS.values()):
+                    candidate = directory / f"{doc_id_str}{suffix}{compression_suffix}"
+                    if candidate.exists():
+                        return candidate
+
+        return file_path
 
     async def store_raw_document(self, document: RawDocument) -> Path:
         """存储原始文档
@@ -123,8 +278,6 @@ class FileStorageManager:
         Returns:
             存储的文件路径
         """
-        file_path = self._get_file_path(document.id, "raw")
-
         try:
             # 准备存储数据
             storage_data = {
@@ -151,10 +304,10 @@ class FileStorageManager:
             }
 
             # 写入文件
-            await self._write_json_file(file_path, storage_data)
+            file_path = await self._write_document(document.id, "raw", storage_data)
 
             # 更新索引
-            await self._update_raw_document_index(document)
+            await self._update_raw_document_index(document, self._get_index_location("raw", file_path))
 
             logger.debug(f"原始文档已存储: {document.id} -> {file_path}")
             return file_path
@@ -172,8 +325,6 @@ class FileStorageManager:
         Returns:
             存储的文件路径
         """
-        file_path = self._get_file_path(document.id, "processed")
-
         try:
             # 准备存储数据
             storage_data = {
@@ -202,10 +353,12 @@ class FileStorageManager:
             }
 
             # 写入文件
-            await self._write_json_file(file_path, storage_data)
+            file_path = await self._write_document(document.id, "processed", storage_data)
 
             # 更新索引
-            await self._update_processed_document_index(document)
+            await self._update_processed_document_index(
+                document, self._get_index_location("processed", file_path)
+            )
 
             logger.debug(f"处理后文档已存储: {document.id} -> {file_path}")
             return file_path
@@ -214,21 +367,65 @@ class FileStorageManager:
             logger.error(f"存储处理后文档失败 {document.id}: {e}")
             raise StorageError(f"存储处理后文档失败: {e}") from e
 
+    def _encode_payload(self, file_path: Path, data: Dict[str, Any]) -> bytes:
+        """按文件扩展名编码数据（未压缩）"""
+        if '.msgpack' in file_path.suffixes:
+            return _MSGPACK_ENCODER.encode(data)
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    def _decode_payload(self, file_path: Path, payload: bytes) -> Dict[str, Any]:
+        """按文件扩展名解码数据（已解压）"""
+        if '.msgpack' in file_path.suffixes:
+            if not MSGSPEC_AVAILABLE:
+                raise ImportError("msgspec is required to read msgpack files. Install with: pip install msgspec")
+            return _MSGPACK_DECODER.decode(payload)
+        return json.loads(payload.decode('utf-8'))
+
+    def _compress(self, file_path: Path, payload: bytes) -> bytes:
+        """按文件扩展名压缩数据
+
+        gzip 固定 mtime=0，使相同内容得到相同的压缩结果，便于备份去重。
+        """
+        if file_path.suffix == '.gz':
+            return gzip.compress(payload, compresslevel=GZIP_LEVEL, mtime=0)
+        if file_path.suffix == '.zst':
+            return self._zstd_compressor.compress(payload)
+        return payload
+
+    def _decompress(self, file_path: Path, payload: bytes) -> bytes:
+        """按文件扩展名解压数据"""
+        if file_path.suffix == '.gz':
+            return gzip.decompress(payload)
+        if file_path.suffix == '.zst':
+            if not ZSTD_AVAILABLE:
+                raise ImportError("zstandard is required to read zstd files. Install with: pip install zstandard")
+            return self._zstd_decompressor.decompress(payload)
+        return payload
+
+    @staticmethod
+    def _read_sync(file_path: Path) -> bytes:
+        """一次性读取文件全部内容（在工作线程中执行）"""
+        with open(file_path, 'rb') as f:
+            return f.read()
+
+    @staticmethod
+    def _write_sync(file_path: Path, payload: bytes) -> None:
+        """一次性写入文件全部内容（在工作线程中执行）"""
+        with open(file_path, 'wb') as f:
+            f.write(payload)
+
     async def _write_json_file(self, file_path: Path, data: Dict[str, Any]) -> None:
         """写入JSON文件
 
+        编码方式由文件扩展名决定：.msgpack 使用 msgpack 编码，
+        .gz / .zst 分别使用 gzip / zstd 压缩。
+
         Args:
             file_path: 文件路径
             data: 要写入的数据
         """
-        if self.enable_compression and file_path.suffix == '.gz':
-            async with aiofiles.open(file_path, 'wb') as f:
-                json_bytes = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
-                compressed_data = gzip.compress(json_bytes)
-                await f.write(compressed_data)
-        else:
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(data, ensure_ascii=False, indent=2))
+        payload = self._compress(file_path, self._encode_payload(file_path, data))
+        await asyncio.to_thread(self._write_sync, file_path, payload)
 
     async def _read_json_file(self, file_path: Path) -> Dict[str, Any]:
         """读取JSON文件
@@ -243,20 +440,164 @@ class FileStorageManager:
             raise FileNotFoundError(f"文件不存在: {file_path}")
 
         try:
-            if file_path.suffix == '.gz':
-                async with aiofiles.open(file_path, 'rb') as f:
-                    compressed_data = await f.read()
-                    json_bytes = gzip.decompress(compressed_data)
-                    return json.loads(json_bytes.decode('utf-8'))
-            else:
-                async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    return json.loads(content)
+            payload = await asyncio.to_thread(self._read_sync, file_path)
+            return self._decode_payload(file_path, self._decompress(file_path, payload))
         except json.JSONDecodeError as e:
             raise InvalidFileFormatError(f"无效的JSON格式: {file_path}") from e
         except Exception as e:
+            if MSGSPEC_AVAILABLE and isinstance(e, msgspec.DecodeError):
+                raise InvalidFileFormatError(f"无效的msgpack格式: {file_path}") from e
             raise StorageError(f"读取文件失败: {file_path}") from e
 
+    async def _write_document(self, document_id: Union[str, UUID], document_type: str,
+                              data: Dict[str, Any]) -> Path:
+        """按存储布局写入文档
+
+        Args:
+            document_id: 文档ID
+            document_type: 文档类型
+            data: 文档数据
+
+        Returns:
+            存储的文件路径（volume 布局下为卷文件路径）
+        """
+        volume_store = self._volume_stores.get(document_type.lower())
+        if volume_store is None:
+            file_path = self._get_file_path(document_id, document_type)
+            await self._write_json_file(file_path, data)
+            return file_path
+
+        blob_name = Path(f"{document_id}{self._get_document_suffix()}")
+        payload = self._compress(blob_name, self._encode_payload(blob_name, data))
+        return await asyncio.to_thread(volume_store.append, document_id, payload,
+                                       self._get_document_suffix())
+
+    def _get_index_location(self, document_type: str, file_path: Path) -> Path:
+        """文档索引中记录的存储位置
+
+        volume 布局下记录会在压缩时迁移到其他卷，索引只记录卷目录，
+        具体位置由卷索引维护（见 locate）。
+        """
+        if document_type.lower() in self._volume_stores:
+            return self.volume_dir / document_type.lower()
+        return file_path
+
+    async def _read_document(self, document_id: Union[str, UUID],
+                             document_type: str) -> Dict[str, Any]:
+        """按存储布局读取文档
+
+        volume 布局下未找到时回退到文件布局，以便读取迁移前的数据。
+
+        Args:
+            document_id: 文档ID
+            document_type: 文档类型
+
+        Returns:
+            文档数据
+        """
+        volume_store = self._volume_stores.get(document_type.lower())
+        if volume_store is not None:
+            record = await asyncio.to_thread(volume_store.read, document_id)
+            if record is not None:
+                payload, encoding = record
+                blob_name = Path(f"{document_id}{encoding}")
+                try:
+                    return self._decode_payload(blob_name, self._decompress(blob_name, payload))
+                except Exception as e:
+                    raise InvalidFileFormatError(f"无效的卷记录: {document_id}") from e
+
+        return await self._read_json_file(self._find_existing_file(document_id, document_type))
+
+    def locate(self, document_id: Union[str, UUID],
+               document_type: str = "raw") -> Optional[Tuple[int, int, int]]:
+        """查询文档在卷文件中的位置
+
+        Args:
+            document_id: 文档ID
+            document_type: 文档类型
+
+        Returns:
+            (volume_id, offset, size)，非 volume 布局或文档不存在时返回None
+        """
+        volume_store = self._volume_stores.get(document_type.lower())
+        if volume_store is None:
+            return None
+        return volume_store.locate(document_id)
+
+    async def compact_volumes(self) -> int:
+        """压缩已封存的卷文件，回收已删除文档占用的空间
+
+        Returns:
+            回收的卷文件数量
+        """
+        reclaimed = 0
+        for volume_store in self._volume_stores.values():
+            reclaimed += await asyncio.to_thread(volume_store.compact)
+        return reclaimed
+
+    def close(self) -> None:
+        """关闭存储管理器持有的卷文件和搜索索引，并持久化布隆过滤器"""
+        for volume_store in self._volume_stores.values():
+            volume_store.close()
+        self._search_index.close()
+
+        for document_type in list(self._bloom_dirty):
+            self._save_bloom_filter_sync(document_type)
+        self._bloom_filters.clear()
+        self._bloom_markers.clear()
+        self._bloom_dirty.clear()
+
+    async def train_compression_dictionary(self, sample_limit: int = 1000,
+                                           dict_size: int = ZSTD_DICT_SIZE) -> Path:
+        """使用已存储的原始文档训练zstd压缩字典
+
+        字典只训练一次并保存到索引目录；已训练过时直接返回字典路径，
+        避免更换字典后旧文件无法解压。
+
+        Args:
+            sample_limit: 最多使用的样本文档数量
+            dict_size: 字典大小（字节）
+
+        Returns:
+            字典文件路径
+        """
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is required for zstd compression. Install with: pip install zstandard")
+
+        if self.zstd_dict_path.exists():
+            logger.info(f"zstd字典已存在，跳过训练: {self.zstd_dict_path}")
+            return self.zstd_dict_path
+
+        volume_store = self._volume_stores.get("raw")
+        if volume_store is not None:
+            sample_ids = volume_store.list_document_ids(limit=sample_limit)
+        else:
+            sample_ids = [
+                file_path.name.split(".", 1)[0]
+                for file_path in self.raw_dir.rglob("*") if file_path.is_file()
+            ][:sample_limit]
+
+        sample_name = Path(f"sample{STORAGE_FORMATS[self.storage_format]}")
+        samples = []
+        for document_id in sample_ids:
+            try:
+                data = await self._read_document(document_id, "raw")
+            except StorageError as e:
+                logger.warning(f"读取训练样本失败 {document_id}: {e}")
+                continue
+            samples.append(self._encode_payload(sample_name, data))
+
+        try:
+            zstd_dict = zstandard.train_dictionary(dict_size, samples)
+        except zstandard.ZstdError as e:
+            raise StorageError(f"训练zstd字典失败（样本数: {len(samples)}）: {e}") from e
+
+        self.zstd_dict_path.write_bytes(zstd_dict.as_bytes())
+        self._load_zstd_dictionary()
+
+        logger.info(f"zstd字典训练完成: {self.zstd_dict_path}, 样本数: {len(samples)}")
+        return self.zstd_dict_path
+
     async def retrieve_raw_document(self, document_id: Union[str, UUID]) -> Optional[Dict[str, Any]]:
         """检索原始文档
 
@@ -266,10 +607,10 @@ class FileStorageManager:
         Returns:
             文档数据，如果不存在返回None
         """
-        file_path = self._get_file_path(document_id, "raw")
-
         try:
-            return await self._read_json_file(file_path)
+            if not await self._might_exist(document_id, "raw"):
+                return None
+            return await self._read_document(document_id, "raw")
         except FileNotFoundError:
             return None
         except Exception as e:
@@ -285,10 +626,10 @@ class FileStorageManager:
         Returns:
             文档数据，如果不存在返回None
         """
-        file_path = self._get_file_path(document_id, "processed")
-
         try:
-            return await self._read_json_file(file_path)
+            if not await self._might_exist(document_id, "processed"):
+                return None
+            return await self._read_document(document_id, "processed")
         except FileNotFoundError:
             return None
         except Exception as e:
@@ -305,11 +646,17 @@ class FileStorageManager:
         Returns:
             是否成功删除
         """
-        file_path = self._get_file_path(document_id, document_type)
+        volume_store = self._volume_stores.get(document_type.lower())
+        if volume_store is not None and await asyncio.to_thread(volume_store.delete, document_id):
+            await self._remove_from_index(document_id, document_type)
+            logger.debug(f"文档已删除: {document_id} -> {self.volume_dir / document_type.lower()}")
+            return True
+
+        file_path = self._find_existing_file(document_id, document_type)
 
         try:
             if file_path.exists():
-                await aiofiles.os.remove(file_path)
+                await asyncio.to_thread(os.remove, file_path)
 
                 # 从索引中移除
                 await self._remove_from_index(document_id, document_type)
@@ -324,52 +671,249 @@ class FileStorageManager:
             logger.error(f"删除文档失败 {document_id}: {e}")
             raise StorageError(f"删除文档失败: {e}") from e
 
-    async def _update_raw_document_index(self, document: RawDocument) -> None:
+    def _get_index_file(self, document_type: str) -> Optional[Path]:
+        """获取文档类型对应的索引快照文件"""
+        if document_type.lower() == 'raw':
+            return self.index_dir / "raw_documents_index.json"
+        elif document_type.lower() == 'processed':
+            return self.index_dir / "processed_documents_index.json"
+        return None
+
+    def _get_index_document_type(self, index_file: Path) -> str:
+        """获取索引快照文件对应的文档类型"""
+        return "raw" if index_file == self._get_index_file("raw") else "processed"
+
+    def _get_bloom_path(self, document_type: str) -> Path:
+        """获取布隆过滤器文件路径"""
+        return self.index_dir / f"{document_type.lower()}.bloom"
+
+    @staticmethod
+    def _bloom_marker(index_file: Path) -> Tuple[int, int, int]:
+        """索引快照和预写日志的状态标记
+
+        布隆过滤器持久化时记录该标记；加载时标记不一致说明索引在此之后
+        被修改过（如进程异常退出），需要从索引重建过滤器。
+        运行期间标记变化则说明有其他实例写入了同一索引。
+        """
+        try:
+            stat = index_file.stat()
+            snapshot_size, snapshot_mtime = stat.st_size, stat.st_mtime_ns
+        except OSError:
+            snapshot_size, snapshot_mtime = -1, -1
+        try:
+            wal_size = index_file.with_suffix(".wal").stat().st_size
+        except OSError:
+            wal_size = -1
+        return snapshot_size, snapshot_mtime, wal_size
+
+    def _save_bloom_filter_sync(self, document_type: str) -> None:
+        """持久化布隆过滤器
+
+        使用过滤器实际同步到的标记，而非当前索引状态：下次加载时从该标记起
+        重放预写日志补齐之后的写入；快照已被改写时按标记不一致重建。
+        """
+        bloom = self._bloom_filters.get(document_type)
+        if bloom is None:
+            return
+        bloom_path = self._get_bloom_path(document_type)
+        try:
+            if bloom.count > bloom.capacity:
+                # 超出容量后误判率上升，删除文件使下次打开时按实际文档数重建
+                bloom_path.unlink(missing_ok=True)
+            else:
+                bloom.save(bloom_path, self._bloom_markers[document_type])
+            self._bloom_dirty.discard(document_type)
+        except OSError as e:
+            logger.warning(f"保存布隆过滤器失败 {document_type}: {e}")
+
+    def _build_bloom_filter_sync(self, document_type: str) -> BloomFilter:
+        """扫描文档目录和卷索引，重建布隆过滤器
+
+        以实际存储的文档为准（而非文档索引），确保未登记到索引的旧文档也能被检索到。
+        """
+        doc_ids = []
+
+        document_dir = self.raw_dir if document_type == "raw" else self.processed_dir
+        stack = [str(document_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        doc_ids.append(entry.name.split(".", 1)[0])
+
+        volume_store = self._volume_stores.get(document_type)
+        if volume_store is not None:
+            doc_ids.extend(volume_store.list_document_ids())
+
+        bloom = BloomFilter(max(BLOOM_MIN_CAPACITY, 2 * len(doc_ids)), BLOOM_ERROR_RATE)
+        for doc_id in doc_ids:
+            bloom.add(doc_id.encode('utf-8'))
+        return bloom
+
+    def _sync_bloom_filter_sync(self, document_type: str, bloom: BloomFilter,
+                                marker: Tuple[int, int, int]) -> Optional[Tuple[int, int, int]]:
+        """将其他实例追加到预写日志的文档补充到过滤器
+
+        Args:
+            document_type: 文档类型
+            bloom: 布隆过滤器
+            marker: 过滤器当前同步到的标记
+
+        Returns:
+            新的同步标记；快照被改写或日志被截断（其他实例合并过索引）时
+            无法增量同步，返回None
+        """
+        index_file = self._get_index_file(document_type)
+        with self._index_file_lock(index_file, exclusive=False):
+            current = self._bloom_marker(index_file)
+            if current[:2] != marker[:2] or current[2] < marker[2]:
+                return None
+            if current == marker:
+                return current
+
+            offset = max(marker[2], 0)
+            with open(index_file.with_suffix(".wal"), 'rb') as f:
+                f.seek(offset)
+                tail = f.read(current[2] - offset)
+
+        for line in tail.splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record["op"] == "put":
+                bloom.add(record["id"].encode('utf-8'))
+        return current
+
+    def _advance_bloom_marker(self, index_file: Path, before: Tuple[int, int, int],
+                              after: Tuple[int, int, int]) -> None:
+        """本实例修改索引后推进过滤器的同步标记
+
+        修改前的标记与过滤器记录的一致时才推进；否则说明其间有其他实例写入，
+        保留旧标记，由下次未命中时补齐。
+        """
+        document_type = self._get_index_document_type(index_file)
+        if self._bloom_markers.get(document_type) == before:
+            self._bloom_markers[document_type] = after
+            self._bloom_dirty.add(document_type)
+
+    async def _get_bloom_filter(self, document_type: str) -> BloomFilter:
+        """获取文档类型对应的布隆过滤器
+
+        首次使用时加载持久化文件，并从保存时的标记起重放预写日志；
+        文件缺失或快照已被改写时根据已存储的文档重建，并立即持久化，
+        使后续进程无需再次扫描。加载在索引锁内完成，保证期间写入的文档不会遗漏。
+        """
+        document_type = document_type.lower()
+        bloom = self._bloom_filters.get(document_type)
+        if bloom is not None:
+            return bloom
+
+        async with self._index_lock:
+            bloom = self._bloom_filters.get(document_type)
+            if bloom is None:
+                marker = None
+                loaded = await asyncio.to_thread(BloomFilter.load, self._get_bloom_path(document_type))
+                if loaded is not None:
+                    bloom, saved_marker = loaded
+                    marker = await asyncio.to_thread(self._sync_bloom_filter_sync, document_type,
+                                                     bloom, saved_marker)
+                if marker is None:
+                    # 标记在扫描前取得：扫描期间的写入会使标记过期，而不会被遗漏
+                    marker = self._bloom_marker(self._get_index_file(document_type))
+                    bloom = await asyncio.to_thread(self._build_bloom_filter_sync, document_type)
+                    self._bloom_filters[document_type] = bloom
+                    self._bloom_markers[document_type] = marker
+                    await asyncio.to_thread(self._save_bloom_filter_sync, document_type)
+                    logger.debug(f"布隆过滤器已重建: {document_type}, 文档数: {bloom.count}")
+                else:
+                    self._bloom_filters[document_type] = bloom
+                    self._bloom_markers[document_type] = marker
+
+        return bloom
+
+    async def _might_exist(self, document_id: Union[str, UUID], document_type: str) -> bool:
+        """通过布隆过滤器判断文档是否可能存在（返回False时一定不存在）
+
+        过滤器只包含本实例写入或见过的文档。未命中时检查索引状态标记，
+        若索引已被其他实例修改，先从预写日志补齐再判断；无法补齐时视为可能存在，
+        并丢弃过滤器以便下次重新加载。
+        """
+        document_type = document_type.lower()
+        key = str(document_id).encode('utf-8')
+        bloom = await self._get_bloom_filter(document_type)
+        if key in bloom:
+            return True
+
+        index_file = self._get_index_file(document_type)
+        if self._bloom_marker(index_file) == self._bloom_markers.get(document_type):
+            return False
+
+        async with self._index_lock:
+            bloom = self._bloom_filters.get(document_type)
+            if bloom is None:
+                return True
+            marker = await asyncio.to_thread(self._sync_bloom_filter_sync, document_type, bloom,
+                                             self._bloom_markers[document_type])
+            if marker is None:
+                self._bloom_filters.pop(document_type, None)
+                self._bloom_markers.pop(document_type, None)
+                self._bloom_dirty.discard(document_type)
+                return True
+            self._bloom_markers[document_type] = marker
+            self._bloom_dirty.add(document_type)
+
+        return key in bloom
+
+    async def _update_raw_document_index(self, document: RawDocument, file_path: Path) -> None:
         """更新原始文档索引
 
         Args:
             document: 原始文档对象
+            file_path: 文档存储路径
         """
-        index_file = self.index_dir / "raw_documents_index.json"
-
-        index_data = await self._load_index_file(index_file)
-        index_data[str(document.id)] = {
-            "source_id": document.source_id,
-            "content_hash": document.content_hash,
-            "document_type": document.document_type.value,
-            "processing_status": document.processing_status.value,
-            "collected_at": document.collected_at.isoformat(),
-            "published_at": document.published_at.isoformat() if document.published_at else None,
-            "title": document.title,
-            "file_path": str(self._get_file_path(document.id, "raw")),
-            "indexed_at": datetime.utcnow().isoformat(),
-        }
-
-        await self._save_index_file(index_file, index_data)
+        await self._append_index(self._get_index_file("raw"), {
+            "op": "put",
+            "id": str(document.id),
+            "entry": {
+                "source_id": document.source_id,
+                "content_hash": document.content_hash,
+                "document_type": document.document_type.value,
+                "processing_status": document.processing_status.value,
+                "collected_at": document.collected_at.isoformat(),
+                "published_at": document.published_at.isoformat() if document.published_at else None,
+                "title": document.title,
+                "file_path": str(file_path),
+                "indexed_at": datetime.utcnow().isoformat(),
+            },
+        })
 
-    async def _update_processed_document_index(self, document: ProcessedDocument) -> None:
+    async def _update_processed_document_index(self, document: ProcessedDocument,
+                                               file_path: Path) -> None:
         """更新处理后文档索引
 
         Args:
             document: 处理后文档对象
+            file_path: 文档存储路径
         """
-        index_file = self.index_dir / "processed_documents_index.json"
-
-        index_data = await self._load_index_file(index_file)
-        index_data[str(document.id)] = {
-            "raw_document_id": str(document.raw_document_id),
-            "content_hash": document.content_hash,
-            "similarity_group_id": document.similarity_group_id,
-            "is_duplicate": document.is_duplicate,
-            "quality_score": document.quality_score,
-            "processed_at": document.processed_at.isoformat(),
-            "title": document.title,
-            "keywords": document.keywords,
-            "file_path": str(self._get_file_path(document.id, "processed")),
-            "indexed_at": datetime.utcnow().isoformat(),
-        }
-
-        await self._save_index_file(index_file, index_data)
+        await self._append_index(self._get_index_file("processed"), {
+            "op": "put",
+            "id": str(document.id),
+            "entry": {
+                "raw_document_id": str(document.raw_document_id),
+                "content_hash": document.content_hash,
+                "similarity_group_id": document.similarity_group_id,
+                "is_duplicate": document.is_duplicate,
+                "quality_score": document.quality_score,
+                "processed_at": document.processed_at.isoformat(),
+                "title": document.title,
+                "keywords": document.keywords,
+                "file_path": str(file_path),
+                "indexed_at": datetime.utcnow().isoformat(),
+            },
+        })
 
     async def _remove_from_index(self, document_id: Union[str, UUID], document_type: str) -> None:
         """从索引中移除文档
@@ -378,57 +922,221 @@ class FileStorageManager:
             document_id: 文档ID
             document_type: 文档类型
         """
-        doc_id_str = str(document_id)
+        index_file = self._get_index_file(document_type)
+        if index_file is None:
+            return
 
-        if document_type.lower() == 'raw':
-            index_file = self.index_dir / "raw_documents_index.json"
-        elif document_type.lower() == 'processed':
-            index_file = self.index_dir / "processed_documents_index.json"
-        else:
+        await self._append_index(index_file, {"op": "delete", "id": str(document_id)})
+
+    async def _append_index(self, index_file: Path, record: Dict[str, Any]) -> None:
+        """追加一条索引变更记录到预写日志（WAL）
+
+        每条记录占一行 JSON，插入开销为 O(1)。
+        日志记录数达到阈值时自动合并到索引快照。
+
+        Args:
+            index_file: 索引快照文件路径
+            record: 变更记录 ({"op": "put"|"delete", "id": ..., "entry": ...})
+        """
+        await self._update_search_index(index_file, record)
+        line = json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n"
+
+        async with self._index_lock:
+            before, after = self._append_wal_sync(index_file, line)
+
+            if record["op"] == "put":
+                document_type = self._get_index_document_type(index_file)
+                bloom = self._bloom_filters.get(document_type)
+                if bloom is not None:
+                    bloom.add(record["id"].encode('utf-8'))
+                    self._bloom_dirty.add(document_type)
+            self._advance_bloom_marker(index_file, before, after)
+
+            self._index_wal_counts[index_file] = self._index_wal_counts.get(index_file, 0) + 1
+            if self._index_wal_counts[index_file] >= INDEX_COMPACTION_THRESHOLD:
+                await self._compact_index_file(index_file)
+
+    @staticmethod
+    @contextmanager
+    def _index_file_lock(index_file: Path, exclusive: bool = True):
+        """索引的跨进程文件锁
+
+        同一目录可能被多个存储管理器（Web 应用、采集任务等进程）同时使用：
+        追加日志和合并快照持有排他锁，读取索引持有共享锁。
+        锁只在同步代码段内持有，不跨越 await。
+        """
+        if fcntl is None:
+            yield
             return
 
-        index_data = await self._load_index_file(index_file)
-        if doc_id_str in index_data:
-            del index_data[doc_id_str]
-            await self._save_index_file(index_file, index_data)
+        fd = os.open(index_file.with_suffix(".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
+
+    def _append_wal_sync(self, index_file: Path, line: bytes) -> Tuple[Tuple[int, int, int],
+                                                                      Tuple[int, int, int]]:
+        """在文件锁内以 O_APPEND 方式追加一条日志记录
+
+        每次追加都重新打开日志：其他实例合并索引并删除日志后，
+        新记录会写入新建的日志文件，而不会写进已被删除的旧文件。
+
+        Returns:
+            追加前后的索引状态标记
+        """
+        with self._index_file_lock(index_file):
+            before = self._bloom_marker(index_file)
+            fd = os.open(index_file.with_suffix(".wal"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                wal_size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            return before, (before[0], before[1], wal_size)
+
+    async def compact_index(self) -> None:
+        """将索引预写日志合并到快照文件并清空日志"""
+        async with self._index_lock:
+            for document_type in ("raw", "processed"):
+                await self._compact_index_file(self._get_index_file(document_type))
+
+    async def _compact_index_file(self, index_file: Path) -> None:
+        """合并单个索引的预写日志（调用方需持有索引锁）"""
+        markers = await asyncio.to_thread(self._compact_index_file_sync, index_file)
+        if markers is not None:
+            self._advance_bloom_marker(index_file, *markers)
+            # 合并后快照被改写，旧的持久化过滤器不再可用；随快照一并保存
+            document_type = self._get_index_document_type(index_file)
+            if self._bloom_markers.get(document_type) == markers[1]:
+                await asyncio.to_thread(self._save_bloom_filter_sync, document_type)
+            logger.debug(f"索引日志已合并: {index_file.with_suffix('.wal')} -> {index_file}")
+        self._index_wal_counts[index_file] = 0
+
+    def _compact_index_file_sync(self, index_file: Path) -> Optional[Tuple[Tuple[int, int, int],
+                                                                          Tuple[int, int, int]]]:
+        """在排他文件锁内合并预写日志
+
+        Returns:
+            合并前后的索引状态标记；没有待合并的日志时返回None
+        """
+        wal_file = index_file.with_suffix(".wal")
+        with self._index_file_lock(index_file):
+            if not wal_file.exists():
+                return None
+
+            before = self._bloom_marker(index_file)
+            self._save_index_file_sync(index_file, self._read_index_sync(index_file))
+            wal_file.unlink()
+            return before, self._bloom_marker(index_file)
 
     async def _load_index_file(self, index_file: Path) -> Dict[str, Any]:
         """加载索引文件
 
+        读取索引快照并重放预写日志，返回合并后的索引视图。
+
         Args:
             index_file: 索引文件路径
 
         Returns:
             索引数据
         """
-        if not index_file.exists():
-            return {}
+        return await asyncio.to_thread(self._load_index_file_sync, index_file)
+
+    def _load_index_file_sync(self, index_file: Path) -> Dict[str, Any]:
+        """在共享文件锁内读取索引，避免读到合并到一半的快照和日志"""
+        with self._index_file_lock(index_file, exclusive=False):
+            return self._read_index_sync(index_file)
+
+    def _read_index_sync(self, index_file: Path) -> Dict[str, Any]:
+        """读取索引快照并重放预写日志（调用方需持有文件锁）"""
+        index_data: Dict[str, Any] = {}
+
+        if index_file.exists():
+            try:
+                index_data = json.loads(self._read_sync(index_file))
+            except Exception as e:
+                logger.warning(f"加载索引文件失败 {index_file}: {e}")
+
+        wal_file = index_file.with_suffix(".wal")
+        if wal_file.exists():
+            for line in self._read_sync(wal_file).splitlines():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 写入中断导致的不完整记录
+                    logger.warning(f"跳过无效的索引日志记录: {wal_file}")
+                    continue
 
-        try:
-            async with aiofiles.open(index_file, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as e:
-            logger.warning(f"加载索引文件失败 {index_file}: {e}")
-            return {}
+                if record["op"] == "put":
+                    index_data[record["id"]] = record["entry"]
+                else:
+                    index_data.pop(record["id"], None)
 
-    async def _save_index_file(self, index_file: Path, data: Dict[str, Any]) -> None:
+        return index_data
+
+    def _save_index_file_sync(self, index_file: Path, data: Dict[str, Any]) -> None:
         """保存索引文件
 
+        先写入临时文件再原子替换，避免合并过程中断导致快照损坏。
+
         Args:
             index_file: 索引文件路径
             data: 索引数据
         """
         try:
-            async with aiofiles.open(index_file, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(data, ensure_ascii=False, indent=2))
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+            tmp_file = index_file.with_suffix(".json.tmp")
+            self._write_sync(tmp_file, payload)
+            os.replace(tmp_file, index_file)
         except Exception as e:
             logger.error(f"保存索引文件失败 {index_file}: {e}")
+            raise StorageError(f"保存索引文件失败: {e}") from e
+
+    @staticmethod
+    def _build_searchable_text(index_entry: Dict[str, Any]) -> str:
+        """由索引条目构建可搜索文本（标题、数据源、关键词）"""
+        return " ".join([
+            index_entry.get("title") or "",
+            index_entry.get("source_id") or "",
+            " ".join(index_entry.get("keywords") or []),
+        ]).lower()
+
+    async def _update_search_index(self, index_file: Path, record: Dict[str, Any]) -> None:
+        """将索引变更同步到全文搜索索引"""
+        if not self._search_index.available:
+            return
+
+        document_type = self._get_index_document_type(index_file)
+        if record["op"] == "put":
+            await asyncio.to_thread(self._search_index.upsert, record["id"], document_type,
+                                    self._build_searchable_text(record["entry"]))
+        else:
+            await asyncio.to_thread(self._search_index.remove, record["id"], document_type)
+
+    async def rebuild_search_index(self) -> None:
+        """根据文档索引重建全文搜索索引"""
+        if not self._search_index.available:
+            return
+
+        for document_type in ("raw", "processed"):
+            index_data = await self._load_index_file(self._get_index_file(document_type))
+            await asyncio.to_thread(self._search_index.upsert_many, [
+                (doc_id, document_type, self._build_searchable_text(doc_info))
+                for doc_id, doc_info in index_data.items()
+            ])
+        self._search_index.needs_rebuild = False
+
+        logger.info(f"全文搜索索引重建完成: {self._search_index.db_path}")
 
     async def search_documents(self, query: str, document_type: str = "raw",
                               limit: int = 100) -> List[Dict[str, Any]]:
         """搜索文档
 
+        在标题、数据源和关键词中进行不区分大小写的子串匹配。
+        优先使用全文搜索索引，不可用时回退到逐条扫描文档索引。
+
         Args:
             query: 搜索查询
             document_type: 文档类型
@@ -437,42 +1145,58 @@ class FileStorageManager:
         Returns:
             搜索结果列表
         """
-        if document_type.lower() == 'raw':
-            index_file = self.index_dir / "raw_documents_index.json"
-        elif document_type.lower() == 'processed':
-            index_file = self.index_dir / "processed_documents_index.json"
-        else:
+        index_file = self._get_index_file(document_type)
+        if index_file is None:
             return []
 
-        index_data = await self._load_index_file(index_file)
-        results = []
+        if self._search_index.available:
+            document_type = document_type.lower()
+            # 首次搜索时为升级前已有的文档补建搜索索引
+            if not self._search_index_checked:
+                self._search_index_checked = True
+                if (self._search_index.needs_rebuild or
+                        await asyncio.to_thread(self._search_index.count, document_type) == 0):
+                    await self.rebuild_search_index()
 
-        query_lower = query.lower()
+            doc_ids = await asyncio.to_thread(self._search_index.search, query, document_type, limit)
+        else:
+            index_data = await self._load_index_file(index_file)
+            query_lower = query.lower()
+            doc_ids = [
+                doc_id for doc_id, doc_info in index_data.items()
+                if query_lower in self._build_searchable_text(doc_info)
+            ]
 
-        for doc_id, doc_info in index_data.items():
-            # 简单的文本匹配搜索
-            searchable_text = " ".join([
-                doc_info.get("title", ""),
-                doc_info.get("source_id", ""),
-                " ".join(doc_info.get("keywords", [])),
-            ]).lower()
+        results = []
+        for doc_id in doc_ids:
+            # 加载完整文档数据
+            try:
+                doc_data = await self._read_document(doc_id, document_type)
+                results.append(doc_data)
+                if len(results) >= limit:
+                    break
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning(f"加载文档数据失败 {doc_id}: {e}")
 
-            if query_lower in searchable_text:
-                # 加载完整文档数据
-                try:
-                    if document_type.lower() == 'raw':
-                        doc_data = await self.retrieve_raw_document(doc_id)
-                    else:
-                        doc_data = await self.retrieve_processed_document(doc_id)
+        return results
 
-                    if doc_data:
-                        results.append(doc_data)
-                        if len(results) >= limit:
-                            break
-                except Exception as e:
-                    logger.warning(f"加载文档数据失败 {doc_id}: {e}")
+    @staticmethod
+    def _remove_files_older_than(directory: Path, cutoff: float) -> int:
+        """删除目录下修改时间早于 cutoff（时间戳）的文件
 
-        return results
+        Returns:
+            删除的文件数量
+        """
+        removed = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+                    logger.debug(f"已清理临时文件: {entry.path}")
+        return removed
 
     async def cleanup_temp_files(self, older_than_hours: int = 24) -> int:
         """清理临时文件
@@ -483,17 +1207,10 @@ class FileStorageManager:
         Returns:
             清理的文件数量
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=older_than_hours)
-        cleaned_count = 0
+        cutoff = time.time() - older_than_hours * 3600
 
         try:
-            for file_path in self.temp_dir.glob("*"):
-                if file_path.is_file():
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_time:
-                        await aiofiles.os.remove(file_path)
-                        cleaned_count += 1
-                        logger.debug(f"已清理临时文件: {file_path}")
+            cleaned_count = await asyncio.to_thread(self._remove_files_older_than, self.temp_dir, cutoff)
 
             logger.info(f"临时文件清理完成，共清理 {cleaned_count} 个文件")
             return cleaned_count
@@ -502,6 +1219,28 @@ class FileStorageManager:
             logger.error(f"清理临时文件失败: {e}")
             raise StorageError(f"清理临时文件失败: {e}") from e
 
+    @staticmethod
+    def _walk_size(path: Union[str, Path]) -> Tuple[int, int]:
+        """统计目录下的文件数量和总大小
+
+        使用 os.scandir 遍历，目录项自带文件类型和 stat 信息，无需逐个文件额外 stat。
+
+        Returns:
+            (文件数量, 总字节数)
+        """
+        total = 0
+        count = 0
+        stack = [str(path)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+                        count += 1
+        return count, total
+
     async def get_storage_stats(self) -> Dict[str, Any]:
         """获取存储统计信息
 
@@ -511,6 +1250,8 @@ class FileStorageManager:
         stats = {
             "base_directory": str(self.base_dir),
             "compression_enabled": self.enable_compression,
+            "compression_codec": self.compression_codec,
+            "layout": self.layout,
             "directories": {}
         }
 
@@ -521,19 +1262,15 @@ class FileStorageManager:
             ("indexes", self.index_dir),
             ("temp", self.temp_dir),
         ]
+        if self.layout == "volume":
+            directories.append(("volumes", self.volume_dir))
 
         total_size = 0
         total_files = 0
 
         for dir_name, dir_path in directories:
             if dir_path.exists():
-                file_count = 0
-                dir_size = 0
-
-                for file_path in dir_path.rglob("*"):
-                    if file_path.is_file():
-                        file_count += 1
-                        dir_size += file_path.stat().st_size
+                file_count, dir_size = await asyncio.to_thread(self._walk_size, dir_path)
 
                 stats["directories"][dir_name] = {
                     "path": str(dir_path),
@@ -553,9 +1290,36 @@ class FileStorageManager:
 
         return stats
 
+    @staticmethod
+    def _copy_file_sync(src: str, dst: str, st: os.stat_result) -> None:
+        """复制单个文件并保留时间戳
+
+        支持 copy_file_range 时在内核中完成拷贝，不经过用户态缓冲区；
+        平台或文件系统不支持时回退到 shutil.copyfile。
+        """
+        try:
+            if not hasattr(os, "copy_file_range"):
+                raise OSError("copy_file_range unavailable")
+            with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+                while os.copy_file_range(src_file.fileno(), dst_file.fileno(), BACKUP_CHUNK_SIZE):
+                    pass
+        except OSError:
+            shutil.copyfile(src, dst)
+
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    @classmethod
+    def _copy_directory_files_sync(cls, files: List[Tuple[str, str, os.stat_result]]) -> None:
+        """复制同一目录下的文件"""
+        for src, dst, st in files:
+            cls._copy_file_sync(src, dst, st)
+
     async def backup_storage(self, backup_path: Union[str, Path]) -> None:
         """备份存储数据
 
+        使用 os.scandir 遍历目录（复用目录项中的文件类型和 stat 信息），
+        各目录的文件拷贝在线程池中并发执行。
+
         Args:
             backup_path: 备份路径
         """
@@ -566,9 +1330,29 @@ class FileStorageManager:
 
         try:
             if backup_path.exists():
-                shutil.rmtree(backup_path)
-
-            shutil.copytree(self.base_dir, backup_path)
+                await asyncio.to_thread(shutil.rmtree, backup_path)
+
+            # 先创建目录结构并按目录收集待复制文件
+            batches = []
+            stack = [(str(self.base_dir), str(backup_path))]
+            while stack:
+                src_dir, dst_dir = stack.pop()
+                os.makedirs(dst_dir, exist_ok=True)
+
+                files = []
+                with os.scandir(src_dir) as entries:
+                    for entry in entries:
+                        dst = os.path.join(dst_dir, entry.name)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, dst))
+                        else:
+                            files.append((entry.path, dst, entry.stat()))
+                if files:
+                    batches.append(files)
+
+            await asyncio.gather(*(
+                asyncio.to_thread(self._copy_directory_files_sync, files) for files in batches
+            ))
             logger.info(f"存储数据备份完成: {backup_path}")
 
         except Exception as e:
@@ -581,25 +1365,39 @@ _storage_manager: Optional[FileStorageManager] = None
 
 
 def get_storage_manager(base_dir: Optional[Union[str, Path]] = None,
-                       enable_compression: Optional[bool] = None) -> FileStorageManager:
+                       enable_compression: Optional[bool] = None,
+                       storage_format: Optional[str] = None,
+                       compression_codec: Optional[str] = None,
+                       layout: Optional[str] = None) -> FileStorageManager:
     """获取全局存储管理器实例
 
     Args:
         base_dir: 基础存储目录，如果为None则使用配置中的目录
         enable_compression: 是否启用压缩，如果为None则使用默认值
+        storage_format: 文档存储格式，如果为None则使用配置中的格式
+        compression_codec: 压缩算法，如果为None则使用配置中的算法
+        layout: 存储布局，如果为None则使用配置中的布局
 
     Returns:
         存储管理器实例
     """
     global _storage_manager
     if _storage_manager is None:
-        if base_dir is None:
+        if None in (base_dir, storage_format, compression_codec, layout):
             from .config import get_config
             config = get_config()
-            base_dir = config.data_dir
+            if base_dir is None:
+                base_dir = config.data_dir
+            if storage_format is None:
+                storage_format = config.storage.filesystem_format
+            if compression_codec is None:
+                compression_codec = config.storage.filesystem_compression_codec
+            if layout is None:
+                layout = config.storage.filesystem_layout
 
         if enable_compression is None:
             enable_compression = True
 
-        _storage_manager = FileStorageManager(base_dir, enable_compression)
+        _storage_manager = FileStorageManager(base_dir, enable_compression, storage_format,
+                                              compression_codec, layout)
     return _storage_manager
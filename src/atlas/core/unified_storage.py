@@ -53,7 +53,10 @@ class UnifiedStorageInterface:
                 from atlas.core.storage import FileStorageManager
             return FileStorageManager(
                 base_dir=self.storage_config.filesystem_base_dir,
-                enable_compression=self.storage_config.filesystem_compression
+                enable_compression=self.storage_config.filesystem_compression,
+                storage_format=self.storage_config.filesystem_format,
+                compression_codec=self.storage_config.filesystem_compression_codec,
+                layout=self.storage_config.filesystem_layout
             )
 
         elif storage_type == 'minio':
@@ -0,0 +1,333 @@
+"""
+Atlas 卷文件存储模块
+
+将文档以追加写入的方式打包进少量大卷文件（volume），替代“一文档一文件”的布局。
+每条记录格式为 [uuid 16B][size 4B][flags 1B][payload]，
+文档位置 (volume_id, offset, size) 记录在 SQLite 索引表中。
+已封存的卷只读且不再增长，读取时通过 mmap 直接切片；活跃卷使用一次 pread。
+同一目录可被多个实例（进程）共享，写入、删除和压缩都在目录级文件锁内进行。
+"""
+
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 无 fcntl，卷文件锁退化为仅进程内互斥
+    fcntl = None
+
+
+# 记录头: uuid(16字节) + 负载大小(4字节) + 标志位(1字节)
+RECORD_HEADER = struct.Struct(">16sIB")
+
+# 记录标志位
+FLAG_TOMBSTONE = 0x01
+
+# 默认卷大小上限: 1 GiB
+DEFAULT_MAX_VOLUME_SIZE = 1024 * 1024 * 1024
+
+
+class VolumeStore:
+    """卷文件存储
+
+    负责：
+    - 维护当前活跃卷并追加写入记录
+    - 卷写满后封存并切换到新卷
+    - 维护 document_id -> (volume_id, offset, size) 索引
+    - 删除时写入墓碑记录，并通过压缩回收空间
+    """
+
+    def __init__(self, volume_dir: Union[str, Path],
+                 max_volume_size: int = DEFAULT_MAX_VOLUME_SIZE):
+        """初始化卷文件存储
+
+        Args:
+            volume_dir: 卷文件目录
+            max_volume_size: 单个卷文件大小上限（字节）
+        """
+        self.volume_dir = Path(volume_dir)
+        self.volume_dir.mkdir(parents=True, exist_ok=True)
+        self.max_volume_size = max_volume_size
+
+        self._lock = threading.RLock()
+        self._read_fds: Dict[int, int] = {}
+        self._volume_maps: Dict[int, mmap.mmap] = {}
+
+        self._index = sqlite3.connect(str(self.volume_dir / "volume_index.db"),
+                                      timeout=30, check_same_thread=False)
+        self._index.execute("""
+            CREATE TABLE IF NOT EXISTS cas_volume_index (
+                document_id TEXT PRIMARY KEY,
+                volume_id INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                encoding TEXT NOT NULL
+            )
+        """)
+        self._index.commit()
+
+        # 打开最新的卷作为活跃卷
+        volume_ids = self.list_volume_ids()
+        self._active_volume_id = volume_ids[-1] if volume_ids else 0
+        self._active_file = open(self.volume_path(self._active_volume_id), 'ab')
+
+    def volume_path(self, volume_id: int) -> Path:
+        """获取卷文件路径"""
+        return self.volume_dir / f"volume_{volume_id:06d}.dat"
+
+    def list_volume_ids(self) -> List[int]:
+        """列出所有卷ID（升序）"""
+        return sorted(
+            int(path.stem.split("_", 1)[1])
+            for path in self.volume_dir.glob("volume_*.dat")
+        )
+
+    @property
+    def active_volume_id(self) -> int:
+        """当前活跃卷ID"""
+        return self._active_volume_id
+
+    @contextmanager
+    def _write_lock(self):
+        """卷目录的跨进程写锁
+
+        追加记录与更新卷索引、删除和压缩都在锁内完成，
+        其他实例写入的记录不会与本实例的偏移量冲突。
+        """
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            fd = os.open(self.volume_dir / "volume.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                self._sync_active_volume()
+                yield
+            finally:
+                os.close(fd)
+
+    def _switch_active_volume(self, volume_id: int) -> None:
+        """切换活跃卷"""
+        self._active_file.close()
+        self._active_volume_id = volume_id
+        self._active_file = open(self.volume_path(volume_id), 'ab')
+
+    def _sync_active_volume(self) -> None:
+        """切换到其他实例封存后创建的最新卷（调用方需持有写锁）"""
+        next_volume_id = self._active_volume_id + 1
+        if self.volume_path(next_volume_id).exists():
+            while self.volume_path(next_volume_id + 1).exists():
+                next_volume_id += 1
+            self._switch_active_volume(next_volume_id)
+
+    def _seal_active_volume(self) -> None:
+        """封存活跃卷并创建新卷"""
+        self._switch_active_volume(self._active_volume_id + 1)
+        logger.info(f"卷已封存，切换到新卷: {self.volume_path(self._active_volume_id)}")
+
+    def _active_volume_size(self) -> int:
+        """活跃卷的当前大小（包含其他实例追加的记录）"""
+        return os.fstat(self._active_file.fileno()).st_size
+
+    def _append_record(self, document_id: Union[str, UUID], payload: bytes,
+                       flags: int = 0) -> Tuple[int, int, int]:
+        """追加一条记录到活跃卷（调用方需持有写锁）
+
+        Returns:
+            (volume_id, offset, size)
+        """
+        record_size = RECORD_HEADER.size + len(payload)
+        offset = self._active_volume_size()
+        if offset > 0 and offset + record_size > self.max_volume_size:
+            self._seal_active_volume()
+            offset = self._active_volume_size()
+
+        header = RECORD_HEADER.pack(UUID(str(document_id)).bytes, len(payload), flags)
+        self._active_file.write(header + payload)
+        self._active_file.flush()
+
+        return self._active_volume_id, offset, len(payload)
+
+    def append(self, document_id: Union[str, UUID], payload: bytes, encoding: str) -> Path:
+        """写入文档
+
+        Args:
+            document_id: 文档ID
+            payload: 已编码（及压缩）的文档数据
+            encoding: 数据编码扩展名，如 .json.gz
+
+        Returns:
+            写入的卷文件路径
+        """
+        with self._write_lock():
+            volume_id, offset, size = self._append_record(document_id, payload)
+            self._index.execute(
+                "INSERT OR REPLACE INTO cas_volume_index VALUES (?, ?, ?, ?, ?)",
+                (str(document_id), volume_id, offset, size, encoding)
+            )
+            self._index.commit()
+            return self.volume_path(volume_id)
+
+    def locate(self, document_id: Union[str, UUID]) -> Optional[Tuple[int, int, int]]:
+        """查询文档位置
+
+        Args:
+            document_id: 文档ID
+
+        Returns:
+            (volume_id, offset, size)，不存在时返回None
+        """
+        with self._lock:
+            row = self._index.execute(
+                "SELECT volume_id, offset, size FROM cas_volume_index WHERE document_id = ?",
+                (str(document_id),)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def list_document_ids(self, limit: Optional[int] = None) -> List[str]:
+        """列出已存储的文档ID
+
+        Args:
+            limit: 最多返回的数量
+
+        Returns:
+            文档ID列表
+        """
+        with self._lock:
+            rows = self._index.execute(
+                "SELECT document_id FROM cas_volume_index LIMIT ?",
+                (-1 if limit is None else limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _get_read_fd(self, volume_id: int) -> int:
+        """获取卷文件的只读描述符（缓存复用）"""
+        fd = self._read_fds.get(volume_id)
+        if fd is None:
+            fd = os.open(self.volume_path(volume_id), os.O_RDONLY)
+            self._read_fds[volume_id] = fd
+        return fd
+
+    def _get_volume_map(self, volume_id: int) -> mmap.mmap:
+        """获取已封存卷的只读内存映射（首次访问时建立）"""
+        volume_map = self._volume_maps.get(volume_id)
+        if volume_map is None:
+            volume_map = mmap.mmap(self._get_read_fd(volume_id), 0, prot=mmap.PROT_READ)
+            self._volume_maps[volume_id] = volume_map
+        return volume_map
+
+    def _read_payload(self, volume_id: int, offset: int, size: int) -> bytes:
+        """读取记录负载"""
+        start = offset + RECORD_HEADER.size
+        if volume_id < self._active_volume_id:
+            return self._get_volume_map(volume_id)[start:start + size]
+        return os.pread(self._get_read_fd(volume_id), size, start)
+
+    def read(self, document_id: Union[str, UUID]) -> Optional[Tuple[bytes, str]]:
+        """读取文档
+
+        Args:
+            document_id: 文档ID
+
+        Returns:
+            (payload, encoding)，不存在时返回None
+        """
+        with self._lock:
+            row = self._index.execute(
+                "SELECT volume_id, offset, size, encoding FROM cas_volume_index WHERE document_id = ?",
+                (str(document_id),)
+            ).fetchone()
+            if row is None:
+                return None
+
+            volume_id, offset, size, encoding = row
+            return self._read_payload(volume_id, offset, size), encoding
+
+    def delete(self, document_id: Union[str, UUID]) -> bool:
+        """删除文档（写入墓碑记录）
+
+        Args:
+            document_id: 文档ID
+
+        Returns:
+            是否删除成功
+        """
+        with self._write_lock():
+            cursor = self._index.execute(
+                "DELETE FROM cas_volume_index WHERE document_id = ?", (str(document_id),)
+            )
+            if cursor.rowcount == 0:
+                self._index.commit()
+                return False
+
+            self._append_record(document_id, b"", FLAG_TOMBSTONE)
+            self._index.commit()
+            return True
+
+    def compact(self) -> int:
+        """压缩已封存的卷，回收已删除或被覆盖记录占用的空间
+
+        将封存卷中仍然有效的记录迁移到活跃卷，然后删除旧卷文件。
+
+        Returns:
+            回收的卷文件数量
+        """
+        reclaimed = 0
+
+        with self._write_lock():
+            for volume_id in self.list_volume_ids():
+                if volume_id >= self._active_volume_id:
+                    continue
+
+                volume_path = self.volume_path(volume_id)
+                live_rows = self._index.execute(
+                    "SELECT document_id, offset, size, encoding FROM cas_volume_index WHERE volume_id = ?",
+                    (volume_id,)
+                ).fetchall()
+                live_bytes = sum(RECORD_HEADER.size + size for _, _, size, _ in live_rows)
+                if live_bytes >= volume_path.stat().st_size:
+                    continue
+
+                for document_id, offset, size, encoding in live_rows:
+                    payload = self._read_payload(volume_id, offset, size)
+                    new_volume_id, new_offset, new_size = self._append_record(document_id, payload)
+                    self._index.execute(
+                        "UPDATE cas_volume_index SET volume_id = ?, offset = ?, size = ? WHERE document_id = ?",
+                        (new_volume_id, new_offset, new_size, document_id)
+                    )
+                self._index.commit()
+
+                volume_map = self._volume_maps.pop(volume_id, None)
+                if volume_map is not None:
+                    volume_map.close()
+                fd = self._read_fds.pop(volume_id, None)
+                if fd is not None:
+                    os.close(fd)
+                volume_path.unlink()
+                reclaimed += 1
+                logger.info(f"卷压缩完成: {volume_path}, 迁移记录 {len(live_rows)} 条")
+
+        return reclaimed
+
+    def close(self) -> None:
+        """关闭卷文件和索引"""
+        with self._lock:
+            for volume_map in self._volume_maps.values():
+                volume_map.close()
+            self._volume_maps.clear()
+            for fd in self._read_fds.values():
+                os.close(fd)
+            self._read_fds.clear()
+            self._active_file.close()
+            self._index.close()
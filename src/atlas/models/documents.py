@@ -8,6 +8,7 @@ Atlas 数据模型定义
 - 任务状态模型
 """
 
+import hashlib
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
@@ -100,7 +101,6 @@ class RawDocument(BaseDocument):
     def generate_content_hash(cls, v, values):
         """如果没有提供哈希值，根据内容生成"""
         if v is None and 'raw_content' in values:
-            import hashlib
             content = values['raw_content']
             return hashlib.sha256(content.encode('utf-8')).hexdigest()
         return v
@@ -149,7 +149,6 @@ class ProcessedDocument(BaseDocument):
 
             if content_parts:
                 combined_content = ' '.join(content_parts)
-                import hashlib
                 return hashlib.sha256(combined_content.encode('utf-8')).hexdigest()
         return v
 
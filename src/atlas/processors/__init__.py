@@ -4,8 +4,8 @@
 提供HTML解析、文本清理、去重和数据验证功能。
 """
 
-from .parser import HTMLParser, ContentExtractor
-from .normalizer import TextNormalizer, ContentStandardizer
+from .parser import HTMLParser, ContentExtractor, get_html_parser
+from .normalizer import TextNormalizer, ContentStandardizer, get_text_normalizer
 from .dedup_base import ContentDeduplicator, HashStrategy
 from .validator import ContentValidator, ValidationRule
 
@@ -13,10 +13,12 @@ __all__ = [
     # 解析器
     'HTMLParser',
     'ContentExtractor',
+    'get_html_parser',
 
     # 标准化器
     'TextNormalizer',
     'ContentStandardizer',
+    'get_text_normalizer',
 
     # 去重器
     'ContentDeduplicator',
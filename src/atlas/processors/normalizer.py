@@ -15,6 +15,26 @@ from atlas.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 常见的编码错误及其修复
+_ENCODING_FIXES = {
+    'Ã©': 'é', 'Ã¨': 'è', 'Ãª': 'ê', 'Ã«': 'ë',
+    'Ã ': 'à', 'Ã¢': 'â', 'Ã¤': 'ä', 'Ã£': 'ã',
+    'Ãº': 'ú', 'Ã¹': 'ù', 'Ã»': 'û', 'Ã¼': 'ü',
+    'Ã³': 'ó', 'Ã²': 'ò', 'Ã´': 'ô', 'Ã¶': 'ö', 'Ãµ': 'õ',
+    'Ã­': 'í', 'Ã¬': 'ì', 'Ã®': 'î', 'Ã¯': 'ï',
+    'Ã±': 'ñ', 'Ã§': 'ç', 'Ã¿': 'ÿ', 'Ã½': 'ý',
+    'â‚¬': '"', 'â€™': "'", 'â€œ': '"',
+    'â€¦': '...', 'â€“': '–', 'â€”': '—'
+}
+# 按长度降序排列，保证较长的序列优先匹配
+_ENCODING_FIX_RE = re.compile('|'.join(
+    re.escape(wrong) for wrong in sorted(_ENCODING_FIXES, key=len, reverse=True)
+))
+# 每行开头和结尾的空白
+_LINE_EDGE_WHITESPACE_RE = re.compile(r'^[ \t]+|[ \t]+$', re.MULTILINE)
+_NEWLINES_RE = re.compile(r'\n+')
+_SPACES_RE = re.compile(r' +')
+
 
 @dataclass
 class NormalizationConfig:
@@ -89,6 +109,14 @@ class TextNormalizer:
             'email_pattern': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
         }
 
+        # 标点规则合并为一个命名分组交替正则，单次扫描后按分组名分派替换；
+        # 连续重复的 .!? 直接折叠为单个字符，已涵盖 multiple_* 三条规则的结果
+        self._punctuation_re = re.compile('|'.join((
+            f"(?P<fancy_quotes>{self.patterns['fancy_quotes'].pattern})",
+            f"(?P<various_dashes>{self.patterns['various_dashes'].pattern})",
+            r'(?P<repeated_punctuation>(?P<mark>[.!?])(?P=mark)+)',
+        )))
+
     def normalize(self, text: str) -> str:
         """
         标准化文本
@@ -146,23 +174,8 @@ class TextNormalizer:
 
     def _fix_encoding_issues(self, text: str) -> str:
         """修复常见的编码问题"""
-        # 修复常见的编码错误
-        encoding_fixes = {
-            'Ã©': 'é', 'Ã¨': 'è', 'Ãª': 'ê', 'Ã«': 'ë',
-            'Ã ': 'à', 'Ã¢': 'â', 'Ã¤': 'ä', 'Ã£': 'ã',
-            'Ãº': 'ú', 'Ã¹': 'ù', 'Ã»': 'û', 'Ã¼': 'ü',
-            'Ã³': 'ó', 'Ã²': 'ò', 'Ã´': 'ô', 'Ã¶': 'ö', 'Ãµ': 'õ',
-            'Ã­': 'í', 'Ã¬': 'ì', 'Ã®': 'î', 'Ã¯': 'ï',
-            'Ã±': 'ñ', 'Ã§': 'ç', 'Ã¿': 'ÿ', 'Ã½': 'ý',
-            'â‚¬': '"', 'â€™': "'", 'â€œ': '"',
-            'â€¦': '...', 'â€“': '–', 'â€”': '—'
-        }
-
-        fixed_text = text
-        for wrong, correct in encoding_fixes.items():
-            fixed_text = fixed_text.replace(wrong, correct)
-
-        return fixed_text
+        # 所有错误编码序列合并为一个正则，单次扫描完成替换
+        return _ENCODING_FIX_RE.sub(lambda m: _ENCODING_FIXES[m.group()], text)
 
     def _normalize_unicode(self, text: str) -> str:
         """Unicode标准化"""
@@ -182,36 +195,31 @@ class TextNormalizer:
 
     def _normalize_punctuation(self, text: str) -> str:
         """标准化标点符号"""
-        normalized = text
-
-        # 标准化引号
-        if self.config.normalize_quotes:
-            normalized = self.patterns['fancy_quotes'].sub(
-                lambda m: '"' if m.group() in ['"', '"'] else "'",
-                normalized
-            )
+        return self._punctuation_re.sub(self._replace_punctuation, text)
 
-        # 标准化破折号
-        if self.config.normalize_dashes:
-            normalized = self.patterns['various_dashes'].sub('-', normalized)
+    def _replace_punctuation(self, match: re.Match) -> str:
+        """按匹配的分组替换标点符号"""
+        kind = match.lastgroup
 
         # 清理重复的标点符号
-        normalized = self.patterns['multiple_periods'].sub('...', normalized)
-        normalized = self.patterns['multiple_exclamations'].sub('!!!', normalized)
-        normalized = self.patterns['multiple_questions'].sub('???', normalized)
-        normalized = self.patterns['repeated_punctuation'].sub(r'\1', normalized)
+        if kind == 'repeated_punctuation':
+            return match.group('mark')
 
-        return normalized
+        # 标准化引号
+        if kind == 'fancy_quotes':
+            if not self.config.normalize_quotes:
+                return match.group()
+            return '"' if match.group() in ['"', '"'] else "'"
+
+        # 标准化破折号
+        return '-' if self.config.normalize_dashes else match.group()
 
     def _clean_whitespace(self, text: str) -> str:
         """清理空白字符"""
         cleaned = text
 
         # 移除每行开头和结尾的空白
-        lines = cleaned.split('\n')
-        lines = [self.patterns['leading_whitespace'].sub('', line) for line in lines]
-        lines = [self.patterns['trailing_whitespace'].sub('', line) for line in lines]
-        cleaned = '\n'.join(lines)
+        cleaned = _LINE_EDGE_WHITESPACE_RE.sub('', cleaned)
 
         # 标准化空格
         cleaned = self.patterns['multiple_spaces'].sub(' ', cleaned)
@@ -248,9 +256,9 @@ class TextNormalizer:
         for paragraph in paragraphs:
             if paragraph.strip():
                 # 移除段落内的多余换行
-                paragraph = re.sub(r'\n+', ' ', paragraph)
+                paragraph = _NEWLINES_RE.sub(' ', paragraph)
                 # 标准化空格
-                paragraph = re.sub(r' +', ' ', paragraph)
+                paragraph = _SPACES_RE.sub(' ', paragraph)
                 formatted_paragraphs.append(paragraph.strip())
 
         return '\n\n'.join(formatted_paragraphs)
@@ -544,4 +552,16 @@ class ContentStandardizer:
 
         # 按频率排序并返回前N个
         sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in sorted_words[:max_keywords]]
\ No newline at end of file
+        return [word for word, freq in sorted_words[:max_keywords]]
+
+
+# 全局默认文本标准化器实例（默认配置下只读，可在各组件间共享）
+_text_normalizer: Optional[TextNormalizer] = None
+
+
+def get_text_normalizer() -> TextNormalizer:
+    """获取使用默认配置的全局文本标准化器（单例模式）"""
+    global _text_normalizer
+    if _text_normalizer is None:
+        _text_normalizer = TextNormalizer()
+    return _text_normalizer
@@ -6,25 +6,40 @@ HTML内容解析器
 
 import re
 import html
+import functools
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urljoin, urlparse
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from pathlib import Path
 
 try:
     from bs4 import BeautifulSoup, Tag, NavigableString
     from bs4.element import Comment
+    import soupsieve
     BS4_AVAILABLE = True
 except ImportError:
     BS4_AVAILABLE = False
     BeautifulSoup = None
 
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 from atlas.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_selector(selector: str):
+    """编译CSS选择器（按选择器字符串缓存）"""
+    return soupsieve.compile(selector)
+
+
 @dataclass
 class ExtractedContent:
     """提取的内容数据结构"""
@@ -92,10 +107,20 @@ class SelectorConfig:
                 'aside', '.sidebar', '.advertisement', '.ads'
             ]
 
+    def cache_key(self) -> Tuple[Tuple[str, ...], ...]:
+        """返回当前选择器配置的快照，用作解析结果缓存键"""
+        return tuple(tuple(selectors or ()) for selectors in astuple(self))
+
 
 class HTMLParser:
     """HTML解析器"""
 
+    # 显式指定解析器，避免 BeautifulSoup 自动探测
+    _bs_parser = "lxml" if LXML_AVAILABLE else "html.parser"
+
+    # 每个解析器实例缓存的解析结果数量
+    PARSE_CACHE_SIZE = 32
+
     def __init__(self, config: Optional[SelectorConfig] = None):
         """
         初始化HTML解析器
@@ -108,6 +133,9 @@ class HTMLParser:
 
         self.config = config or SelectorConfig()
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
+        # 解析结果只取决于 HTML 内容和选择器配置，缓存键同时包含两者，
+        # 修改 self.config 后旧结果不会再被命中
+        self._parse_cache: "OrderedDict[Tuple[str, Tuple], ExtractedContent]" = OrderedDict()
 
     def parse(self, html_content: str, base_url: Optional[str] = None) -> ExtractedContent:
         """
@@ -120,24 +148,40 @@ class HTMLParser:
         Returns:
             提取的内容
         """
+        key = (html_content, self.config.cache_key())
+        content = self._parse_cache.get(key)
+        if content is None:
+            content = self._parse_uncached(html_content)
+            self._parse_cache[key] = content
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        else:
+            self._parse_cache.move_to_end(key)
+
+        return self._copy_with_base_url(content, base_url)
+
+    def _parse_uncached(self, html_content: str) -> ExtractedContent:
+        """解析HTML内容（不解析相对链接）"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, features=self._bs_parser)
 
             # 移除不需要的元素
             self._remove_excluded_elements(soup)
 
             # 提取内容
             content = ExtractedContent()
+            # meta 标签只遍历一次，摘要、标签和元数据共用
+            meta_tags = soup.find_all('meta')
 
             content.title = self._extract_title(soup)
             content.content = self._extract_content(soup)
-            content.summary = self._extract_summary(soup, content.content)
+            content.summary = self._extract_summary(soup, content.content, meta_tags)
             content.author = self._extract_author(soup)
             content.publish_date = self._extract_date(soup)
-            content.tags = self._extract_tags(soup)
-            content.images = self._extract_images(soup, base_url)
-            content.links = self._extract_links(soup, base_url)
-            content.metadata = self._extract_metadata(soup)
+            content.tags = self._extract_tags(soup, meta_tags)
+            content.images = self._extract_images(soup)
+            content.links = self._extract_links(soup)
+            content.metadata = self._extract_metadata(soup, meta_tags)
 
             # 清理和标准化
             self._clean_content(content)
@@ -149,16 +193,61 @@ class HTMLParser:
             self.logger.error(f"Failed to parse HTML content: {e}")
             return ExtractedContent()
 
+    @staticmethod
+    def _copy_with_base_url(content: ExtractedContent, base_url: Optional[str]) -> ExtractedContent:
+        """复制缓存的解析结果，并按 base_url 解析相对链接"""
+        def resolve(url: str) -> str:
+            if base_url and not url.startswith(('http://', 'https://')):
+                return urljoin(base_url, url)
+            return url
+
+        images = []
+        for image in content.images:
+            image = dict(image)
+            image['src'] = resolve(image['src'])
+            images.append(image)
+
+        links = []
+        for link in content.links:
+            link = dict(link)
+            link['href'] = resolve(link['href'])
+            links.append(link)
+
+        return ExtractedContent(
+            title=content.title,
+            content=content.content,
+            summary=content.summary,
+            author=content.author,
+            publish_date=content.publish_date,
+            tags=list(content.tags),
+            images=images,
+            links=links,
+            metadata=dict(content.metadata)
+        )
+
     def _remove_excluded_elements(self, soup: BeautifulSoup) -> None:
-        """移除不需要的HTML元素"""
-        for selector in self.config.exclude_selectors:
-            for element in soup.select(selector):
+        """移除不需要的HTML元素（所有排除选择器合并为一次遍历）"""
+        if not self.config.exclude_selectors:
+            return
+
+        selector = ", ".join(self.config.exclude_selectors)
+        for element in _compile_selector(selector).select(soup):
+            # 祖先元素已被移除时，后代元素已随之销毁
+            if not element.decomposed:
                 element.decompose()
 
+    @staticmethod
+    def _find_meta(meta_tags: List[Tag], attr: str, value: str) -> Optional[Tag]:
+        """在已收集的meta标签中查找第一个属性匹配的标签"""
+        for meta in meta_tags:
+            if meta.get(attr) == value:
+                return meta
+        return None
+
     def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
         """提取标题"""
         for selector in self.config.title_selectors:
-            elements = soup.select(selector)
+            elements = _compile_selector(selector).select(soup)
             for element in elements:
                 title = self._get_text(element).strip()
                 if title and len(title) > 5:  # 确保标题有意义
@@ -177,7 +266,7 @@ class HTMLParser:
     def _extract_content(self, soup: BeautifulSoup) -> Optional[str]:
         """提取主要内容"""
         for selector in self.config.content_selectors:
-            elements = soup.select(selector)
+            elements = _compile_selector(selector).select(soup)
             for element in elements:
                 content = self._extract_text_from_element(element)
                 if content and len(content.strip()) > 100:  # 确保内容足够长
@@ -191,15 +280,19 @@ class HTMLParser:
         # 最后回退到整个文档
         return self._extract_text_from_element(soup).strip()
 
-    def _extract_summary(self, soup: BeautifulSoup, content: Optional[str]) -> Optional[str]:
+    def _extract_summary(self, soup: BeautifulSoup, content: Optional[str],
+                         meta_tags: Optional[List[Tag]] = None) -> Optional[str]:
         """提取摘要"""
+        if meta_tags is None:
+            meta_tags = soup.find_all('meta')
+
         # 尝试从meta标签获取摘要
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc = self._find_meta(meta_tags, 'name', 'description')
         if meta_desc and meta_desc.get('content'):
             return html.unescape(meta_desc.get('content').strip())
 
         # 尝试从Open Graph获取
-        og_desc = soup.find('meta', attrs={'property': 'og:description'})
+        og_desc = self._find_meta(meta_tags, 'property', 'og:description')
         if og_desc and og_desc.get('content'):
             return html.unescape(og_desc.get('content').strip())
 
@@ -218,7 +311,7 @@ class HTMLParser:
     def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
         """提取作者"""
         for selector in self.config.author_selectors:
-            elements = soup.select(selector)
+            elements = _compile_selector(selector).select(soup)
             for element in elements:
                 if element.name == 'meta':
                     author = element.get('content')
@@ -237,7 +330,7 @@ class HTMLParser:
     def _extract_date(self, soup: BeautifulSoup) -> Optional[str]:
         """提取发布日期"""
         for selector in self.config.date_selectors:
-            elements = soup.select(selector)
+            elements = _compile_selector(selector).select(soup)
             for element in elements:
                 date_str = None
 
@@ -259,19 +352,21 @@ class HTMLParser:
 
         return None
 
-    def _extract_tags(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_tags(self, soup: BeautifulSoup, meta_tags: Optional[List[Tag]] = None) -> List[str]:
         """提取标签"""
+        if meta_tags is None:
+            meta_tags = soup.find_all('meta')
         tags = set()
 
         for selector in self.config.tag_selectors:
-            elements = soup.select(selector)
+            elements = _compile_selector(selector).select(soup)
             for element in elements:
                 tag_text = self._get_text(element).strip()
                 if tag_text and len(tag_text) < 50:  # 标签通常不会很长
                     tags.add(html.unescape(tag_text))
 
         # 从meta keywords提取
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+        meta_keywords = self._find_meta(meta_tags, 'name', 'keywords')
         if meta_keywords and meta_keywords.get('content'):
             keywords = [tag.strip() for tag in meta_keywords.get('content').split(',')]
             tags.update([html.unescape(tag) for tag in keywords if len(tag.strip()) > 0])
@@ -337,12 +432,13 @@ class HTMLParser:
 
         return links
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_metadata(self, soup: BeautifulSoup, meta_tags: Optional[List[Tag]] = None) -> Dict[str, Any]:
         """提取元数据"""
         metadata = {}
 
         # 提取所有meta标签
-        meta_tags = soup.find_all('meta')
+        if meta_tags is None:
+            meta_tags = soup.find_all('meta')
         for meta in meta_tags:
             name = meta.get('name') or meta.get('property')
             content = meta.get('content')
@@ -516,4 +612,16 @@ class ContentExtractor:
             html_content = f.read()
 
         extractor = ContentExtractor.create_extractor(site_type)
-        return extractor.parse(html_content)
\ No newline at end of file
+        return extractor.parse(html_content)
+
+
+# 全局默认HTML解析器实例（默认配置下只读，可在各组件间共享）
+_html_parser: Optional[HTMLParser] = None
+
+
+def get_html_parser() -> HTMLParser:
+    """获取使用默认配置的全局HTML解析器（单例模式）"""
+    global _html_parser
+    if _html_parser is None:
+        _html_parser = HTMLParser()
+    return _html_parser
@@ -350,7 +350,7 @@ class AtlasAPI:
             logger.debug(f"Python路径已添加")
 
             # 创建采集配置
-            collection_config = CollectionConfig()
+            collection_config = CollectionConfig.from_env()
             collection_config.rate_limit_delay = 1  # 设置较短的等待时间
             factory = CollectorFactory()
 
@@ -559,7 +559,7 @@ class AtlasAPI:
         }
 
         # 创建采集器
-        collection_config = CollectionConfig()
+        collection_config = CollectionConfig.from_env()
         collection_config.rate_limit_delay = 1  # 设置较短的等待时间
         factory = CollectorFactory()
         collector = factory.create_collector_with_config(source_dict, collection_config)
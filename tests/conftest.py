@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 # 导入测试配置
 from tests.test_config import TEST_CONFIG
+from atlas.core.config import SafeDumper
 
 
 @pytest.fixture(scope="session")
@@ -44,7 +45,7 @@ def test_config_dir():
     }
 
     with open(temp_dir / "config.yaml", "w", encoding='utf-8') as f:
-        yaml.dump(config_content, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(config_content, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
 
     # 创建数据源配置
     sources_content = {
@@ -62,7 +63,7 @@ def test_config_dir():
     }
 
     with open(temp_dir / "sources.yaml", "w", encoding='utf-8') as f:
-        yaml.dump(sources_content, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(sources_content, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
 
     yield temp_dir
 
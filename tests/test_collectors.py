@@ -87,6 +87,28 @@ class TestHTTPClient:
         assert response is None
         assert client.stats['failed_requests'] == 1
 
+    @pytest.mark.asyncio
+    async def test_http_client_async_request(self, mock_config, request_config):
+        """测试异步请求"""
+        import httpx
+
+        client = HTTPClient(mock_config, request_config)
+        client._setup_async_client()
+        assert client.async_client._trust_env is False
+
+        mock_response = httpx.Response(200, text="test content",
+                                       request=httpx.Request("GET", TEST_CONFIG.get_url("rss_feed")))
+        with patch.object(client.async_client, 'request', AsyncMock(return_value=mock_response)) as mock_request:
+            response = await client.arequest('GET', TEST_CONFIG.get_url("rss_feed"))
+
+        assert response is not None
+        assert response.status_code == 200
+        assert response.text == "test content"
+        mock_request.assert_awaited_once_with('GET', TEST_CONFIG.get_url("rss_feed"))
+        assert client.stats['successful_requests'] == 1
+
+        await client.aclose()
+
     def test_cache_manager(self):
         """测试缓存管理器"""
         cache_manager = CacheManager()
@@ -314,6 +336,73 @@ class TestRSSCollector:
 
         assert len(items) == 0
 
+    @pytest.mark.asyncio
+    async def test_rss_collect_async_reuses_session(self, sample_rss_config):
+        """测试异步采集在多次请求间复用同一 aiohttp 会话"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        from atlas.core.config import CollectionConfig
+
+        items = "".join(
+            f"<item><title>Article {i}</title><link>/article{i}</link>"
+            f"<description>{'Long enough description. ' * 8}</description></item>"
+            for i in range(3)
+        )
+        feed = f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{items}</channel></rss>'
+
+        async def handler(request):
+            return web.Response(body=feed.encode("utf-8"),
+                                content_type="application/rss+xml", charset="utf-8")
+
+        app = web.Application()
+        app.router.add_get("/feed", handler)
+        async with TestServer(app) as server:
+            # HTTP 客户端按 rate_limit_delay 间隔同一采集器的请求
+            collector = RSSCollector(CollectionConfig.from_env(rate_limit_delay=1), use_rate_limiter=False)
+            source_config = dict(sample_rss_config, url=str(server.make_url("/feed")))
+
+            first = await collector.collect_async(source_config)
+            session = collector._aio_session
+            second = await collector.collect_async(source_config)
+
+            assert len(first) == len(second) == 3
+            assert collector._aio_session is session
+
+            await collector.aclose()
+            assert session.closed
+
+    async def test_rss_async_request_uses_http_client(self):
+        """测试异步请求应用 HTTP 客户端的请求配置并计入统计，同步关闭释放会话"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        from atlas.core.config import CollectionConfig
+
+        async def handler(request):
+            return web.Response(text=f"{request.headers.get('X-Atlas')} {request.headers['User-Agent']}")
+
+        app = web.Application()
+        app.router.add_get("/echo", handler)
+        async with TestServer(app) as server:
+            collector = RSSCollector(CollectionConfig.from_env(), use_rate_limiter=False)
+            collector.http_client.request_config.custom_headers['X-Atlas'] = "test"
+            collector.set_user_agent("AtlasTest/1.0")
+
+            response = await collector.make_request_async(str(server.make_url("/echo")))
+
+            assert response.text == "test AtlasTest/1.0"
+            assert collector.get_stats()['http_stats']['successful_requests'] == 1
+
+            from atlas.collectors import rss_collector
+
+            session = collector._aio_session
+            collector.close()
+            # 关闭任务在完成前被持有，不会被垃圾回收
+            assert len(rss_collector._PENDING_CLOSE_TASKS) == 1
+            await asyncio.gather(*rss_collector._PENDING_CLOSE_TASKS)
+            assert session.closed
+            assert not rss_collector._PENDING_CLOSE_TASKS
+            assert collector.http_client.aio_session is None
+
     def test_extract_entry(self, mock_config):
         """测试 RSS 条目提取"""
         collector = RSSCollector(mock_config)
@@ -335,6 +424,21 @@ class TestRSSCollector:
         assert item['pub_date'] == "2024-01-01 12:00:00"
         assert item['id'] == "article-123"
 
+    def test_duplicate_link_detection(self):
+        """测试同一次采集中的重复链接检测"""
+        from atlas.core.config import CollectionConfig
+
+        collector = RSSCollector(CollectionConfig.from_env())
+        seen = set()
+        link = TEST_CONFIG.get_full_url("example", "/article1")
+
+        assert collector.is_duplicate_link(link, seen) is False
+        assert collector.is_duplicate_link(link, seen) is True
+        assert collector.is_duplicate_link(link + "?page=2", seen) is False
+        assert collector.is_duplicate_link("", seen) is False
+        assert all(isinstance(key, int) for key in seen)
+        assert len(seen) == 2
+
     def test_validate_rss_entry(self, mock_config):
         """测试 RSS 条目验证"""
         collector = RSSCollector(mock_config)
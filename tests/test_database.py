@@ -213,4 +213,41 @@ class TestAtlasDatabase:
 
         # 验证结果按名称排序
         names = [row['name'] for row in results]
-        assert names == sorted(names)
\ No newline at end of file
+        assert names == sorted(names)
+
+    def test_execute_many_batches(self, temp_db):
+        """测试批量执行按批提交"""
+        insert_query = """
+        INSERT INTO data_sources (id, name, source_type, created_at, updated_at) VALUES (?, ?, ?, ?, ?)
+        """
+        rows = (
+            (f"batch_{i}", f"Batch Source {i}", "rss_feed", datetime.utcnow(), datetime.utcnow())
+            for i in range(25)
+        )
+
+        affected_rows = temp_db.execute_many(insert_query, rows, batch_size=10)
+
+        assert affected_rows == 25
+        results = temp_db.execute_query("SELECT COUNT(*) as count FROM data_sources")
+        assert results[0]['count'] == 25
+
+    def test_execute_many_skip_failed_rows(self, temp_db):
+        """测试批量执行失败时逐条重试并跳过失败的行"""
+        insert_query = """
+        INSERT INTO data_sources (id, name, source_type, created_at, updated_at) VALUES (?, ?, ?, ?, ?)
+        """
+        temp_db.execute_insert(insert_query, ("dup_3", "Existing", "rss_feed", datetime.utcnow(), datetime.utcnow()))
+        rows = [
+            (f"dup_{i}", f"Source {i}", "rss_feed", datetime.utcnow(), datetime.utcnow())
+            for i in range(6)
+        ]
+
+        with pytest.raises(DatabaseError):
+            temp_db.execute_many(insert_query, rows, batch_size=4)
+
+        temp_db.execute_update("DELETE FROM data_sources WHERE id != 'dup_3'")
+        affected_rows = temp_db.execute_many(insert_query, rows, batch_size=4, skip_failed_rows=True)
+
+        assert affected_rows == 5
+        results = temp_db.execute_query("SELECT COUNT(*) as count FROM data_sources")
+        assert results[0]['count'] == 6
@@ -140,6 +140,32 @@ class TestRawDocumentOperations:
         assert retrieved_doc.raw_content == sample_raw_document.raw_content
         assert retrieved_doc.title == sample_raw_document.title
 
+    @pytest.mark.asyncio
+    async def test_create_raw_documents_batch(self, temp_repository):
+        """测试批量创建原始文档"""
+        documents = [
+            RawDocument(
+                source_id="batch-source",
+                source_type=SourceType.RSS_FEED,
+                document_type=DocumentType.HTML,
+                raw_content=f"<content>item {i}</content>",
+                title=f"Batch Article {i}",
+                processing_status=ProcessingStatus.PENDING
+            )
+            for i in range(3)
+        ]
+
+        doc_ids = await temp_repository.create_raw_documents(documents)
+
+        assert doc_ids == [doc.id for doc in documents]
+        rows = temp_repository.database.execute_query(
+            "SELECT id, title FROM raw_documents WHERE source_id = ? ORDER BY title",
+            ("batch-source",)
+        )
+        assert [(row['id'], row['title']) for row in rows] == [
+            (str(doc.id), doc.title) for doc in documents
+        ]
+
     @pytest.mark.asyncio
     async def test_update_raw_document(self, temp_repository, sample_raw_document):
         """测试更新原始文档"""
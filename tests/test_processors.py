@@ -7,8 +7,8 @@
 import pytest
 from pathlib import Path
 
-from atlas.processors.parser import HTMLParser, ContentExtractor, ExtractedContent, SelectorConfig
-from atlas.processors.normalizer import TextNormalizer, ContentStandardizer, NormalizationConfig
+from atlas.processors.parser import HTMLParser, ContentExtractor, ExtractedContent, SelectorConfig, get_html_parser
+from atlas.processors.normalizer import TextNormalizer, ContentStandardizer, NormalizationConfig, get_text_normalizer
 from atlas.processors.dedup_base import ContentDeduplicator, DeduplicationConfig, HashStrategy, BatchDeduplicator
 from atlas.processors.validator import ContentValidator, ValidationRule, ValidationType, ValidationLevel
 from tests.test_config import TEST_CONFIG
@@ -104,6 +104,62 @@ class TestHTMLParser:
         assert result.links[0]['href'] == 'https://example.com'
         assert result.links[0]['text'] == 'Example Link'
 
+    def test_selector_compiled_once(self, parser, sample_html):
+        """测试CSS选择器只编译一次并在多次解析间复用"""
+        from atlas.processors.parser import _compile_selector
+
+        _compile_selector.cache_clear()
+        first = parser.parse(sample_html)
+        misses = _compile_selector.cache_info().misses
+        second = parser.parse(sample_html)
+
+        assert first == second
+        assert _compile_selector.cache_info().misses == misses
+
+    def test_parse_cached_per_html(self, parser):
+        """测试相同HTML只解析一次，相对链接按各自的base_url解析"""
+        html_content = "<html><body><p>Text</p><a href='/page'>Page</a></body></html>"
+
+        first = parser.parse(html_content, "https://a.example.com/")
+        first.links.append({'href': 'mutated'})
+        second = parser.parse(html_content, "https://b.example.com/")
+
+        assert len(parser._parse_cache) == 1
+        assert first.links[0]['href'] == "https://a.example.com/page"
+        assert second.links == [{'href': "https://b.example.com/page", 'text': "Page"}]
+
+    def test_parse_cache_follows_config(self, parser):
+        """测试修改选择器配置后不会命中旧的解析结果"""
+        html_content = "<html><body><h1>Default Title</h1><div class='headline'>Custom Headline</div></body></html>"
+
+        assert parser.parse(html_content).title == "Default Title"
+        parser.config.title_selectors = ['.headline']
+        assert parser.parse(html_content).title == "Custom Headline"
+
+    def test_shared_default_instances(self):
+        """测试默认配置的解析器和标准化器全局共享"""
+        assert get_html_parser() is get_html_parser()
+        assert get_text_normalizer() is get_text_normalizer()
+        assert isinstance(get_html_parser(), HTMLParser)
+        assert isinstance(get_text_normalizer(), TextNormalizer)
+
+    def test_nested_excluded_elements(self, parser):
+        """测试嵌套的排除元素一次性移除"""
+        html_content = (
+            "<html><head><meta name='description' content='Meta summary'></head><body>"
+            "<nav><div class='ads'>Ad text</div>Menu</nav>"
+            "<p>Visible paragraph</p>"
+            "<aside><script>var x = 1;</script>Side</aside>"
+            "</body></html>"
+        )
+        result = parser.parse(html_content)
+
+        assert "Visible paragraph" in result.content
+        assert "Ad text" not in result.content
+        assert "Side" not in result.content
+        assert result.summary == "Meta summary"
+        assert result.metadata["description"] == "Meta summary"
+
     def test_content_extractor_factory(self):
         """测试内容提取器工厂"""
         # 测试默认提取器
@@ -146,6 +202,12 @@ class TestTextNormalizer:
         assert "café" in result
         assert "naïve" in result
 
+    def test_encoding_issue_fix(self, normalizer):
+        """测试常见编码错误修复"""
+        result = normalizer._fix_encoding_issues("CafÃ© â€œquoteâ€¦ Ã la")
+
+        assert result == 'Café "quote... àla'
+
     def test_html_entity_removal(self, normalizer):
         """测试HTML实体移除"""
         text = "Hello &amp; world &lt;test&gt;"
@@ -162,6 +224,14 @@ class TestTextNormalizer:
         assert '-' in result
         assert "..." in result
 
+    def test_punctuation_single_pass(self):
+        """测试单次扫描的标点规则分派"""
+        normalizer = TextNormalizer(NormalizationConfig(normalize_dashes=False))
+
+        result = normalizer._normalize_punctuation("Wait..... what!!?? no—way")
+
+        assert result == "Wait. what!? no—way"
+
     def test_language_specific_spacing(self):
         """测试语言特定间距处理"""
         config = NormalizationConfig(chinese_spacing=True, english_spacing=True)
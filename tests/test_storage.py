@@ -80,16 +80,29 @@ class TestFileStorageManager:
         assert storage.index_dir.exists()
         assert storage.temp_dir.exists()
 
-    def test_file_path_generation(self, storage_manager):
+    @pytest.mark.parametrize("storage_format,extension", [
+        ("json", ".json.gz"),
+        ("msgpack", ".msgpack.gz"),
+    ])
+    def test_file_path_generation(self, temp_storage_dir, storage_format, extension):
         """测试文件路径生成"""
+        if storage_format == "msgpack":
+            pytest.importorskip("msgspec")
+        storage_manager = FileStorageManager(temp_storage_dir, storage_format=storage_format)
         doc_id = uuid4()
         file_path = storage_manager._get_file_path(doc_id, "raw")
 
         # 验证路径格式
         assert file_path.name.startswith(str(doc_id)[:2])  # 子目录
-        assert file_path.name.endswith(str(doc_id) + ".json.gz")  # 文件名和扩展名
-        assert file_path.parent.name == str(doc_id)[:2]  # 子目录名
-        assert "raw" in str(file_path.parent.parent)  # 父目录包含类型
+        assert file_path.name.endswith(str(doc_id) + extension)  # 文件名和扩展名
+        assert file_path.parent.name == str(doc_id)[2]  # 二级子目录名
+        assert file_path.parent.parent.name == str(doc_id)[:2]  # 一级子目录名
+        assert "raw" in str(file_path.parent.parent.parent)  # 父目录包含类型
+
+    def test_invalid_storage_format(self, temp_storage_dir):
+        """测试不支持的存储格式"""
+        with pytest.raises(ValueError):
+            FileStorageManager(temp_storage_dir, storage_format="xml")
 
     def test_file_path_generation_no_compression(self, storage_manager_no_compression):
         """测试不启用压缩时的文件路径生成"""
@@ -179,6 +192,193 @@ class TestFileStorageManager:
 
         assert data_compressed['raw_content'] == data_uncompressed['raw_content'] == sample_raw_document.raw_content
 
+    def test_gzip_output_is_deterministic(self, storage_manager):
+        """测试相同内容的gzip压缩结果一致"""
+        file_path = storage_manager.temp_dir / "test.json.gz"
+        payload = b'{"title": "Test Document"}' * 100
+
+        first = storage_manager._compress(file_path, payload)
+        second = storage_manager._compress(file_path, payload)
+
+        assert first == second
+        assert gzip.decompress(first) == payload
+
+    @pytest.mark.asyncio
+    async def test_legacy_shard_layout(self, storage_manager, sample_raw_document):
+        """测试读取旧版两位分片目录中的文档"""
+        doc_id = str(sample_raw_document.id)
+        legacy_file = storage_manager.raw_dir / doc_id[:2] / f"{doc_id}.json.gz"
+        legacy_file.parent.mkdir(parents=True, exist_ok=True)
+        legacy_file.write_bytes(gzip.compress(json.dumps({"id": doc_id, "title": "Legacy"}).encode('utf-8')))
+
+        data = await storage_manager.retrieve_raw_document(doc_id)
+        assert data == {"id": doc_id, "title": "Legacy"}
+
+        assert await storage_manager.delete_document(doc_id, "raw")
+        assert not legacy_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_msgpack_format(self, temp_storage_dir, sample_raw_document):
+        """测试msgpack存储格式及旧JSON数据的兼容读取"""
+        pytest.importorskip("msgspec")
+
+        # 先以JSON格式存储
+        storage_json = FileStorageManager(temp_storage_dir, storage_format="json")
+        await storage_json.store_raw_document(sample_raw_document)
+
+        # 切换为msgpack格式后仍能读取旧数据
+        storage_msgpack = FileStorageManager(temp_storage_dir, storage_format="msgpack")
+        data = await storage_msgpack.retrieve_raw_document(sample_raw_document.id)
+        assert data['raw_content'] == sample_raw_document.raw_content
+
+        # 新文档使用msgpack格式存储
+        new_doc = sample_raw_document.model_copy(update={"id": uuid4()})
+        file_path = await storage_msgpack.store_raw_document(new_doc)
+        assert file_path.name.endswith(".msgpack.gz")
+
+        data = await storage_msgpack.retrieve_raw_document(new_doc.id)
+        assert data['id'] == str(new_doc.id)
+        assert data['raw_metadata'] == sample_raw_document.raw_metadata
+
+    @pytest.mark.asyncio
+    async def test_zstd_compression(self, temp_storage_dir, sample_raw_document):
+        """测试zstd压缩及字典训练"""
+        pytest.importorskip("zstandard")
+        storage = FileStorageManager(temp_storage_dir, compression_codec="zstd")
+
+        # 训练前使用无字典的zstd压缩
+        documents = [
+            sample_raw_document.model_copy(update={
+                "id": uuid4(),
+                "raw_content": f"<html><body><h1>Article {i}</h1><p>{'content ' * i}</p></body></html>",
+                "title": f"Article {i}",
+            })
+            for i in range(200)
+        ]
+        for doc in documents:
+            file_path = await storage.store_raw_document(doc)
+            assert file_path.suffix == ".zst"
+
+        dict_path = await storage.train_compression_dictionary()
+        assert dict_path.exists()
+
+        # 训练后新文档使用字典压缩，旧文档仍可读取
+        await storage.store_raw_document(sample_raw_document)
+        data = await storage.retrieve_raw_document(sample_raw_document.id)
+        assert data['raw_content'] == sample_raw_document.raw_content
+
+        data = await storage.retrieve_raw_document(documents[10].id)
+        assert data['title'] == "Article 10"
+
+        # 重新打开存储时自动加载字典
+        reopened = FileStorageManager(temp_storage_dir, compression_codec="zstd")
+        data = await reopened.retrieve_raw_document(sample_raw_document.id)
+        assert data['raw_content'] == sample_raw_document.raw_content
+
+    @pytest.mark.asyncio
+    async def test_volume_layout(self, temp_storage_dir, sample_raw_document, sample_processed_document):
+        """测试卷文件存储布局"""
+        storage = FileStorageManager(temp_storage_dir, layout="volume")
+
+        volume_path = await storage.store_raw_document(sample_raw_document)
+        await storage.store_processed_document(sample_processed_document)
+        assert volume_path.name == "volume_000000.dat"
+
+        # 文档位置记录在卷索引中
+        volume_id, offset, size = storage.locate(sample_raw_document.id)
+        assert volume_id == 0
+        assert offset == 0
+        assert size > 0
+        assert storage.locate(uuid4()) is None
+
+        retrieved = await storage.retrieve_raw_document(sample_raw_document.id)
+        assert retrieved['raw_content'] == sample_raw_document.raw_content
+        retrieved = await storage.retrieve_processed_document(sample_processed_document.id)
+        assert retrieved['keywords'] == sample_processed_document.keywords
+        assert await storage.retrieve_raw_document(uuid4()) is None
+
+        # 删除文档
+        assert await storage.delete_document(sample_raw_document.id, "raw")
+        assert storage.locate(sample_raw_document.id) is None
+        assert await storage.retrieve_raw_document(sample_raw_document.id) is None
+        assert not await storage.delete_document(sample_raw_document.id, "raw")
+
+        storage.close()
+
+    @pytest.mark.asyncio
+    async def test_volume_sealing_and_compaction(self, temp_storage_dir, sample_raw_document):
+        """测试卷文件封存与压缩"""
+        from atlas.core.volume_store import VolumeStore
+
+        storage = FileStorageManager(temp_storage_dir, layout="volume")
+        storage._volume_stores["raw"].close()
+        # 每个卷容纳两条记录
+        storage._volume_stores["raw"] = VolumeStore(storage.volume_dir / "raw", max_volume_size=1024)
+
+        documents = [sample_raw_document.model_copy(update={"id": uuid4()}) for _ in range(6)]
+        for doc in documents:
+            await storage.store_raw_document(doc)
+
+        volume_store = storage._volume_stores["raw"]
+        assert len(volume_store.list_volume_ids()) > 1
+
+        # 已封存卷通过内存映射读取
+        for doc in documents:
+            retrieved = await storage.retrieve_raw_document(doc.id)
+            assert retrieved['id'] == str(doc.id)
+        assert 0 in volume_store._volume_maps
+        assert volume_store.active_volume_id not in volume_store._volume_maps
+
+        # 删除首个卷中的文档后压缩
+        deleted_doc = next(doc for doc in documents if storage.locate(doc.id)[0] == 0)
+        await storage.delete_document(deleted_doc.id, "raw")
+        reclaimed = await storage.compact_volumes()
+        assert reclaimed >= 1
+        assert not volume_store.volume_path(0).exists()
+        assert 0 not in volume_store._volume_maps
+
+        for doc in documents:
+            if doc.id == deleted_doc.id:
+                continue
+            retrieved = await storage.retrieve_raw_document(doc.id)
+            assert retrieved['id'] == str(doc.id)
+
+        # 首个卷中未删除的文档已迁移，文档索引不记录具体卷文件，压缩后仍然有效
+        index_data = await storage._load_index_file(storage._get_index_file("raw"))
+        for doc_info in index_data.values():
+            assert Path(doc_info['file_path']).exists()
+
+        storage.close()
+
+    def test_volume_store_across_instances(self, temp_storage_dir):
+        """测试多个实例交替写入同一卷目录时偏移量和封存保持一致"""
+        from atlas.core.volume_store import VolumeStore
+
+        first = VolumeStore(temp_storage_dir, max_volume_size=512)
+        second = VolumeStore(temp_storage_dir, max_volume_size=512)
+
+        payloads = {}
+        for i in range(12):
+            document_id = str(uuid4())
+            payloads[document_id] = f"payload-{i}".encode() * 8
+            (first if i % 2 == 0 else second).append(document_id, payloads[document_id], ".json")
+
+        assert len(first.list_volume_ids()) > 1
+        for store in (first, second):
+            for document_id, payload in payloads.items():
+                assert store.read(document_id) == (payload, ".json")
+
+        # 一个实例压缩后，另一个实例仍能读到迁移后的记录
+        deleted_id = next(document_id for document_id in payloads if first.locate(document_id)[0] == 0)
+        second.delete(deleted_id)
+        assert first.compact() >= 1
+        for document_id, payload in payloads.items():
+            expected = None if document_id == deleted_id else (payload, ".json")
+            assert second.read(document_id) == expected
+
+        first.close()
+        second.close()
+
     @pytest.mark.asyncio
     async def test_json_file_operations(self, storage_manager):
         """测试JSON文件读写操作"""
@@ -231,17 +431,50 @@ class TestFileStorageManager:
         assert isinstance(results, list)
         # 不强制断言空结果，因为搜索实现可能不同
 
+    @pytest.mark.asyncio
+    async def test_search_index(self, storage_manager):
+        """测试全文搜索索引的子串匹配"""
+        docs = [
+            RawDocument(
+                source_id="tech_source",
+                source_type=SourceType.RSS_FEED,
+                document_type=DocumentType.HTML,
+                raw_content="content",
+                title=title,
+            )
+            for title in ["Technology Article", "人工智能新闻", "Sports News", "Daily News"]
+        ]
+        for doc in docs:
+            await storage_manager.store_raw_document(doc)
+
+        results = await storage_manager.search_documents("TECHNO", "raw")
+        assert [r['title'] for r in results] == ["Technology Article"]
+
+        results = await storage_manager.search_documents("智能", "raw")
+        assert [r['title'] for r in results] == ["人工智能新闻"]
+
+        results = await storage_manager.search_documents("news", "raw")
+        assert len(results) == 2
+
+        # 删除后不再出现在搜索结果中
+        await storage_manager.delete_document(docs[2].id, "raw")
+        results = await storage_manager.search_documents("news", "raw")
+        assert [r['title'] for r in results] == ["Daily News"]
+
+        results = await storage_manager.search_documents("tech_source", "raw", limit=1)
+        assert len(results) == 1
+
     @pytest.mark.asyncio
     async def test_index_management(self, storage_manager, sample_raw_document):
         """测试索引管理功能"""
         # 存储文档（会自动创建索引）
         await storage_manager.store_raw_document(sample_raw_document)
 
-        # 检查索引文件是否存在
+        # 索引变更先写入预写日志
         raw_index_file = storage_manager.index_dir / "raw_documents_index.json"
-        assert raw_index_file.exists()
+        assert raw_index_file.with_suffix(".wal").exists()
 
-        # 加载索引数据
+        # 加载索引数据（快照 + 日志的合并视图）
         index_data = await storage_manager._load_index_file(raw_index_file)
         assert str(sample_raw_document.id) in index_data
 
@@ -252,10 +485,139 @@ class TestFileStorageManager:
         assert 'file_path' in doc_index
         assert 'indexed_at' in doc_index
 
+        # 删除记录同样写入日志
+        await storage_manager.delete_document(sample_raw_document.id, "raw")
+        index_data = await storage_manager._load_index_file(raw_index_file)
+        assert str(sample_raw_document.id) not in index_data
+
+    @pytest.mark.asyncio
+    async def test_bloom_filter_negative_lookup(self, temp_storage_dir, sample_raw_document):
+        """测试布隆过滤器短路不存在文档的检索及持久化"""
+        from unittest.mock import patch
+
+        storage = FileStorageManager(temp_storage_dir)
+        await storage.store_raw_document(sample_raw_document)
+
+        # 不存在的文档不访问磁盘
+        with patch.object(storage, '_read_document', side_effect=AssertionError("unexpected read")):
+            assert await storage.retrieve_raw_document(uuid4()) is None
+
+        data = await storage.retrieve_raw_document(sample_raw_document.id)
+        assert data['id'] == str(sample_raw_document.id)
+
+        storage.close()
+        assert (storage.index_dir / "raw.bloom").exists()
+
+        # 重新打开时直接加载持久化的过滤器，无需重建
+        reopened = FileStorageManager(temp_storage_dir)
+        with patch.object(reopened, '_build_bloom_filter_sync', side_effect=AssertionError("unexpected rebuild")):
+            data = await reopened.retrieve_raw_document(sample_raw_document.id)
+        assert data['id'] == str(sample_raw_document.id)
+
+        # 索引在持久化后被修改时从预写日志补齐过滤器
+        new_doc = sample_raw_document.model_copy(update={"id": uuid4()})
+        await reopened.store_raw_document(new_doc)
+        reopened._bloom_filters.clear()
+        assert await reopened.retrieve_raw_document(new_doc.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_bloom_filter_persisted_without_close(self, temp_storage_dir, sample_raw_document):
+        """测试未调用 close() 时过滤器同样被持久化，新进程无需重新扫描"""
+        from unittest.mock import patch
+
+        storage = FileStorageManager(temp_storage_dir)
+        assert await storage.retrieve_raw_document(uuid4()) is None
+        await storage.store_raw_document(sample_raw_document)
+
+        # 重建后立即持久化，之后的写入由预写日志补齐
+        reopened = FileStorageManager(temp_storage_dir)
+        with patch.object(reopened, '_build_bloom_filter_sync', side_effect=AssertionError("unexpected rebuild")):
+            data = await reopened.retrieve_raw_document(sample_raw_document.id)
+            assert data['id'] == str(sample_raw_document.id)
+            assert await reopened.retrieve_raw_document(uuid4()) is None
+
+        # 合并索引后随新快照一起持久化
+        new_doc = sample_raw_document.model_copy(update={"id": uuid4()})
+        await storage.store_raw_document(new_doc)
+        await storage.compact_index()
+
+        reopened = FileStorageManager(temp_storage_dir)
+        with patch.object(reopened, '_build_bloom_filter_sync', side_effect=AssertionError("unexpected rebuild")):
+            data = await reopened.retrieve_raw_document(new_doc.id)
+            assert data['id'] == str(new_doc.id)
+            assert await reopened.retrieve_raw_document(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_bloom_filter_across_instances(self, temp_storage_dir, sample_raw_document):
+        """测试其他实例写入的文档不会被本实例的布隆过滤器误判为不存在"""
+        from unittest.mock import patch
+
+        writer = FileStorageManager(temp_storage_dir)
+        reader = FileStorageManager(temp_storage_dir)
+
+        # 读取方先加载过滤器
+        assert await reader.retrieve_raw_document(uuid4()) is None
+
+        # 其他实例追加的文档从预写日志补齐，无需重建
+        await writer.store_raw_document(sample_raw_document)
+        with patch.object(reader, '_build_bloom_filter_sync', side_effect=AssertionError("unexpected rebuild")):
+            data = await reader.retrieve_raw_document(sample_raw_document.id)
+        assert data['id'] == str(sample_raw_document.id)
+
+        # 其他实例合并索引后无法增量同步，回退为读取磁盘
+        new_doc = sample_raw_document.model_copy(update={"id": uuid4()})
+        await writer.store_raw_document(new_doc)
+        await writer.compact_index()
+        data = await reader.retrieve_raw_document(new_doc.id)
+        assert data['id'] == str(new_doc.id)
+
+        writer.close()
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_index_compaction(self, storage_manager, sample_raw_document):
+        """测试索引日志合并到快照"""
+        await storage_manager.store_raw_document(sample_raw_document)
+        await storage_manager.compact_index()
+
+        raw_index_file = storage_manager.index_dir / "raw_documents_index.json"
+        assert raw_index_file.exists()
+        assert not raw_index_file.with_suffix(".wal").exists()
+
+        index_data = await storage_manager._load_index_file(raw_index_file)
+        assert str(sample_raw_document.id) in index_data
+
+        # 合并后继续写入日志
+        new_doc = sample_raw_document.model_copy(update={"id": uuid4()})
+        await storage_manager.store_raw_document(new_doc)
+        index_data = await storage_manager._load_index_file(raw_index_file)
+        assert {str(sample_raw_document.id), str(new_doc.id)} <= set(index_data)
+
+    @pytest.mark.asyncio
+    async def test_index_compaction_across_instances(self, temp_storage_dir, sample_raw_document):
+        """测试其他实例合并索引后继续追加的记录不会丢失"""
+        writer = FileStorageManager(temp_storage_dir)
+        compactor = FileStorageManager(temp_storage_dir)
+
+        first_doc = sample_raw_document
+        await writer.store_raw_document(first_doc)
+        await compactor.compact_index()
+
+        second_doc = sample_raw_document.model_copy(update={"id": uuid4()})
+        await writer.store_raw_document(second_doc)
+
+        raw_index_file = temp_storage_dir / "indexes" / "raw_documents_index.json"
+        assert raw_index_file.with_suffix(".wal").exists()
+
+        index_data = await compactor._load_index_file(raw_index_file)
+        assert {str(first_doc.id), str(second_doc.id)} <= set(index_data)
+
+        writer.close()
+        compactor.close()
+
     @pytest.mark.asyncio
     async def test_cleanup_temp_files(self, storage_manager):
         """测试临时文件清理功能"""
-        import aiofiles
         import time
         from datetime import datetime, timedelta
 
@@ -265,9 +627,8 @@ class TestFileStorageManager:
 
         for i in range(3):
             temp_file = storage_manager.temp_dir / f"temp_{i}.txt"
-            # 使用aiofiles创建文件
-            async with aiofiles.open(temp_file, 'w') as f:
-                await f.write(f"temp content {i}")
+            with open(temp_file, 'w') as f:
+                f.write(f"temp content {i}")
 
             # 设置文件的修改时间为较老的时间
             import os
@@ -287,6 +648,26 @@ class TestFileStorageManager:
         remaining_files = [f for f in temp_files if f.exists()]
         assert len(remaining_files) <= len(temp_files)  # 文件数量应该减少或保持不变
 
+    @pytest.mark.asyncio
+    async def test_cleanup_temp_files_keeps_recent(self, storage_manager):
+        """测试临时文件清理只删除过期文件"""
+        import os
+        import time
+
+        old_file = storage_manager.temp_dir / "old.tmp"
+        new_file = storage_manager.temp_dir / "new.tmp"
+        old_file.write_text("old")
+        new_file.write_text("new")
+        old_timestamp = time.time() - 25 * 3600
+        os.utime(old_file, (old_timestamp, old_timestamp))
+        (storage_manager.temp_dir / "subdir").mkdir()
+
+        cleaned_count = await storage_manager.cleanup_temp_files(older_than_hours=24)
+
+        assert cleaned_count == 1
+        assert not old_file.exists()
+        assert new_file.exists()
+
     @pytest.mark.asyncio
     async def test_storage_statistics(self, storage_manager, sample_raw_document, sample_processed_document):
         """测试存储统计功能"""
@@ -332,6 +713,8 @@ class TestFileStorageManager:
         original_file = storage_manager._get_file_path(sample_raw_document.id, "raw")
         backup_file = backup_path / original_file.relative_to(storage_manager.base_dir)
         assert backup_file.exists()
+        assert backup_file.read_bytes() == original_file.read_bytes()
+        assert backup_file.stat().st_mtime_ns == original_file.stat().st_mtime_ns
 
         # 清理备份
         import shutil
@@ -351,5 +734,67 @@ class TestFileStorageManager:
             asyncio.run(storage_manager._read_json_file(invalid_json_file))
 
 
+
+class TestSearchIndex:
+    """全文搜索索引测试"""
+
+    def test_updates_do_not_scan_table(self, temp_storage_dir):
+        """测试写入和删除按主键定位，不随索引规模扫描全表"""
+        import sqlite3
+        from atlas.core.search_index import SearchIndex
+
+        index = SearchIndex(temp_storage_dir / "search_index.db")
+        if not index.available:
+            pytest.skip("SQLite 未编译 FTS5 trigram")
+        index.upsert_many((f"doc-{i}", "raw", f"title {i}") for i in range(2000))
+
+        statements = []
+        index._conn.set_trace_callback(statements.append)
+        index.upsert("doc-10", "raw", "updated title")
+        index.upsert("doc-new", "raw", "new title")
+        index.remove("doc-20", "raw")
+        index._conn.set_trace_callback(None)
+
+        plan_conn = sqlite3.connect(str(index.db_path))
+        for statement in statements:
+            if not statement.lstrip().upper().startswith(("SELECT", "INSERT", "DELETE")):
+                continue
+            for row in plan_conn.execute(f"EXPLAIN QUERY PLAN {statement}"):
+                detail = row[-1]
+                # FTS5 的执行计划总是 SCAN ... VIRTUAL TABLE，冒号后为空表示没有可用约束（全表扫描）
+                if "VIRTUAL TABLE" in detail:
+                    assert not detail.endswith(":"), (statement, detail)
+                else:
+                    assert not detail.startswith("SCAN"), (statement, detail)
+        plan_conn.close()
+
+        assert index.search("updated", "raw", 10) == ["doc-10"]
+        assert "doc-20" not in index.search("title 20", "raw", 100)
+        assert index.count("raw") == 2000
+        index.close()
+
+    def test_legacy_table_is_rebuilt(self, temp_storage_dir):
+        """测试旧版本的索引表被删除并要求重建"""
+        import sqlite3
+        from atlas.core.search_index import SearchIndex
+
+        db_path = temp_storage_dir / "search_index.db"
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute("CREATE VIRTUAL TABLE search_index USING fts5("
+                         "document_id UNINDEXED, document_type UNINDEXED, searchable)")
+        except sqlite3.OperationalError:
+            pytest.skip("SQLite 未编译 FTS5")
+        conn.execute("INSERT INTO search_index VALUES ('doc-1', 'raw', 'old title')")
+        conn.commit()
+        conn.close()
+
+        index = SearchIndex(db_path)
+        if not index.available:
+            pytest.skip("SQLite 未编译 FTS5 trigram")
+        assert index.needs_rebuild
+        assert index.count("raw") == 0
+        index.close()
+
 # 需要导入asyncio以在测试中使用
 import asyncio
\ No newline at end of file
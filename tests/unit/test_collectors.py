@@ -14,6 +14,13 @@ from atlas.core.config import CollectionConfig
 from tests.test_config import TEST_CONFIG
 
 
+class _StubCollector(BaseCollector):
+    """用于测试基础类通用功能的最小具体采集器"""
+
+    def collect(self, source_config):
+        return []
+
+
 class TestBaseCollector:
     """基础采集器测试"""
 
@@ -26,8 +33,10 @@ class TestBaseCollector:
         self.config.rate_limit_delay = 300
         self.config.use_random_user_agent = False
         self.config.rotate_user_agent = False
+        self.config.use_fast_html_parser = False
 
-        self.collector = BaseCollector(self.config)
+        # 基础功能测试不涉及频率限制
+        self.collector = _StubCollector(self.config, use_rate_limiter=False)
 
     def test_init(self):
         """测试初始化"""
@@ -69,9 +78,11 @@ class TestBaseCollector:
 
     def test_make_request_success(self):
         """测试成功的 HTTP 请求"""
-        with patch.object(self.collector.session, 'request') as mock_request:
+        with patch.object(self.collector.http_client, 'request') as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
+            mock_response.from_cache = False
+            mock_response.elapsed_time = 0.1
             mock_response.raise_for_status = Mock()
             mock_request.return_value = mock_response
 
@@ -83,7 +94,7 @@ class TestBaseCollector:
 
     def test_make_request_failure(self):
         """测试失败的 HTTP 请求"""
-        with patch.object(self.collector.session, 'request') as mock_request:
+        with patch.object(self.collector.http_client, 'request') as mock_request:
             mock_request.side_effect = Exception("Network error")
 
             test_url = TEST_CONFIG.get_url("rss_feed")
@@ -97,6 +108,14 @@ class TestBaseCollector:
         soup = self.collector.parse_html(html_content)
         assert soup.find('h1').text == "Test"
 
+    def test_parse_html_fast(self):
+        """测试 selectolax 快速 HTML 解析"""
+        pytest.importorskip("selectolax")
+
+        html_content = "<html><body><h1>Test</h1></body></html>"
+        tree = self.collector.parse_html_fast(html_content)
+        assert tree.css_first('h1').text() == "Test"
+
     def test_parse_rss(self):
         """测试 RSS 解析"""
         rss_content = """<?xml version="1.0"?>
@@ -336,6 +355,11 @@ class TestWebCollector:
         self.config = Mock(spec=CollectionConfig)
         self.config.default_user_agent = "Atlas/0.1.0 Test"
         self.config.request_timeout = 30
+        self.config.max_concurrent_requests = 3
+        self.config.rate_limit_delay = 300
+        self.config.use_random_user_agent = False
+        self.config.rotate_user_agent = False
+        self.config.use_fast_html_parser = False
 
         self.collector = WebCollector(self.config)
 
@@ -412,4 +436,50 @@ class TestWebCollector:
 
         assert item['title'] == 'Page Title'
         assert item['content'] == 'Article Content'
-        assert item['author'] == 'Author Name'
\ No newline at end of file
+        assert item['author'] == 'Author Name'
+
+    def test_extract_page_info_fast(self):
+        """测试基于 selectolax 的页面信息提取"""
+        pytest.importorskip("selectolax")
+
+        source_config = {
+            'name': 'test_web',
+            'selectors': {
+                'title': 'h1',
+                'content': 'main .content',
+                'author': '.author'
+            }
+        }
+
+        html = """
+        <html>
+            <head><meta name="description" content="Page Description"></head>
+            <h1>Page Title</h1>
+            <main>
+                <div class="content">Article Content</div>
+                <div class="author">Author Name</div>
+            </main>
+        </html>
+        """
+        tree = self.collector.parse_html_fast(html)
+
+        item = self.collector._extract_page_info(tree, source_config)
+
+        assert item['title'] == 'Page Title'
+        assert item['content'] == 'Article Content'
+        assert item['author'] == 'Author Name'
+        assert item['description'] == 'Page Description'
+
+    def test_get_attr_matches_beautifulsoup(self):
+        """测试 selectolax 与 BeautifulSoup 的属性读取结果一致"""
+        pytest.importorskip("selectolax")
+        from bs4 import BeautifulSoup
+        from atlas.collectors.web_collector import _get_attr
+
+        html = '<meta name="a" content=""><meta name="b" content><meta name="c">'
+        fast_elements = self.collector.parse_html_fast(html).css('meta')
+        soup_elements = BeautifulSoup(html, 'html.parser').find_all('meta')
+
+        assert len(fast_elements) == len(soup_elements) == 3
+        for fast_element, soup_element in zip(fast_elements, soup_elements):
+            assert _get_attr(fast_element, 'content', 'missing') == _get_attr(soup_element, 'content', 'missing')
@@ -3,14 +3,20 @@
 """
 
 import os
-import tempfile
 import pytest
 import yaml
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
 from atlas.core.config import Config, DatabaseConfig, CollectionConfig, LLMConfig
-from atlas.core.config import LocalEnvLoader
+from atlas.core.config import LocalEnvLoader, SafeDumper, _YAML_CACHE
+from atlas.core.config import build_config_cache, config_cache_path
+
+
+@pytest.fixture
+def tmp_config_dir(tmp_path):
+    """临时配置目录"""
+    return tmp_path
 
 
 class TestDatabaseConfig:
@@ -30,17 +36,30 @@ class TestDatabaseConfig:
             "ATLAS_DATABASE_URL": "postgresql://localhost/test",
             "ATLAS_DATABASE_POOL_SIZE": "10"
         }):
-            config = DatabaseConfig()
+            config = DatabaseConfig.from_env()
             assert config.url == "postgresql://localhost/test"
             assert config.pool_size == 10
 
+    def test_from_env_mapping_and_overrides(self):
+        """测试从指定映射加载并由显式参数覆盖"""
+        config = DatabaseConfig.from_env(
+            {"ATLAS_DATABASE_POOL_SIZE": "7", "ATLAS_DATABASE_ECHO": "yes"},
+            url="sqlite:///:memory:"
+        )
+        assert config.pool_size == 7
+        assert config.echo is True
+        assert config.url == "sqlite:///:memory:"
+
+        with pytest.raises(ValueError):
+            DatabaseConfig.from_env({"ATLAS_DATABASE_ECHO": "maybe"})
+
 
 class TestCollectionConfig:
     """数据采集配置测试"""
 
     def test_default_values(self):
         """测试默认值"""
-        config = CollectionConfig()
+        config = CollectionConfig.from_env(env={})
         assert "Atlas/0.1.0" in config.default_user_agent
         assert config.request_timeout == 30
         assert config.max_concurrent_requests == 3
@@ -54,7 +73,7 @@ class TestCollectionConfig:
             "ATLAS_REQUEST_TIMEOUT": "60",
             "ATLAS_USE_RANDOM_USER_AGENT": "true"
         }):
-            config = CollectionConfig()
+            config = CollectionConfig.from_env()
             assert config.request_timeout == 60
             assert config.use_random_user_agent is True
 
@@ -113,6 +132,34 @@ class TestLocalEnvLoader:
             loader = LocalEnvLoader(Path("/tmp"))
             assert loader.env_name == "development"
 
+    def test_parse_env_file_cache(self, tmp_config_dir):
+        """测试 .env 文件解析结果按修改时间缓存"""
+        env_file = Path(tmp_config_dir) / ".env"
+        env_file.write_text('# comment\nATLAS_ENV="staging"\nOTHER_VAR=value\n')
+
+        values = LocalEnvLoader._parse_env_file(env_file)
+        assert values == {"ATLAS_ENV": "staging", "OTHER_VAR": "value"}
+        assert LocalEnvLoader._parse_env_file(env_file) is values
+
+        env_file.write_text("ATLAS_ENV=production\n")
+        stat = env_file.stat()
+        os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert LocalEnvLoader._parse_env_file(env_file) == {"ATLAS_ENV": "production"}
+
+    def test_load_env_files_reads_once(self, tmp_config_dir):
+        """测试多次加载同一 .env 文件只读取一次"""
+        env_file = Path(tmp_config_dir) / ".env"
+        env_file.write_text("ATLAS_TEST_CACHED_VAR=cached  # 行内注释\n")
+
+        with patch.dict(os.environ, {}):
+            with patch("builtins.open", wraps=open) as mock_file:
+                for _ in range(3):
+                    LocalEnvLoader(Path(tmp_config_dir), "test").load_env_files()
+            assert os.environ["ATLAS_TEST_CACHED_VAR"] == "cached"
+
+        opened = [call.args[0] for call in mock_file.call_args_list]
+        assert opened.count(env_file) == 1
+
     def test_get_env_file_paths(self):
         """测试获取环境文件路径"""
         config_dir = Path("/tmp/config")
@@ -129,51 +176,55 @@ class TestLocalEnvLoader:
 class TestConfig:
     """配置管理器测试"""
 
-    def test_init_with_defaults(self):
+    def test_init_with_defaults(self, tmp_config_dir):
         """测试使用默认值初始化"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(temp_dir)
-            assert config.config_dir == Path(temp_dir)
-            assert config.env == "development"
-            assert config.debug is False
+        config = Config(tmp_config_dir)
+        assert config.config_dir == Path(tmp_config_dir)
+        assert config.env == "development"
+        assert config.debug is False
 
-    def test_init_with_env_name(self):
+    def test_init_with_env_name(self, tmp_config_dir):
         """测试指定环境名称初始化"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(temp_dir, env_name="production")
-            assert config.env_name == "production"
-            assert config.env == "production"
+        config = Config(tmp_config_dir, env_name="production")
+        assert config.env_name == "production"
+        assert config.env == "production"
 
-    def test_load_config_files(self):
+    def test_load_config_files(self, tmp_config_dir):
         """测试加载配置文件"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir)
-
-            # 创建配置文件
-            config_data = {
-                "env": "test",
-                "debug": True,
-                "log_level": "DEBUG"
-            }
-            config_file = config_dir / "config.yaml"
-            with open(config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f)
-
-            # 创建环境特定配置
-            env_data = {
-                "env": "test",
-                "test_setting": "test_value"
-            }
-            env_file = config_dir / "config.test.yaml"
-            with open(env_file, 'w', encoding='utf-8') as f:
-                yaml.dump(env_data, f)
-
-            config = Config(config_dir, env_name="test")
-
-            # 检查配置是否正确加载和合并
-            assert config.env == "test"
-            assert config.get("test_setting") == "test_value"
-            assert config.get("debug") is True
+        config_dir = Path(tmp_config_dir)
+
+        # 创建配置文件
+        config_data = {
+            "env": "test",
+            "debug": True,
+            "log_level": "DEBUG"
+        }
+        config_file = config_dir / "config.yaml"
+        with open(config_file, 'w', encoding='utf-8') as f:
+            yaml.dump(config_data, f, Dumper=SafeDumper)
+
+        # 创建环境特定配置
+        env_data = {
+            "env": "test",
+            "test_setting": "test_value"
+        }
+        env_file = config_dir / "config.test.yaml"
+        with open(env_file, 'w', encoding='utf-8') as f:
+            yaml.dump(env_data, f, Dumper=SafeDumper)
+
+        config = Config(config_dir, env_name="test")
+
+        # 检查配置是否正确加载和合并
+        assert config.env == "test"
+        assert config.get("test_setting") == "test_value"
+        assert config.get("debug") is True
+
+    def test_deep_merge_nested(self):
+        """测试嵌套配置的深度合并"""
+        base = {"a": {"b": {"c": 1, "d": 2}, "e": 3}, "f": 4}
+        Config._deep_merge(base, {"a": {"b": {"c": 10}, "e": {"g": 5}}, "h": 6})
+
+        assert base == {"a": {"b": {"c": 10, "d": 2}, "e": {"g": 5}}, "f": 4, "h": 6}
 
     def test_get_set_config(self):
         """测试获取和设置配置值"""
@@ -189,49 +240,148 @@ class TestConfig:
         assert config.get("nested.nonexistent") is None
         assert config.get("nested.nonexistent", "default") == "default"
 
-    def test_ensure_directories(self):
+    def test_env_snapshot(self, tmp_config_dir):
+        """测试环境变量在初始化和重新加载时读取"""
+        with patch.dict(os.environ, {"ATLAS_LOG_LEVEL": "WARNING"}):
+            config = Config(tmp_config_dir)
+            assert config.log_level == "WARNING"
+            assert config.collection is config.collection
+
+            os.environ["ATLAS_LOG_LEVEL"] = "ERROR"
+            assert config.log_level == "WARNING"
+
+            config.reload()
+            assert config.log_level == "ERROR"
+
+    def test_get_subtree_and_overwrite(self, tmp_config_dir):
+        """测试获取子配置以及覆盖子树后的索引"""
+        with open(Path(tmp_config_dir) / "config.yaml", 'w', encoding='utf-8') as f:
+            yaml.dump({"jobs": {"daily": {"hour": 1}, "weekly": {"hour": 2}}}, f, Dumper=SafeDumper)
+        config = Config(tmp_config_dir)
+
+        assert config.get("jobs.daily.hour") == 1
+        assert config.get("jobs") == {"daily": {"hour": 1}, "weekly": {"hour": 2}}
+
+        config.set("jobs.daily.minute", 30)
+        assert config.get("jobs.daily") == {"hour": 1, "minute": 30}
+
+        config.set("jobs.daily", {"hour": 5})
+        assert config.get("jobs.daily.hour") == 5
+        assert config.get("jobs.daily.minute") is None
+        assert config.get("jobs.weekly.hour") == 2
+
+    def test_ensure_directories(self, tmp_config_dir):
         """测试确保目录存在"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(temp_dir)
+        config = Config(tmp_config_dir)
 
-            # 检查目录是否创建
-            assert config.data_dir.exists()
-            assert config.log_dir.exists()
-            assert (config.data_dir / "raw").exists()
-            assert (config.data_dir / "processed").exists()
+        # 检查目录是否创建
+        assert config.data_dir.exists()
+        assert config.log_dir.exists()
+        assert (config.data_dir / "raw").exists()
+        assert (config.data_dir / "processed").exists()
 
-    def test_properties(self):
+    def test_properties(self, tmp_config_dir):
         """测试配置属性"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(temp_dir)
+        config = Config(tmp_config_dir)
 
-            # 测试数据库配置
-            assert isinstance(config.database, DatabaseConfig)
+        # 测试数据库配置
+        assert isinstance(config.database, DatabaseConfig)
 
-            # 测试采集配置
-            assert isinstance(config.collection, CollectionConfig)
+        # 测试采集配置
+        assert isinstance(config.collection, CollectionConfig)
 
-            # 测试 LLM 配置
-            assert isinstance(config.llm, LLMConfig)
+        # 测试 LLM 配置
+        assert isinstance(config.llm, LLMConfig)
 
-    def test_reload(self):
+    def test_reload(self, tmp_config_dir):
         """测试重新加载配置"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(temp_dir)
-            original_env = config.env
+        config = Config(tmp_config_dir)
+        original_env = config.env
+
+        # 修改配置文件
+        config_data = {"env": "reloaded", "debug": True}
+        config_file = Path(tmp_config_dir) / "config.yaml"
+        with open(config_file, 'w', encoding='utf-8') as f:
+            yaml.dump(config_data, f, Dumper=SafeDumper)
+
+        # 重新加载
+        config.reload()
+
+        # 检查配置是否更新
+        assert config.env == "reloaded"
+        assert config.get("debug") is True
+
+    def test_yaml_parse_cache(self, tmp_config_dir):
+        """测试未变化的配置文件复用解析结果，修改后重新解析"""
+        config_file = Path(tmp_config_dir) / "config.yaml"
+        with open(config_file, 'w', encoding='utf-8') as f:
+            yaml.dump({"nested": {"key": "value"}}, f, Dumper=SafeDumper)
 
-            # 修改配置文件
-            config_data = {"env": "reloaded", "debug": True}
-            config_file = Path(temp_dir) / "config.yaml"
+        config = Config(tmp_config_dir)
+        config.set("nested.key", "changed")
+
+        with patch("atlas.core.config.yaml.load") as mock_load:
+            config.reload()
+            mock_load.assert_not_called()
+        # 缓存的解析结果不受配置修改影响
+        assert config.get("nested.key") == "value"
+
+        cache_size = len(_YAML_CACHE)
+        with open(config_file, 'w', encoding='utf-8') as f:
+            yaml.dump({"nested": {"key": "edited", "extra": 1}}, f, Dumper=SafeDumper)
+        config.reload()
+        assert config.get("nested.key") == "edited"
+        # 文件修改后替换旧的解析结果，缓存不随版本增长
+        assert len(_YAML_CACHE) == cache_size
+        assert _YAML_CACHE[str(config_file)][1]["nested"]["key"] == "edited"
+
+    def test_config_cache(self, tmp_config_dir, tmp_path):
+        """测试预解析缓存优先加载，YAML 修改后回退到 YAML"""
+        config_dir = Path(tmp_config_dir)
+        data_dir = tmp_path / "data"
+        config_file = config_dir / "config.yaml"
+        with open(config_file, 'w', encoding='utf-8') as f:
+            yaml.dump({"debug": True, "nested": {"key": "value", "limit": float("inf")}}, f, Dumper=SafeDumper)
+        with open(config_dir / "config.test.yaml", 'w', encoding='utf-8') as f:
+            yaml.dump({"nested": {"env_key": "env_value"}}, f, Dumper=SafeDumper)
+
+        cache_file = build_config_cache(config_dir, data_dir)
+        assert cache_file == config_cache_path(config_dir, data_dir)
+        assert cache_file.parent == data_dir / "cache"
+
+        with patch.dict(os.environ, {"ATLAS_DATA_DIR": str(data_dir)}):
+            with patch("atlas.core.config.yaml.load") as mock_load:
+                config = Config(config_dir, env_name="test")
+                mock_load.assert_not_called()
+            assert config.get("debug") is True
+            assert config.get("nested.key") == "value"
+            assert config.get("nested.limit") == float("inf")
+            assert config.get("nested.env_key") == "env_value"
+
+            # YAML 在缓存之后被修改时以 YAML 为准
             with open(config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f)
+                yaml.dump({"debug": False}, f, Dumper=SafeDumper)
 
-            # 重新加载
             config.reload()
+            assert config.get("debug") is False
+            assert config.get("nested.env_key") == "env_value"
 
-            # 检查配置是否更新
-            assert config.env == "reloaded"
-            assert config.get("debug") is True
+    def test_config_cache_rejects_unsafe_pickle(self, tmp_config_dir, tmp_path):
+        """测试配置缓存不会还原任意对象"""
+        import pickle
+
+        config_dir = Path(tmp_config_dir)
+        data_dir = tmp_path / "data"
+        with open(config_dir / "config.yaml", 'w', encoding='utf-8') as f:
+            yaml.dump({"debug": True}, f, Dumper=SafeDumper)
+
+        cache_file = build_config_cache(config_dir, data_dir)
+        with open(cache_file, 'wb') as f:
+            pickle.dump({"version": 1, "files": {"config.yaml": (0, 0, os.system)}}, f)
+
+        with patch.dict(os.environ, {"ATLAS_DATA_DIR": str(data_dir)}):
+            config = Config(config_dir)
+        assert config.get("debug") is True
 
 
 # 集成测试
@@ -0,0 +1,153 @@
+"""
+RSS/Atom 快速解析器单元测试
+"""
+
+import feedparser
+import pytest
+
+from atlas.collectors.feed_parser import parse_feed
+
+
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:media="http://search.yahoo.com/mrss/">
+<channel>
+  <title>Test Feed</title>
+  <link>https://example.com/</link>
+  <description>A test feed</description>
+  <item>
+    <title>First &amp; Foremost</title>
+    <link>https://example.com/first</link>
+    <description><![CDATA[<p>Hello <b>world</b></p>]]></description>
+    <content:encoded><![CDATA[<div>Full article</div>]]></content:encoded>
+    <pubDate>Mon, 01 Jan 2024 12:00:00 +0800</pubDate>
+    <dc:creator>Alice</dc:creator>
+    <guid>article-1</guid>
+    <category>tech</category>
+    <category>ai</category>
+    <media:content url="https://example.com/image.jpg" medium="image"/>
+  </item>
+  <item>
+    <title>Second</title>
+    <link>https://example.com/second</link>
+    <description>Plain description</description>
+  </item>
+</channel>
+</rss>"""
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom Feed</title>
+  <link href="https://example.com/"/>
+  <entry>
+    <title>Atom Entry</title>
+    <link rel="alternate" href="https://example.com/entry"/>
+    <id>urn:uuid:1</id>
+    <published>2024-01-01T00:00:00+02:00</published>
+    <updated>2024-01-02T03:04:05Z</updated>
+    <summary>Entry summary</summary>
+    <content type="html">&lt;p&gt;Entry body&lt;/p&gt;</content>
+    <author><name>Bob</name></author>
+    <category term="news"/>
+  </entry>
+</feed>"""
+
+
+class TestParseFeed:
+    """lxml 订阅源解析测试"""
+
+    @pytest.mark.parametrize("document", [RSS_FEED, ATOM_FEED], ids=["rss", "atom"])
+    def test_matches_feedparser(self, document):
+        """测试解析结果与 feedparser 一致"""
+        fast = parse_feed(document)
+        reference = feedparser.parse(document)
+
+        assert fast.version == reference.version
+        assert not fast.bozo
+        assert fast.feed.title == reference.feed.title
+        assert len(fast.entries) == len(reference.entries)
+
+        for fast_entry, reference_entry in zip(fast.entries, reference.entries):
+            for key in ("title", "link", "summary", "id", "author",
+                        "published_parsed", "updated_parsed"):
+                assert fast_entry.get(key) == reference_entry.get(key), key
+
+            assert hasattr(fast_entry, "content") == hasattr(reference_entry, "content")
+            if hasattr(reference_entry, "content"):
+                assert fast_entry.content[0].value == reference_entry.content[0].value
+
+            assert ([tag.term for tag in fast_entry.get("tags", [])] ==
+                    [tag.term for tag in reference_entry.get("tags", [])])
+
+    def test_rss_media_and_description_alias(self):
+        """测试媒体信息和 description 别名"""
+        entry = parse_feed(RSS_FEED).entries[0]
+
+        assert entry.description == "<p>Hello <b>world</b></p>"
+        assert entry.media_content[0].get("url") == "https://example.com/image.jpg"
+
+    @pytest.mark.parametrize("document", [
+        """<rss version="2.0"><channel><title>Feed</title><item>
+        <title>Item</title>
+        <description><![CDATA[<p onclick="steal()">Hi<script>alert(1)</script></p>]]></description>
+        <content:encoded xmlns:content="http://purl.org/rss/1.0/modules/content/"><![CDATA[
+        <a href="javascript:steal()" onmouseover="steal()">link</a><iframe src="https://evil.example/"></iframe>
+        ]]></content:encoded>
+        </item></channel></rss>""",
+        """<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title><entry>
+        <title>Item</title>
+        <summary type="html">&lt;p onclick="steal()"&gt;Hi&lt;script&gt;alert(1)&lt;/script&gt;&lt;/p&gt;</summary>
+        <content type="html">&lt;a href="javascript:steal()" onmouseover="steal()"&gt;link&lt;/a&gt;&lt;iframe src="https://evil.example/"&gt;&lt;/iframe&gt;</content>
+        </entry></feed>""",
+    ], ids=["rss", "atom"])
+    def test_sanitizes_html_like_feedparser(self, document):
+        """测试条目 HTML 与 feedparser 一样移除脚本和事件属性"""
+        entry = parse_feed(document).entries[0]
+        reference = feedparser.parse(document).entries[0]
+
+        assert entry.summary == reference.summary == "<p>Hi</p>"
+        assert entry.content[0].value == reference.content[0].value
+        for value in (entry.summary, entry.content[0].value):
+            assert "<script" not in value
+            assert "javascript:" not in value
+            assert "onclick" not in value and "onmouseover" not in value
+            assert "<iframe" not in value
+
+    def test_without_sanitizer_returns_none(self, monkeypatch):
+        """测试 feedparser 清理器不可用时返回 None 以回退到 feedparser"""
+        from atlas.collectors import feed_parser
+
+        monkeypatch.setattr(feed_parser, "SANITIZER_AVAILABLE", False)
+        assert parse_feed(RSS_FEED) is None
+
+    def test_malformed_feed_sets_bozo(self):
+        """测试格式错误的订阅源仍能恢复解析并标记 bozo"""
+        feed = parse_feed("<rss><channel><title>Broken</title>"
+                          "<item><title>Item</item></channel>")
+
+        assert feed.bozo
+        assert feed.bozo_exception is not None
+        assert len(feed.entries) == 1
+
+    def test_streaming_keeps_channel_metadata(self):
+        """测试流式解析大量条目时保留条目之后的频道信息"""
+        items = "".join(
+            f"<item><title>Item {i}</title><link>https://example.com/{i}</link></item>"
+            for i in range(500)
+        )
+        feed = parse_feed(f"<rss><channel>{items}<title>Late Title</title></channel></rss>")
+
+        assert feed.feed.title == "Late Title"
+        assert len(feed.entries) == 500
+        assert feed.entries[-1].link == "https://example.com/499"
+
+    @pytest.mark.parametrize("document", [
+        "",
+        "not xml at all",
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/>',
+    ])
+    def test_unsupported_returns_none(self, document):
+        """测试无法识别的内容返回 None 以回退到 feedparser"""
+        assert parse_feed(document) is None
@@ -3,7 +3,6 @@
 """
 
 import os
-import tempfile
 import json
 import pytest
 from pathlib import Path
@@ -12,170 +11,134 @@ from unittest.mock import Mock, patch
 from atlas.core.logging import AtlasLogger, init_logger, get_logger, log_execution
 
 
+@pytest.fixture
+def tmp_log_dir(tmp_path):
+    """临时日志目录"""
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def silent_logger(tmp_path_factory):
+    """不输出到任何处理器的共享日志管理器"""
+    return AtlasLogger(
+        log_dir=tmp_path_factory.mktemp("logs"),
+        enable_file=False,
+        enable_console=False
+    )
+
+
 class TestAtlasLogger:
     """Atlas 日志管理器测试"""
 
-    def test_init_basic(self):
+    def test_init_basic(self, tmp_log_dir):
         """测试基本初始化"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                log_level="INFO",
-                enable_file=False,
-                enable_console=False
-            )
-
-            assert logger.log_dir == Path(temp_dir)
-            assert logger.logger is not None
-
-    def test_init_with_file_and_console(self):
-        """测试启用文件和控制台日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                log_level="DEBUG",
-                enable_file=True,
-                enable_console=True
-            )
-
-            # 检查文件是否创建
-            assert (temp_dir / "atlas.log").exists()
-            assert (temp_dir / "errors.log").exists()
-            assert (temp_dir / "structured.log").exists()
-
-    def test_log_levels(self):
-        """测试不同日志级别"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
-
-            # 测试不同级别的日志
-            logger.debug("Debug message")
-            logger.info("Info message")
-            logger.warning("Warning message")
-            logger.error("Error message")
-            logger.critical("Critical message")
-
-    def test_log_with_context(self):
-        """测试带上下文的日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
-
-            logger.info("Test message", user_id="123", action="test")
-            logger.error("Error message", error_code=500, retry_count=3)
-
-    def test_log_request(self):
-        """测试请求日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
+        logger = AtlasLogger(
+            log_dir=tmp_log_dir,
+            log_level="INFO",
+            enable_file=False,
+            enable_console=False
+        )
+
+        assert logger.log_dir == Path(tmp_log_dir)
+        assert logger.logger is not None
+
+    def test_disabled_file_skips_log_dir(self, tmp_log_dir):
+        """测试未启用文件日志时不创建日志目录"""
+        log_dir = tmp_log_dir / "unused"
+        AtlasLogger(log_dir=log_dir, enable_file=False, enable_console=False)
 
+        assert not log_dir.exists()
+
+    def test_init_with_file_and_console(self, tmp_log_dir):
+        """测试启用文件和控制台日志"""
+        logger = AtlasLogger(
+            log_dir=tmp_log_dir,
+            log_level="DEBUG",
+            enable_file=True,
+            enable_console=True
+        )
+
+        # 检查文件是否创建
+        assert (tmp_log_dir / "atlas.log").exists()
+        assert (tmp_log_dir / "errors.log").exists()
+        assert (tmp_log_dir / "structured.log").exists()
+
+    @pytest.mark.parametrize("method,args,kwargs", [
+        ("debug", ("Debug message",), {}),
+        ("info", ("Info message",), {}),
+        ("warning", ("Warning message",), {}),
+        ("error", ("Error message",), {}),
+        ("critical", ("Critical message",), {}),
+        ("info", ("Test message",), {"user_id": "123", "action": "test"}),
+        ("error", ("Error message",), {"error_code": 500, "retry_count": 3}),
+        ("log_request", ("GET", "https://example.com", 200, 1.5), {}),
+        ("log_request", ("POST", "https://api.example.com", 201, 2.3), {}),
+        ("log_task", ("data_collection", "started"), {}),
+        ("log_task", ("data_collection", "completed"), {"duration": 10.5, "items_count": 50}),
+        ("log_task", ("data_collection", "failed"), {"duration": 5.0, "error": "timeout"}),
+        ("log_performance", ("sql_query", 0.1), {"rows_affected": 100}),
+        ("log_performance", ("api_call", 2.5), {"status_code": 200}),
+        ("log_collection", ("test-source", 25, "completed"), {}),
+        ("log_collection", ("test-source", 0, "failed"), {}),
+        ("log_llm_call", ("local", "qwen2.5:7b", 1000, 0.01, 2.1), {}),
+        ("log_llm_call", ("openai", "gpt-4", 1500, 0.05, 5.8), {}),
+    ])
+    def test_log_dispatch(self, silent_logger, method, args, kwargs):
+        """测试各级别日志及专用日志方法"""
+        getattr(silent_logger, method)(*args, **kwargs)
+
+    def test_context_formatted_only_when_emitted(self, tmp_log_dir):
+        """测试无处理器时跳过上下文消息构建"""
+        # 单独构造以移除其他测试留下的处理器
+        logger = AtlasLogger(
+            log_dir=tmp_log_dir,
+            enable_file=False,
+            enable_console=False
+        )
+
+        with patch.object(AtlasLogger, "_format_context") as mock_format:
             logger.log_request("GET", "https://example.com", 200, 1.5)
-            logger.log_request("POST", "https://api.example.com", 201, 2.3)
-
-    def test_log_task(self):
-        """测试任务日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
-
-            logger.log_task("data_collection", "started")
-            logger.log_task("data_collection", "completed", duration=10.5, items_count=50)
-            logger.log_task("data_collection", "failed", duration=5.0, error="timeout")
-
-    def test_log_performance(self):
-        """测试性能日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
-
-            logger.log_performance("sql_query", 0.1, rows_affected=100)
-            logger.log_performance("api_call", 2.5, status_code=200)
-
-    def test_log_collection(self):
-        """测试数据采集日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
-
-            logger.log_collection("test-source", 25, "completed")
-            logger.log_collection("test-source", 0, "failed")
-
-    def test_log_llm_call(self):
-        """测试 LLM 调用日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
-
-            logger.log_llm_call("local", "qwen2.5:7b", 1000, 0.01, 2.1)
-            logger.log_llm_call("openai", "gpt-4", 1500, 0.05, 5.8)
-
-    def test_exception_logging(self):
+            mock_format.assert_not_called()
+
+        messages = []
+        handler_id = logger.logger.add(messages.append, format="{message}")
+        try:
+            logger.info("Message", user_id=1, action="login", exception=True)
+        finally:
+            logger.logger.remove(handler_id)
+        assert messages == ["Message | user_id=1 | action=login\n"]
+
+    def test_exception_logging(self, silent_logger):
         """测试异常日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
-
-            try:
-                raise ValueError("Test exception")
-            except Exception:
-                logger.exception("Exception occurred", context="test")
-
-    @pytest.mark.parametrize("method", ["debug", "info", "warning", "error", "critical"])
-    def test_log_methods(self, method):
-        """测试所有日志方法"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                enable_file=False,
-                enable_console=False
-            )
-
-            getattr(logger, method)("Test message")
+        try:
+            raise ValueError("Test exception")
+        except Exception:
+            silent_logger.exception("Exception occurred", context="test")
 
 
 class TestLoggingFunctions:
     """日志函数测试"""
 
-    def test_init_logger(self):
+    def test_init_logger(self, tmp_log_dir):
         """测试初始化日志系统"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = init_logger(
-                log_dir=temp_dir,
-                log_level="INFO"
-            )
-            assert logger is not None
+        logger = init_logger(
+            log_dir=tmp_log_dir,
+            log_level="INFO"
+        )
+        assert logger is not None
 
     def test_get_logger(self):
         """测试获取日志记录器"""
         logger = get_logger("test_module")
         assert logger is not None
 
+    def test_get_logger_cached_by_name(self):
+        """测试未初始化时同名日志记录器复用绑定结果"""
+        with patch("atlas.core.logging._atlas_logger", None):
+            module_name = "".join(["cached", "_module"])
+            assert get_logger(module_name) is get_logger("cached_module")
+            assert get_logger("cached_module") is not get_logger("other_module")
+
     def test_log_execution_decorator(self):
         """测试日志装饰器"""
         @log_execution("test_function", log_args=True)
@@ -200,87 +163,84 @@ class TestLoggingFunctions:
 class TestLoggingIntegration:
     """日志系统集成测试"""
 
-    def test_file_rotation(self):
+    def test_file_rotation(self, tmp_log_dir):
         """测试文件轮转"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                log_level="INFO",
-                enable_file=True,
-                enable_console=False,
-                rotation="1 MB"  # 小的轮转大小用于测试
-            )
-
-            # 写入大量日志以触发轮转
-            for i in range(1000):
-                logger.info(f"Test log message {i:04d} with enough content to trigger rotation")
-
-            # 检查是否有多个日志文件（轮转后）
-            log_files = list(Path(temp_dir).glob("atlas.log*"))
-            assert len(log_files) >= 1
-
-    def test_structured_logging(self):
+        logger = AtlasLogger(
+            log_dir=tmp_log_dir,
+            log_level="INFO",
+            enable_file=True,
+            enable_console=False,
+            rotation="1 MB"  # 小的轮转大小用于测试
+        )
+
+        # 写入大量日志以触发轮转
+        for i in range(1000):
+            logger.info(f"Test log message {i:04d} with enough content to trigger rotation")
+
+        # 检查是否有多个日志文件（轮转后）
+        log_files = list(Path(tmp_log_dir).glob("atlas.log*"))
+        assert len(log_files) >= 1
+
+    def test_structured_logging(self, tmp_log_dir):
         """测试结构化日志"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                log_level="INFO",
-                enable_file=True,
-                enable_console=False
-            )
-
-            logger.info("Test message", context="test")
-
-            # 检查结构化日志文件
-            structured_file = temp_dir / "structured.log"
-            assert structured_file.exists()
-
-            # 读取并验证结构化日志
-            with open(structured_file, 'r', encoding='utf-8') as f:
-                line = f.readline()
-                assert '"timestamp":' in line
-                assert '"level": "INFO"' in line
-                assert '"message":' in line
-
-    def test_log_level_filtering(self):
+        logger = AtlasLogger(
+            log_dir=tmp_log_dir,
+            log_level="INFO",
+            enable_file=True,
+            enable_console=False
+        )
+
+        logger.info('Test "quoted" message', context="test")
+        logger.logger.complete()
+
+        # 检查结构化日志文件
+        structured_file = tmp_log_dir / "structured.log"
+        assert structured_file.exists()
+
+        # 读取并验证结构化日志
+        with open(structured_file, 'r', encoding='utf-8') as f:
+            record = json.loads(f.readline())
+            assert "timestamp" in record
+            assert record["level"] == "INFO"
+            assert record["message"] == 'Test "quoted" message | context=test'
+
+    def test_log_level_filtering(self, tmp_log_dir):
         """测试日志级别过滤"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # 创建只记录 ERROR 级别的日志器
-            logger = AtlasLogger(
-                log_dir=temp_dir,
-                log_level="ERROR",
-                enable_file=True,
-                enable_console=False
-            )
-
-            logger.debug("Debug message")  # 不应该被记录
-            logger.info("Info message")    # 不应该被记录
-            logger.warning("Warning message")  # 不应该被记录
-            logger.error("Error message")    # 应该被记录
-            logger.critical("Critical message")  # 应该被记录
-
-            # 检查错误日志文件
-            error_file = temp_dir / "errors.log"
-            with open(error_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert "Error message" in content
-                assert "Critical message" in content
-                assert "Debug message" not in content
-                assert "Info message" not in content
-                assert "Warning message" not in content
-
-    def test_multiple_loggers(self):
+        # 创建只记录 ERROR 级别的日志器
+        logger = AtlasLogger(
+            log_dir=tmp_log_dir,
+            log_level="ERROR",
+            enable_file=True,
+            enable_console=False
+        )
+
+        logger.debug("Debug message")  # 不应该被记录
+        logger.info("Info message")    # 不应该被记录
+        logger.warning("Warning message")  # 不应该被记录
+        logger.error("Error message")    # 应该被记录
+        logger.critical("Critical message")  # 应该被记录
+
+        # 检查错误日志文件
+        error_file = tmp_log_dir / "errors.log"
+        with open(error_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+            assert "Error message" in content
+            assert "Critical message" in content
+            assert "Debug message" not in content
+            assert "Info message" not in content
+            assert "Warning message" not in content
+
+    def test_multiple_loggers(self, tmp_log_dir):
         """测试多个日志记录器"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logger1 = get_logger("module1")
-            logger2 = get_logger("module2")
+        logger1 = get_logger("module1")
+        logger2 = get_logger("module2")
 
-            # 两个日志记录器应该是同一个实例
-            assert logger1 is logger2
+        # 两个日志记录器应该是同一个实例
+        assert logger1 is logger2
 
-            # 写入日志
-            logger1.info("Message from module1")
-            logger2.info("Message from module2")
+        # 写入日志
+        logger1.info("Message from module1")
+        logger2.info("Message from module2")
 
-            # 验证日志是否写入
-            assert (temp_dir / "atlas.log").exists()
\ No newline at end of file
+        # 验证日志是否写入
+        assert (tmp_log_dir / "atlas.log").exists()
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+用户验收测试配置
+
+提供本地模拟的 aiohttp 会话，避免验收测试依赖真实网络。
+"""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+import aiohttp
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+FIXTURE_RSS_BYTES = (FIXTURES_DIR / "bbc_rss.xml").read_bytes()
+
+# 返回示例订阅源内容的域名
+FEED_HOSTS = {"feeds.bbci.co.uk", "rss.cnn.com", "feeds.reuters.com"}
+
+
+class _MockResponse:
+    """模拟的 aiohttp 响应"""
+
+    def __init__(self, url, status, body=b"", headers=None):
+        self.url = url
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    def get_encoding(self):
+        return "utf-8"
+
+
+class _MockSession:
+    """本地模拟 aiohttp 会话：订阅源域名返回示例 RSS，httpbin.org 返回 404，其他域名连接失败"""
+
+    closed = False
+
+    @asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        host = urlparse(url).hostname
+        if host in FEED_HOSTS:
+            yield _MockResponse(
+                url, 200, FIXTURE_RSS_BYTES,
+                {"Content-Type": "application/rss+xml; charset=utf-8"}
+            )
+        elif host == "httpbin.org":
+            yield _MockResponse(url, 404)
+        else:
+            raise aiohttp.ClientConnectionError("模拟的域名解析失败")
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(scope="session")
+def mock_feed_session():
+    """注入采集器的模拟 aiohttp 会话（不持有连接，可在整个测试会话中共享）"""
+    return _MockSession()
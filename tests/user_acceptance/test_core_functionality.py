@@ -5,12 +5,11 @@
 """
 
 import pytest
-import asyncio
 import tempfile
 from pathlib import Path
 from uuid import uuid4
 
-from atlas.core.config import get_config
+from atlas.core.config import CollectionConfig, get_config
 from atlas.core.database import AtlasDatabase
 from atlas.core.storage import FileStorageManager
 from atlas.collectors.rss_collector import RSSCollector
@@ -45,9 +44,8 @@ class TestCoreFunctionality:
             }
 
     @pytest.fixture
-    def components(self, test_environment):
+    async def components(self, test_environment, mock_feed_session):
         """初始化核心组件"""
-        config = test_environment["config"]
         data_dir = test_environment["data_dir"]
 
         # 数据库管理器
@@ -57,10 +55,11 @@ class TestCoreFunctionality:
         storage_manager = FileStorageManager(data_dir)
 
         # RSS采集器
+        # 使用本地模拟会话替代真实网络请求；缩短 HTTP 客户端的请求间隔
         rss_collector = RSSCollector(
-            user_agent=config.collection.default_user_agent,
-            timeout=30,
-            max_concurrent=2
+            CollectionConfig.from_env(rate_limit_delay=1),
+            use_rate_limiter=False,
+            session=mock_feed_session
         )
 
         # HTML解析器
@@ -78,9 +77,12 @@ class TestCoreFunctionality:
         }
 
         # 清理资源
+        await rss_collector.aclose()
+        storage_manager.close()
         db_manager.close()
 
-    def test_requirement_01_data_collection(self, components):
+    @pytest.mark.asyncio
+    async def test_requirement_01_data_collection(self, components):
         """验收要求1: 数据采集功能正常工作"""
         print("🧪 验收测试 1: 数据采集功能")
 
@@ -91,33 +93,27 @@ class TestCoreFunctionality:
 
         async def collect_test():
             try:
-                result = await rss_collector.collect_rss(test_rss_url)
+                result = await rss_collector.collect_async({"name": "bbc_news", "url": test_rss_url})
 
                 # 验证采集结果
                 assert result is not None, "RSS采集应该返回结果"
-                assert len(result.items) > 0, "应该采集到至少一个RSS条目"
+                assert len(result) > 0, "应该采集到至少一个RSS条目"
 
                 # 验证条目结构
-                first_item = result.items[0]
-                assert hasattr(first_item, 'title'), "RSS条目应该包含标题"
-                assert hasattr(first_item, 'link'), "RSS条目应该包含链接"
-                assert first_item.title.strip(), "标题不能为空"
+                first_item = result[0]
+                assert "title" in first_item, "RSS条目应该包含标题"
+                assert "link" in first_item, "RSS条目应该包含链接"
+                assert first_item["title"].strip(), "标题不能为空"
 
-                print(f"✅ 成功采集 {len(result.items)} 个RSS条目")
+                print(f"✅ 成功采集 {len(result)} 个RSS条目")
                 return True
 
             except Exception as e:
                 print(f"❌ RSS采集失败: {e}")
                 return False
 
-        # 运行异步测试
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            success = loop.run_until_complete(collect_test())
-            assert success, "RSS采集功能应该正常工作"
-        finally:
-            loop.close()
+        success = await collect_test()
+        assert success, "RSS采集功能应该正常工作"
 
     def test_requirement_02_data_processing(self, components):
         """验收要求2: 数据处理功能正常工作"""
@@ -148,20 +144,16 @@ class TestCoreFunctionality:
 
         try:
             # 测试HTML解析
-            parsed_data = html_parser.parse_html_content(
-                test_html,
-                url="https://example.com/test",
-                title_selector="h1",
-                content_selector="p, .content p"
-            )
+            parsed_data = html_parser.parse(test_html, base_url="https://example.com/test")
 
             assert parsed_data is not None, "HTML解析应该返回结果"
-            assert parsed_data.title == "主标题", "应该正确解析标题"
+            # 过短的 h1 不作为标题，回退到 <title>
+            assert parsed_data.title == "测试页面", "应该正确解析标题"
             assert "第一段内容" in parsed_data.content, "应该正确提取内容"
-            assert parsed_data.description == "这是一个测试页面", "应该正确提取描述"
+            assert parsed_data.summary == "这是一个测试页面", "应该正确提取描述"
 
             # 测试文本标准化
-            normalized_text = text_normalizer.normalize_text(parsed_data.content)
+            normalized_text = text_normalizer.normalize(parsed_data.content)
 
             assert normalized_text is not None, "文本标准化应该返回结果"
             assert len(normalized_text.strip()) > 0, "标准化后的文本不能为空"
@@ -173,7 +165,8 @@ class TestCoreFunctionality:
             print(f"❌ 数据处理失败: {e}")
             pytest.fail("数据处理功能应该正常工作")
 
-    def test_requirement_03_data_storage(self, components):
+    @pytest.mark.asyncio
+    async def test_requirement_03_data_storage(self, components):
         """验收要求3: 数据存储功能正常工作"""
         print("🧪 验收测试 3: 数据存储功能")
 
@@ -228,14 +221,8 @@ class TestCoreFunctionality:
                 print(f"❌ 数据存储失败: {e}")
                 return False
 
-        # 运行异步测试
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            success = loop.run_until_complete(storage_test())
-            assert success, "数据存储功能应该正常工作"
-        finally:
-            loop.close()
+        success = await storage_test()
+        assert success, "数据存储功能应该正常工作"
 
     def test_requirement_04_system_integration(self, components):
         """验收要求4: 系统集成功能正常工作"""
@@ -266,7 +253,8 @@ class TestCoreFunctionality:
             print(f"❌ 系统集成失败: {e}")
             pytest.fail("系统集成功能应该正常工作")
 
-    def test_requirement_05_error_handling(self, components):
+    @pytest.mark.asyncio
+    async def test_requirement_05_error_handling(self, components):
         """验收要求5: 错误处理功能正常工作"""
         print("🧪 验收测试 5: 错误处理功能")
 
@@ -281,12 +269,12 @@ class TestCoreFunctionality:
                     "not-a-valid-url"
                 ]
 
+                # 采集失败时返回空列表，而不是向调用方抛出异常
                 handled_errors = 0
                 for url in invalid_urls:
-                    try:
-                        await rss_collector.collect_rss(url)
+                    if await rss_collector.collect_async({"name": "invalid", "url": url}):
                         print(f"⚠️ 意外成功: {url}")
-                    except Exception:
+                    else:
                         handled_errors += 1
                         print(f"✅ 正确处理错误: {url}")
 
@@ -298,14 +286,8 @@ class TestCoreFunctionality:
                 print(f"❌ 错误处理测试失败: {e}")
                 return False
 
-        # 运行异步测试
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            success = loop.run_until_complete(error_handling_test())
-            assert success, "错误处理功能应该正常工作"
-        finally:
-            loop.close()
+        success = await error_handling_test()
+        assert success, "错误处理功能应该正常工作"
 
 
 if __name__ == "__main__":
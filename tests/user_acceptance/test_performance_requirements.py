@@ -4,25 +4,45 @@
 验证Atlas系统的性能是否满足用户需求。
 """
 
+import os
 import pytest
 import asyncio
 import tempfile
 import time
+from dataclasses import replace
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 
 from atlas.core.config import get_config
 from atlas.collectors.rss_collector import RSSCollector
-from atlas.processors.parser import HTMLParser
-from atlas.processors.normalizer import TextNormalizer
+from atlas.processors.parser import HTMLParser, get_html_parser
+from atlas.processors.normalizer import TextNormalizer, get_text_normalizer
+
+
+# 冒烟模式（ATLAS_PERF_FAST=1）下所有测试规模统一缩减为该值
+PERF_FAST_COUNT = 10
+
+
+def _perf_count(env_name: str, default: int) -> int:
+    """读取性能测试规模，CI 可通过环境变量缩减而无需改动代码"""
+    if os.getenv("ATLAS_PERF_FAST") == "1":
+        return PERF_FAST_COUNT
+    return int(os.getenv(env_name, default))
+
+
+# 各性能测试的规模
+PERF_HTML_DOCS = _perf_count("ATLAS_PERF_HTML_DOCS", 50)
+PERF_MEMORY_COMPONENTS = _perf_count("ATLAS_PERF_MEMORY_COMPONENTS", 20)
+PERF_CONCURRENT_DOCS = _perf_count("ATLAS_PERF_CONCURRENT_DOCS", 100)
+PERF_STABILITY_ITERATIONS = _perf_count("ATLAS_PERF_STABILITY_ITERATIONS", 30)
 
 
 class TestPerformanceRequirements:
     """性能要求验收测试"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_environment(self):
-        """创建性能测试环境"""
+        """创建性能测试环境（各性能测试不修改配置，整个测试类共享）"""
         with tempfile.TemporaryDirectory() as temp_dir:
             config_dir = Path(temp_dir) / "config"
             data_dir = Path(temp_dir) / "data"
@@ -40,16 +60,28 @@ class TestPerformanceRequirements:
                 "data_dir": data_dir
             }
 
-    def test_perf_01_rss_collection_speed(self, test_environment):
+    @pytest.fixture(scope="class")
+    async def rss_collector(self, test_environment, mock_feed_session):
+        """共享的 RSS 采集器，所有采集请求复用同一个（本地模拟的）HTTP 会话"""
+        collection_config = replace(
+            test_environment["config"].collection,
+            request_timeout=30,
+            max_concurrent_requests=5,
+            rate_limit_delay=1
+        )
+        # 性能测试衡量采集吞吐量，不启用自适应频率限制
+        collector = RSSCollector(collection_config, use_rate_limiter=False, session=mock_feed_session)
+        collector.set_user_agent("Atlas/1.0 (Performance Test)")
+
+        yield collector
+
+        await collector.aclose()
+
+    @pytest.mark.asyncio
+    async def test_perf_01_rss_collection_speed(self, test_environment, rss_collector):
         """性能测试1: RSS采集速度要求"""
         print("🚀 性能测试 1: RSS采集速度")
 
-        rss_collector = RSSCollector(
-            user_agent="Atlas/1.0 (Performance Test)",
-            timeout=30,
-            max_concurrent=5
-        )
-
         # 使用多个RSS源进行并发测试
         rss_urls = [
             "https://feeds.bbci.co.uk/news/rss.xml",
@@ -58,17 +90,17 @@ class TestPerformanceRequirements:
         ]
 
         async def concurrent_collection():
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
-            tasks = [rss_collector.collect_rss(url) for url in rss_urls]
+            tasks = [rss_collector.collect_async({"name": f"perf_source_{i}", "url": url})
+                     for i, url in enumerate(rss_urls)]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            end_time = time.time()
-            total_time = end_time - start_time
+            total_time = (time.perf_counter_ns() - start_ns) / 1e9
 
-            successful_results = [r for r in results if not isinstance(r, Exception)]
-            total_items = sum(len(result.items) if hasattr(result, 'items') else 0
-                             for result in successful_results)
+            # 采集失败时返回空列表
+            successful_results = [r for r in results if isinstance(r, list) and r]
+            total_items = sum(len(result) for result in successful_results)
 
             # 性能要求: 每个RSS源采集时间不应超过30秒
             avg_time_per_source = total_time / len(rss_urls)
@@ -87,12 +119,7 @@ class TestPerformanceRequirements:
             print(f"   - 成功率: {len(successful_results)}/{len(rss_urls)}")
             print(f"   - 总条目: {total_items}")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(concurrent_collection())
-        finally:
-            loop.close()
+        await concurrent_collection()
 
     def test_perf_02_html_processing_speed(self, test_environment):
         """性能测试2: HTML处理速度要求"""
@@ -106,13 +133,13 @@ class TestPerformanceRequirements:
         <!DOCTYPE html>
         <html>
         <head>
-            <title>性能测试页面</title>
+            <title>性能测试页面 {index}</title>
             <meta name="description" content="这是一个用于性能测试的页面">
         </head>
         <body>
             <h1>主标题</h1>
             <div class="article">
-                <p>段落1: Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>
+                <p>段落1 (文档{index}): Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>
                 <p>段落2: Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.</p>
                 <p>段落3: Ut enim ad minim veniam, quis nostrud exercitation ullamco.</p>
             </div>
@@ -124,30 +151,27 @@ class TestPerformanceRequirements:
         </html>
         """
 
+        # 每次迭代使用不同的文档，避免测到解析结果缓存的命中
+        documents = [test_html.format(index=i) for i in range(PERF_HTML_DOCS)]
+
         # 性能要求: 单个HTML文档处理时间不应超过1秒
-        num_documents = 50
-        start_time = time.time()
+        num_documents = PERF_HTML_DOCS
+        start_ns = time.perf_counter_ns()
 
         for i in range(num_documents):
             try:
-                parsed = html_parser.parse_html_content(
-                    test_html,
-                    url=f"https://example.com/test-{i}",
-                    title_selector="h1",
-                    content_selector=".article p"
-                )
+                parsed = html_parser.parse(documents[i], base_url=f"https://example.com/test-{i}")
 
-                normalized = text_normalizer.normalize_text(parsed.content)
+                normalized = text_normalizer.normalize(parsed.content)
 
-                # 验证处理结果
-                assert parsed.title == "主标题", f"文档{i}: 标题解析错误"
+                # 验证处理结果（过短的 h1 不作为标题，回退到 <title>）
+                assert parsed.title == f"性能测试页面 {i}", f"文档{i}: 标题解析错误"
                 assert len(normalized.strip()) > 0, f"文档{i}: 标准化后内容为空"
 
             except Exception as e:
                 pytest.fail(f"文档{i}处理失败: {e}")
 
-        end_time = time.time()
-        total_time = end_time - start_time
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
         avg_time_per_doc = total_time / num_documents
 
         # 性能验证
@@ -164,40 +188,49 @@ class TestPerformanceRequirements:
         """性能测试3: 内存使用要求"""
         print("🚀 性能测试 3: 内存使用")
 
-        import psutil
-        import os
+        import tracemalloc
 
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-
-        # 创建多个组件实例测试内存使用
-        components = []
-        for i in range(20):
-            rss_collector = RSSCollector(
-                user_agent=f"Atlas/{i}.0 (Memory Test)",
-                timeout=10,
-                max_concurrent=2
-            )
-            html_parser = HTMLParser()
-            text_normalizer = TextNormalizer()
-
-            components.append({
-                'rss': rss_collector,
-                'parser': html_parser,
-                'normalizer': text_normalizer
-            })
-
-        peak_memory = process.memory_info().rss / 1024 / 1024  # MB
-        memory_increase = peak_memory - initial_memory
-
-        # 性能要求: 内存增长不应超过100MB
-        assert memory_increase <= 100.0, f"内存使用过多: {memory_increase:.2f}MB"
-
-        # 清理组件
-        del components
-
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
-        memory_recovered = peak_memory - final_memory
+        # 通过 tracemalloc 统计 Python 层分配，排除页缓存和线程栈等进程级噪声
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            initial_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024  # MB
+
+            # 创建多个组件实例测试内存使用
+            components = []
+            for i in range(PERF_MEMORY_COMPONENTS):
+                rss_collector = RSSCollector(replace(
+                    test_environment["config"].collection,
+                    default_user_agent=f"Atlas/{i}.0 (Memory Test)",
+                    request_timeout=10,
+                    max_concurrent_requests=2
+                ))
+                # 无状态处理器在组件间共享同一实例
+                html_parser = get_html_parser()
+                text_normalizer = get_text_normalizer()
+
+                components.append({
+                    'rss': rss_collector,
+                    'parser': html_parser,
+                    'normalizer': text_normalizer
+                })
+
+            peak_memory = tracemalloc.get_traced_memory()[1] / 1024 / 1024  # MB
+            memory_increase = peak_memory - initial_memory
+
+            # 性能要求: 内存增长不应超过100MB
+            assert memory_increase <= 100.0, f"内存使用过多: {memory_increase:.2f}MB"
+
+            # 清理组件
+            del components
+
+            final_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024  # MB
+            memory_recovered = peak_memory - final_memory
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
 
         print(f"✅ 内存使用性能达标:")
         print(f"   - 初始内存: {initial_memory:.2f}MB")
@@ -205,7 +238,8 @@ class TestPerformanceRequirements:
         print(f"   - 内存增长: {memory_increase:.2f}MB")
         print(f"   - 内存回收: {memory_recovered:.2f}MB")
 
-    def test_perf_04_concurrent_processing(self, test_environment):
+    @pytest.mark.asyncio
+    async def test_perf_04_concurrent_processing(self, test_environment):
         """性能测试4: 并发处理能力"""
         print("🚀 性能测试 4: 并发处理能力")
 
@@ -224,14 +258,9 @@ class TestPerformanceRequirements:
         async def process_document(doc_id):
             """处理单个文档的异步函数"""
             try:
-                parsed = html_parser.parse_html_content(
-                    test_html,
-                    url=f"https://example.com/concurrent-{doc_id}",
-                    title_selector="h1",
-                    content_selector="p"
-                )
+                parsed = html_parser.parse(test_html, base_url=f"https://example.com/concurrent-{doc_id}")
 
-                normalized = text_normalizer.normalize_text(parsed.content)
+                normalized = text_normalizer.normalize(parsed.content)
 
                 return {
                     'doc_id': doc_id,
@@ -247,13 +276,13 @@ class TestPerformanceRequirements:
                 }
 
         async def concurrent_test():
-            num_documents = 100
+            num_documents = PERF_CONCURRENT_DOCS
             concurrency_levels = [5, 10, 20]
 
             for concurrency in concurrency_levels:
                 print(f"   测试并发级别: {concurrency}")
 
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
 
                 # 创建信号量限制并发数
                 semaphore = asyncio.Semaphore(concurrency)
@@ -263,11 +292,11 @@ class TestPerformanceRequirements:
                         return await process_document(doc_id)
 
                 # 执行并发任务
-                tasks = [limited_process(i) for i in range(num_documents)]
-                results = await asyncio.gather(*tasks)
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(limited_process(i)) for i in range(num_documents)]
+                results = [task.result() for task in tasks]
 
-                end_time = time.time()
-                total_time = end_time - start_time
+                total_time = (time.perf_counter_ns() - start_ns) / 1e9
 
                 successful = sum(1 for r in results if r['success'])
                 throughput = successful / total_time
@@ -283,55 +312,45 @@ class TestPerformanceRequirements:
                 print(f"     - 成功: {successful}/{num_documents}")
                 print(f"     - 吞吐量: {throughput:.1f}文档/秒")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(concurrent_test())
-        finally:
-            loop.close()
+        await concurrent_test()
 
         print("✅ 并发处理性能达标")
 
-    def test_perf_05_system_stability(self, test_environment):
+    @pytest.mark.asyncio
+    async def test_perf_05_system_stability(self, test_environment, rss_collector):
         """性能测试5: 系统稳定性"""
         print("🚀 性能测试 5: 系统稳定性")
 
-        rss_collector = RSSCollector(
-            user_agent="Atlas/1.0 (Stability Test)",
-            timeout=15,
-            max_concurrent=3
-        )
-
         html_parser = HTMLParser()
         text_normalizer = TextNormalizer()
 
         async def stability_test():
             # 运行长时间的混合操作
-            num_iterations = 30
+            num_iterations = PERF_STABILITY_ITERATIONS
             errors = 0
             successful_operations = 0
 
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             for iteration in range(num_iterations):
                 try:
                     # 交替执行不同操作
                     if iteration % 3 == 0:
                         # RSS采集操作
-                        result = await rss_collector.collect_rss(
-                            "https://feeds.bbci.co.uk/news/rss.xml"
-                        )
-                        if result and len(result.items) > 0:
+                        result = await rss_collector.collect_async({
+                            "name": "bbc_news",
+                            "url": "https://feeds.bbci.co.uk/news/rss.xml"
+                        })
+                        if result:
                             successful_operations += 1
                         else:
                             errors += 1
 
                     elif iteration % 3 == 1:
                         # HTML处理操作
-                        parsed = html_parser.parse_html_content(
+                        parsed = html_parser.parse(
                             "<html><body><h1>Stability Test</h1></body></html>",
-                            url="https://example.com/stability",
-                            title_selector="h1"
+                            base_url="https://example.com/stability"
                         )
                         if parsed and parsed.title:
                             successful_operations += 1
@@ -340,7 +359,7 @@ class TestPerformanceRequirements:
 
                     else:
                         # 文本标准化操作
-                        normalized = text_normalizer.normalize_text(
+                        normalized = text_normalizer.normalize(
                             "这是一段用于稳定性测试的文本内容。"
                         )
                         if len(normalized.strip()) > 0:
@@ -356,8 +375,7 @@ class TestPerformanceRequirements:
                     errors += 1
                     print(f"   迭代 {iteration} 错误: {e}")
 
-            end_time = time.time()
-            total_time = end_time - start_time
+            total_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             # 稳定性要求: 错误率不应超过10%
             error_rate = errors / num_iterations
@@ -374,12 +392,7 @@ class TestPerformanceRequirements:
             print(f"   - 成功率: {success_rate:.1%}")
             print(f"   - 总时间: {total_time:.2f}秒")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(stability_test())
-        finally:
-            loop.close()
+        await stability_test()
 
 
 if __name__ == "__main__":
@@ -4,58 +4,100 @@
 提供测试中常用的工具函数和辅助类。
 """
 
-import asyncio
+import functools
 import json
+import os
+import shutil
 import tempfile
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Generator, Optional
-from unittest.mock import Mock, patch
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+from unittest.mock import patch
 import sqlite3
 
-import pytest
 import yaml
 from httpx import Response as HttpxResponse
 
+# 优先使用 libyaml 的 C 实现
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # 导入测试配置
 from .test_config import TEST_CONFIG
 
 
 class TempFileManager:
-    """临时文件管理器"""
+    """临时文件管理器
+
+    所有临时文件和目录都分配在同一个父目录下，清理时一次删除整个父目录。
+    """
 
     def __init__(self):
         self.temp_files = []
         self.temp_dirs = []
+        self._root: Optional[Path] = None
+
+    def _get_root(self) -> Path:
+        """获取（按需创建）共享的临时父目录"""
+        if self._root is None:
+            self._root = Path(tempfile.mkdtemp())
+        return self._root
 
     def create_temp_file(self, content: str, suffix: str = ".tmp") -> Path:
         """创建临时文件"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False, encoding='utf-8') as f:
+        with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False, encoding='utf-8',
+                                         dir=self._get_root()) as f:
             f.write(content)
             temp_path = Path(f.name)
             self.temp_files.append(temp_path)
             return temp_path
 
+    def create_temp_files(self, items: Iterable[Tuple[str, str]]) -> List[Path]:
+        """批量创建临时文件
+
+        Args:
+            items: (内容, 后缀) 元组序列
+
+        Returns:
+            按顺序创建的临时文件路径列表
+        """
+        root = self._get_root()
+        paths = []
+        for content, suffix in items:
+            fd, name = tempfile.mkstemp(suffix=suffix, dir=root)
+            try:
+                # 直接写入文件描述符，跳过文件对象的缓冲层
+                data = memoryview(content.encode('utf-8'))
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            paths.append(Path(name))
+
+        self.temp_files.extend(paths)
+        return paths
+
     def create_temp_dir(self) -> Path:
         """创建临时目录"""
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = Path(tempfile.mkdtemp(dir=self._get_root()))
         self.temp_dirs.append(temp_dir)
         return temp_dir
 
     def cleanup(self):
         """清理所有临时文件和目录"""
-        for temp_file in self.temp_files:
-            try:
-                temp_file.unlink()
-            except (FileNotFoundError, PermissionError):
-                pass
-
-        for temp_dir in self.temp_dirs:
-            try:
-                import shutil
-                shutil.rmtree(temp_dir)
-            except (FileNotFoundError, PermissionError):
-                pass
+        if self._root is not None:
+            shutil.rmtree(self._root, ignore_errors=True)
+            self._root = None
 
         self.temp_files.clear()
         self.temp_dirs.clear()
@@ -95,22 +137,6 @@ class MockHttpServer:
         self.request_log.clear()
 
 
-class AsyncTestCase:
-    """异步测试用例基类"""
-
-    @pytest.fixture(autouse=True)
-    def setup_event_loop(self):
-        """设置事件循环"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        yield
-        loop.close()
-
-    async def run_async(self, coro):
-        """运行异步协程"""
-        return await coro
-
-
 def create_sample_config(config_dir: Path, env: str = "test") -> Dict:
     """创建示例配置文件"""
     config_data = {
@@ -140,7 +166,7 @@ def create_sample_config(config_dir: Path, env: str = "test") -> Dict:
 
     config_file = config_dir / "config.yaml"
     with open(config_file, 'w', encoding='utf-8') as f:
-        yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
 
     return config_data
 
@@ -187,7 +213,7 @@ def create_sample_sources(sources_dir: Path) -> Dict:
 
     sources_file = sources_dir / "sources.yaml"
     with open(sources_file, 'w', encoding='utf-8') as f:
-        yaml.dump(sources_data, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(sources_data, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
 
     return sources_data
 
@@ -196,10 +222,10 @@ def create_test_database(db_path: Path) -> sqlite3.Connection:
     """创建测试数据库"""
     conn = sqlite3.connect(str(db_path))
 
-    # 创建表结构
-    with open("src/atlas/core/database.py", 'r', encoding='utf-8') as f:
-        # 这里应该从数据库模块获取表结构定义
-        pass
+    # 测试数据库无需持久化保证：关闭日志和同步写盘
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
 
     # 插入测试数据
     test_data = [
@@ -208,52 +234,78 @@ def create_test_database(db_path: Path) -> sqlite3.Connection:
         (3, "Test Document 3", "Test content 3", "blog", "2024-01-03 12:00:00"),
     ]
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS documents (
-            id INTEGER PRIMARY KEY,
-            title TEXT NOT NULL,
-            content TEXT,
-            category TEXT,
-            created_at TIMESTAMP
+    # 使用连接上下文管理器，退出时统一提交
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                content TEXT,
+                category TEXT,
+                created_at TIMESTAMP
+            )
+        """)
+
+        conn.executemany(
+            "INSERT INTO documents (id, title, content, category, created_at) VALUES (?, ?, ?, ?, ?)",
+            test_data
         )
-    """)
 
-    conn.executemany(
-        "INSERT INTO documents (id, title, content, category, created_at) VALUES (?, ?, ?, ?, ?)",
-        test_data
-    )
-
-    conn.commit()
     return conn
 
 
+# 文档必需字段
+_REQUIRED_DOCUMENT_FIELDS = frozenset(('title', 'content', 'source', 'created_at'))
+
+
 def assert_valid_document(document: Dict) -> None:
     """验证文档结构的有效性"""
-    required_fields = ['title', 'content', 'source', 'created_at']
+    missing = _REQUIRED_DOCUMENT_FIELDS - document.keys()
+    assert not missing, f"Missing required field: {', '.join(sorted(missing))}"
 
-    for field in required_fields:
-        assert field in document, f"Missing required field: {field}"
+    for field in _REQUIRED_DOCUMENT_FIELDS:
         assert document[field] is not None, f"Field {field} cannot be None"
 
-    if 'title' in document:
-        assert isinstance(document['title'], str), "Title must be a string"
-        assert len(document['title'].strip()) > 0, "Title cannot be empty"
+    title = document['title']
+    assert isinstance(title, str), "Title must be a string"
+    assert title.strip(), "Title cannot be empty"
+
+    content = document['content']
+    assert isinstance(content, str), "Content must be a string"
+    assert content.strip(), "Content cannot be empty"
+
+
+def _json_loads(content: str) -> Any:
+    """解析 JSON，优先使用 orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
-    if 'content' in document:
-        assert isinstance(document['content'], str), "Content must be a string"
-        assert len(document['content'].strip()) > 0, "Content cannot be empty"
+@dataclass(slots=True, frozen=True)
+class MockResponse:
+    """轻量的模拟 HTTP 响应"""
+    status_code: int
+    text: str
+    content: bytes
+    headers: Dict[str, str]
+
+    def json(self) -> Any:
+        """解析 JSON 响应体，非 JSON 对象内容返回空字典"""
+        if self.text and self.text.startswith('{'):
+            return _json_loads(self.text)
+        return {}
 
 
 def create_mock_response(status_code: int = 200, content: str = "",
-                        headers: Optional[Dict] = None) -> Mock:
+                        headers: Optional[Dict] = None) -> MockResponse:
     """创建模拟 HTTP 响应"""
-    response = Mock()
-    response.status_code = status_code
-    response.text = content
-    response.content = content.encode('utf-8')
-    response.headers = headers or {}
-    response.json.return_value = json.loads(content) if content and content.startswith('{') else {}
-    return response
+    return MockResponse(
+        status_code=status_code,
+        text=content,
+        content=content.encode('utf-8'),
+        headers=headers or {}
+    )
 
 
 def create_mock_httpx_response(status_code: int = 200, content: str = "",
@@ -270,23 +322,26 @@ class PerformanceTimer:
     """性能计时器"""
 
     def __init__(self):
-        self.start_time = None
-        self.end_time = None
+        # 以整数纳秒记录时间点
+        self._start_ns: Optional[int] = None
+        self._end_ns: Optional[int] = None
 
     def start(self):
         """开始计时"""
-        self.start_time = time.perf_counter()
+        self._start_ns = time.perf_counter_ns()
+        self._end_ns = None
 
     def stop(self) -> float:
         """停止计时并返回耗时"""
-        self.end_time = time.perf_counter()
+        self._end_ns = time.perf_counter_ns()
         return self.elapsed()
 
     def elapsed(self) -> float:
-        """获取耗时"""
-        if self.start_time is None:
+        """获取耗时（秒），已停止时直接使用记录的结束时间"""
+        if self._start_ns is None:
             return 0.0
-        return (self.end_time or time.perf_counter()) - self.start_time
+        end_ns = self._end_ns if self._end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self._start_ns) / 1e9
 
     def __enter__(self):
         self.start()
@@ -305,18 +360,20 @@ def assert_performance(func, max_time: float):
     return result
 
 
+@functools.cache
 def skip_if_no_network():
-    """如果没有网络连接则跳过测试"""
+    """如果没有网络连接则跳过测试（结果在整个测试会话内缓存）"""
     try:
         import socket
-        socket.create_connection(("8.8.8.8", 53), timeout=3)
-        return False
+        with socket.create_connection(("8.8.8.8", 53), timeout=1):
+            return False
     except (socket.timeout, socket.error):
         return True
 
 
+@functools.cache
 def skip_if_no_docker():
-    """如果没有 Docker 则跳过测试"""
+    """如果没有 Docker 则跳过测试（结果在整个测试会话内缓存）"""
     try:
         import subprocess
         result = subprocess.run(['docker', '--version'],
@@ -329,9 +386,13 @@ def skip_if_no_docker():
 class TestDataGenerator:
     """测试数据生成器"""
 
+    # 所有测试文档共用的标签
+    DOCUMENT_TAGS = ('tag-1', 'tag-2', 'tag-3')
+
     @staticmethod
     def generate_documents(count: int = 10) -> Generator[Dict, None, None]:
         """生成测试文档"""
+        tags = TestDataGenerator.DOCUMENT_TAGS
         for i in range(count):
             yield {
                 'id': i + 1,
@@ -339,7 +400,7 @@ class TestDataGenerator:
                 'content': f'This is the content of test document {i + 1}',
                 'source': f'test-source-{i + 1}',
                 'category': 'test',
-                'tags': [f'tag-{j}' for j in range(1, 4)],
+                'tags': list(tags),
                 'created_at': f'2024-01-0{(i % 9) + 1} 12:{(i % 60):02d}:00'
             }
 
@@ -347,16 +408,14 @@ class TestDataGenerator:
     def generate_rss_feed(count: int = 5) -> str:
         """生成 RSS 订阅内容"""
         base_url = TEST_CONFIG.get_full_url("example", "/")
-        items = []
-        for i in range(count):
-            items.append(f"""
+        items = [f"""
             <item>
-              <title>Test Article {i + 1}</title>
-              <description>This is test article {i + 1} description</description>
-              <link>{base_url}article{i + 1}</link>
-              <pubDate>Mon, 0{i + 1} Jan 2024 12:00:00 GMT</pubDate>
-              <guid>{base_url}article{i + 1}</guid>
-            </item>""")
+              <title>Test Article {n}</title>
+              <description>This is test article {n} description</description>
+              <link>{base_url}article{n}</link>
+              <pubDate>Mon, 0{n} Jan 2024 12:00:00 GMT</pubDate>
+              <guid>{base_url}article{n}</guid>
+            </item>""" for n in range(1, count + 1)]
 
         return f"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">